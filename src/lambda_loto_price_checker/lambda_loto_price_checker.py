@@ -4,6 +4,7 @@ import json
 import os
 import time
 from bs4 import BeautifulSoup
+from bs4.dammit import EncodingDetector, UnicodeDammit
 
 def lambda_handler(event, context):
     # Check if this is a test invocation
@@ -66,6 +67,22 @@ def lambda_handler(event, context):
             })
         }
 
+def make_soup(response):
+    """Parses a response, decoding it only once: the encodings from its BOM, Content-Type header and <meta>
+    tag are tried in that order, and the encoding is only detected when none of them works"""
+    dammit = UnicodeDammit(
+        response.content,
+        known_definite_encodings=EncodingDetector.known_encodings(
+            response.content, response.headers.get('Content-Type')
+        ),
+        is_html=True,
+    )
+    # So that response.text doesn't detect the encoding again
+    response.encoding = dammit.original_encoding
+    soup = BeautifulSoup(dammit.unicode_markup, 'html.parser')
+    soup.original_encoding = dammit.original_encoding
+    return soup
+
 def get_mega_millions_data():
     """Scrapes Mega Millions jackpot data from their website"""
     url = "https://www.megamillions.com/"
@@ -74,7 +91,7 @@ def get_mega_millions_data():
         response = requests.get(url)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(response)
         
         # Extract jackpot amount (this selector might need adjusting based on website structure)
         jackpot_text = soup.select_one('.jackpot-amount').text.strip()
@@ -108,7 +125,7 @@ def get_powerball_data():
         response = requests.get(url)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(response)
         
         # Extract jackpot amount (this selector might need adjusting based on website structure)
         jackpot_text = soup.select_one('.current-jackpot').text.strip()
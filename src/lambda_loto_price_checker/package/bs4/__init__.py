@@ -66,7 +66,10 @@ from .builder import (
     TreeBuilder,
 )
 from .builder._htmlparser import HTMLParserTreeBuilder
-from .dammit import UnicodeDammit
+from .dammit import (
+    IncrementalUnicodeDammit,
+    UnicodeDammit,
+)
 from .css import CSS
 from ._deprecation import (
     _deprecated,
@@ -206,6 +209,15 @@ class BeautifulSoup(Tag):
     #: could not be represented in Unicode.
     contains_replacement_characters: bool
 
+    # These members are only used while a document is being fed in
+    # with BeautifulSoup.feed().
+    _incremental: bool = False  #: :meta private:
+    _incremental_type: Optional[type]  #: :meta private:
+    _incremental_chunks: List[_RawMarkup]  #: :meta private:
+    _incremental_dammit: Optional[IncrementalUnicodeDammit]  #: :meta private:
+    _from_encoding: Optional[_Encoding]  #: :meta private:
+    _exclude_encodings: Optional[_Encodings]  #: :meta private:
+
     def __init__(
         self,
         markup: _IncomingMarkup = "",
@@ -456,7 +468,24 @@ class BeautifulSoup(Tag):
         # At this point we know markup is a string or bytestring.  If
         # it was a file-type object, we've read from it.
         markup = cast(_RawMarkup, markup)
+        self._parse(markup, from_encoding, exclude_encodings)
 
+        # Clear out the markup and remove the builder's circular
+        # reference to this object.
+        self.markup = None
+        self.builder.soup = None
+
+    def _parse(
+        self,
+        markup: _RawMarkup,
+        from_encoding: Optional[_Encoding],
+        exclude_encodings: Optional[_Encodings],
+    ) -> None:
+        """Try each of the tree builder's strategies for parsing the
+        markup, until one of them works.
+
+        :raise ParserRejectedMarkup: If none of the strategies worked.
+        """
         rejections = []
         success = False
         for (
@@ -484,8 +513,138 @@ class BeautifulSoup(Tag):
                 + "\n ".join(other_exceptions)
             )
 
-        # Clear out the markup and remove the builder's circular
-        # reference to this object.
+    @classmethod
+    def incremental(
+        cls,
+        features: Optional[Union[str, Sequence[str]]] = None,
+        builder: Optional[Union[TreeBuilder, Type[TreeBuilder]]] = None,
+        parse_only: Optional[SoupStrainer] = None,
+        from_encoding: Optional[_Encoding] = None,
+        exclude_encodings: Optional[_Encodings] = None,
+        element_classes: Optional[Dict[Type[PageElement], Type[PageElement]]] = None,
+        **kwargs: Any,
+    ) -> "BeautifulSoup":
+        """Create a `BeautifulSoup` object that will be given its markup
+        a chunk at a time, rather than all at once.
+
+        Pass each chunk into `BeautifulSoup.feed` as it becomes
+        available, then call `BeautifulSoup.close` once the document
+        is complete::
+
+         soup = BeautifulSoup.incremental("html.parser")
+         for chunk in response.iter_content(8192):
+             soup.feed(chunk)
+         soup.close()
+
+        If the tree builder supports it (html.parser does), each
+        chunk is converted to Unicode and parsed as soon as it arrives,
+        so parsing can overlap with reading the document and the
+        original bytestring is never held in memory all at once. Other
+        tree builders collect the chunks and parse the document when
+        `BeautifulSoup.close` is called.
+
+        The arguments have the same meaning as they do for the
+        `BeautifulSoup` constructor.
+        """
+        soup = cls("", features, builder, parse_only, None, None, element_classes, **kwargs)
+        soup.reset()
+        soup.builder.initialize_soup(soup)
+        soup._incremental = True
+        soup._incremental_type = None
+        soup._incremental_chunks = []
+        soup._incremental_dammit = None
+        soup._from_encoding = from_encoding
+        soup._exclude_encodings = exclude_encodings
+        return soup
+
+    def feed(self, markup: _RawMarkup) -> None:
+        """Parse the next chunk of a document.
+
+        :param markup: A string or bytestring. Every chunk of a given
+            document must be the same type.
+        :raise ValueError: If this object wasn't created with
+            `BeautifulSoup.incremental`, or has already been closed.
+        """
+        if not self._incremental:
+            raise ValueError(
+                "feed() can only be called on a BeautifulSoup object created with BeautifulSoup.incremental(), before it's closed."
+            )
+        if self._incremental_type is None:
+            self._incremental_type = type(markup)
+        elif not isinstance(markup, self._incremental_type):
+            raise TypeError(
+                "Every chunk of a document must be of the same type; got %s after %s."
+                % (type(markup).__name__, self._incremental_type.__name__)
+            )
+
+        if not self.builder.SUPPORTS_INCREMENTAL:
+            self._incremental_chunks.append(markup)
+            return
+
+        if isinstance(markup, bytes):
+            if self._incremental_dammit is None:
+                self._incremental_dammit = IncrementalUnicodeDammit(
+                    known_definite_encodings=(
+                        [self._from_encoding] if self._from_encoding else []
+                    ),
+                    is_html=not self.is_xml,
+                    exclude_encodings=self._exclude_encodings,
+                )
+            data = self._incremental_dammit.decode(markup)
+            # Character references are interpreted in light of the
+            # original encoding, so this needs to be set before
+            # the parser sees any markup.
+            self.original_encoding = self._incremental_dammit.original_encoding
+        else:
+            data = markup
+        if data:
+            # Any tag that's still open might be about to get more
+            # content.
+            self._invalidate_open_tags()
+            self.builder.feed_incremental(data)
+
+    def _invalidate_open_tags(self) -> None:
+        """Wipe out cached text for tags that the parser hasn't closed yet."""
+        if self.currentTag is not None:
+            self.currentTag._invalidate_text_cache()
+
+    def close(self) -> None:
+        """Finish parsing a document that was fed in with
+        `BeautifulSoup.feed`, closing any tags that are still open.
+
+        :raise ValueError: If this object wasn't created with
+            `BeautifulSoup.incremental`, or has already been closed.
+        """
+        if not self._incremental:
+            raise ValueError(
+                "close() can only be called on a BeautifulSoup object created with BeautifulSoup.incremental(), before it's closed."
+            )
+        self._incremental = False
+        self._invalidate_open_tags()
+
+        if not self.builder.SUPPORTS_INCREMENTAL:
+            markup: _RawMarkup
+            if self._incremental_type is bytes:
+                markup = b"".join(cast(List[bytes], self._incremental_chunks))
+            else:
+                markup = "".join(cast(List[str], self._incremental_chunks))
+            self._incremental_chunks = []
+            self._parse(markup, self._from_encoding, self._exclude_encodings)
+        else:
+            dammit = self._incremental_dammit
+            if dammit is not None:
+                data = dammit.decode(b"", final=True)
+                self.original_encoding = dammit.original_encoding
+                if data:
+                    self.builder.feed_incremental(data)
+                self.declared_html_encoding = dammit.declared_html_encoding
+                self.contains_replacement_characters = (
+                    dammit.contains_replacement_characters
+                )
+            self.builder.close_incremental()
+            self._end_document()
+
+        self._incremental_dammit = None
         self.markup = None
         self.builder.soup = None
 
@@ -516,6 +675,9 @@ class BeautifulSoup(Tag):
         # don't need it.
         if "_most_recent_element" in d:
             del d["_most_recent_element"]
+
+        # Cached text will be recreated as necessary.
+        d.pop("_text_cache", None)
         return d
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
@@ -656,7 +818,10 @@ class BeautifulSoup(Tag):
 
         if self.markup is not None:
             self.builder.feed(self.markup)
-        # Close out any unfinished strings and close all the open tags.
+        self._end_document()
+
+    def _end_document(self) -> None:
+        """Close out any unfinished strings and close all the open tags."""
         self.endData()
         while (
             self.currentTag is not None and self.currentTag.name != self.ROOT_TAG_NAME
@@ -677,6 +842,7 @@ class BeautifulSoup(Tag):
         self.preserve_whitespace_tag_stack = []
         self.string_container_stack = []
         self._most_recent_element = None
+        self._text_cache = None
         self.pushTag(self)
 
     def new_tag(
@@ -0,0 +1,208 @@
+"""Parse many documents and extract data from them in parallel, using
+a pool of worker processes.
+
+Parsing is CPU-bound, and the parsers Beautiful Soup uses hold the
+global interpreter lock, so parsing documents in a pool of threads is
+no faster than parsing them one after another. `extract_many` sends
+the documents to a pool of processes instead. Each worker parses a
+document, runs an extraction spec against it, and sends back only
+the (hopefully small) result--never the parse tree itself.
+"""
+from __future__ import annotations
+
+# Use of this source code is governed by the MIT license.
+__license__ = "MIT"
+
+__all__ = [
+    "extract",
+    "extract_many",
+]
+
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+)
+import itertools
+import os
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+from bs4 import BeautifulSoup
+
+if TYPE_CHECKING:
+    from bs4._typing import _RawMarkup
+
+#: An extraction spec says what to pull out of a parsed document. It
+#: can be:
+#:
+#: * A CSS selector. The result is the text of every tag that matches
+#:   the selector, as a list of strings.
+#: * A dictionary mapping names to CSS selectors. The result is a
+#:   dictionary mapping each name to the text of every tag that
+#:   matches the corresponding selector.
+#: * A function that takes a `BeautifulSoup` object and returns the
+#:   result. When the work is done in worker processes, the function
+#:   must be picklable, i.e. defined at the top level of a module.
+_ExtractionSpec = Union[str, Mapping[str, str], Callable[[BeautifulSoup], Any]]
+
+
+def extract(
+    markup: _RawMarkup,
+    spec: _ExtractionSpec,
+    features: str = "html.parser",
+    **kwargs: Any,
+) -> Any:
+    """Parse one document and run an extraction spec against it.
+
+    This is what `extract_many` does in each worker process, but it
+    can be called directly.
+
+    :param markup: The document to parse.
+    :param spec: What to extract from the document. See `_ExtractionSpec`.
+    :param features: Passed into the `BeautifulSoup` constructor to
+        pick a tree builder.
+    :param kwargs: Passed into the `BeautifulSoup` constructor.
+    """
+    if not isinstance(spec, (str, Mapping)) and not callable(spec):
+        raise TypeError(
+            "An extraction spec must be a CSS selector, a dictionary of CSS selectors, or a function, not %r."
+            % (spec,)
+        )
+    soup = BeautifulSoup(markup, features, **kwargs)
+    if isinstance(spec, str):
+        return _select_text(soup, spec)
+    if isinstance(spec, Mapping):
+        return {name: _select_text(soup, selector) for name, selector in spec.items()}
+    return spec(soup)
+
+
+def _select_text(soup: BeautifulSoup, selector: str) -> List[str]:
+    return [tag.get_text() for tag in soup.select(selector)]
+
+
+def _extract_item(
+    item: Tuple[_RawMarkup, _ExtractionSpec],
+    features: str,
+    kwargs: Dict[str, Any],
+) -> Any:
+    markup, spec = item
+    return extract(markup, spec, features, **kwargs)
+
+
+def _extract_chunk(
+    chunk: List[Tuple[_RawMarkup, _ExtractionSpec]],
+    features: str,
+    kwargs: Dict[str, Any],
+) -> List[Any]:
+    return [_extract_item(item, features, kwargs) for item in chunk]
+
+
+def _initialize_worker(features: str) -> None:
+    """Do the imports and lookups every parse will need, once per
+    worker process instead of once per document.
+    """
+    import bs4.css  # noqa: F401
+    from bs4.builder import builder_registry
+
+    builder_registry.lookup(*features.split(","))
+    try:
+        import soupsieve  # noqa: F401
+    except ImportError:
+        pass
+
+
+def _chunks(
+    items: Iterable[Tuple[_RawMarkup, _ExtractionSpec]], chunksize: int
+) -> Iterator[List[Tuple[_RawMarkup, _ExtractionSpec]]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def extract_many(
+    items: Iterable[Tuple[_RawMarkup, _ExtractionSpec]],
+    features: str = "html.parser",
+    max_workers: Optional[int] = None,
+    chunksize: int = 8,
+    max_pending: Optional[int] = None,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Parse many documents in a pool of worker processes, and extract
+    data from each one.
+
+    Documents are sent to the workers in chunks, to cut down on the
+    cost of passing messages between processes; only the extracted
+    data comes back. Results are yielded in the same order as the
+    documents.
+
+    :param items: An iterable of 2-tuples (markup, spec). ``markup``
+        is a document (preferably as bytes, so the workers do the
+        work of decoding it) and ``spec`` says what to extract from
+        it. See `_ExtractionSpec`.
+    :param features: Passed into the `BeautifulSoup` constructor to
+        pick a tree builder.
+    :param max_workers: The number of worker processes. If this is
+        None, there will be one per CPU. If this is 0, no worker
+        processes are started and every document is parsed in the
+        current process, which is mostly useful for debugging.
+    :param chunksize: The number of documents to send to a worker at
+        once.
+    :param max_pending: The maximum number of chunks that can be
+        waiting for a worker at once. ``items`` is consumed no faster
+        than this allows, so it can be a generator that reads
+        documents from disk or the network as they're needed.
+        Defaults to twice the number of workers.
+    :param kwargs: Passed into the `BeautifulSoup` constructor in
+        each worker.
+
+    :yield: The result of extracting data from each document, in order.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1.")
+    if max_workers == 0:
+        for item in items:
+            yield _extract_item(item, features, kwargs)
+        return
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = max_workers * 2
+    chunks = _chunks(items, chunksize)
+    pending: Deque[Future[List[Any]]] = deque()
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_initialize_worker,
+        initargs=(features,),
+    ) as executor:
+        try:
+            for chunk in itertools.islice(chunks, max(max_pending, 1)):
+                pending.append(executor.submit(_extract_chunk, chunk, features, kwargs))
+            while pending:
+                future = pending.popleft()
+                for chunk in itertools.islice(chunks, 1):
+                    pending.append(
+                        executor.submit(_extract_chunk, chunk, features, kwargs)
+                    )
+                yield from future.result()
+        finally:
+            # If the caller stopped early, or a worker raised an
+            # exception, don't do work nobody will see.
+            for future in pending:
+                future.cancel()
@@ -271,6 +271,11 @@ class TreeBuilder(object):
     #: Most parsers don't keep track of line numbers.
     TRACKS_LINE_NUMBERS: bool = False
 
+    #: Most parsers can't be fed a document a chunk at a time. If
+    #: a `BeautifulSoup` object is built incrementally with one of these
+    #: parsers, the chunks will be collected and parsed all at once.
+    SUPPORTS_INCREMENTAL: bool = False
+
     def initialize_soup(self, soup: BeautifulSoup) -> None:
         """The BeautifulSoup object has been initialized and is now
         being associated with the TreeBuilder.
@@ -314,6 +319,26 @@ class TreeBuilder(object):
         """Run incoming markup through some parsing process."""
         raise NotImplementedError()
 
+    def feed_incremental(self, markup: str) -> None:
+        """Run one chunk of a document through the parser, building
+        as much of the tree as possible.
+
+        Only called if `TreeBuilder.SUPPORTS_INCREMENTAL` is True. See
+        `BeautifulSoup.incremental`.
+
+        :param markup: The next chunk of the document, already
+           converted to Unicode.
+        """
+        raise NotImplementedError()
+
+    def close_incremental(self) -> None:
+        """Tell the parser there are no more chunks coming, so that
+        it can process any markup it's been holding back.
+
+        Only called if `TreeBuilder.SUPPORTS_INCREMENTAL` is True.
+        """
+        raise NotImplementedError()
+
     def prepare_markup(
         self,
         markup: _RawMarkup,
@@ -344,6 +344,12 @@ class HTMLParserTreeBuilder(HTMLTreeBuilder):
     #: original file is the source of an element.
     TRACKS_LINE_NUMBERS: bool = True
 
+    #: html.parser can be fed a document a chunk at a time.
+    SUPPORTS_INCREMENTAL: bool = True
+
+    #: The parser currently being fed a document, if any.
+    parser: Optional[BeautifulSoupHTMLParser] = None
+
     def __init__(
         self,
         parser_args: Optional[Iterable[Any]] = None,
@@ -447,8 +453,6 @@ class HTMLParserTreeBuilder(HTMLTreeBuilder):
             )
 
     def feed(self, markup: _RawMarkup) -> None:
-        args, kwargs = self.parser_args
-
         # HTMLParser.feed will only handle str, but
         # BeautifulSoup.markup is allowed to be _RawMarkup, because
         # it's set by the yield value of
@@ -456,19 +460,45 @@ class HTMLParserTreeBuilder(HTMLTreeBuilder):
         # HTMLParserTreeBuilder.prepare_markup always yields a str
         # (UnicodeDammit.unicode_markup).
         assert isinstance(markup, str)
+        self.feed_incremental(markup)
+        self.close_incremental()
 
-        # We know BeautifulSoup calls TreeBuilder.initialize_soup
-        # before calling feed(), so we can assume self.soup
-        # is set.
-        assert self.soup is not None
-        parser = BeautifulSoupHTMLParser(self.soup, *args, **kwargs)
+    def feed_incremental(self, markup: str) -> None:
+        """Run one chunk of a document through the parser.
 
+        html.parser holds back any markup it can't be sure about
+        (such as a tag that's been cut off in the middle), so it's
+        safe to split the document anywhere.
+        """
+        if self.parser is None:
+            # We know BeautifulSoup calls TreeBuilder.initialize_soup
+            # before feeding in any markup, so we can assume self.soup
+            # is set.
+            assert self.soup is not None
+            args, kwargs = self.parser_args
+            self.parser = BeautifulSoupHTMLParser(self.soup, *args, **kwargs)
         try:
-            parser.feed(markup)
-            parser.close()
+            self.parser.feed(markup)
         except AssertionError as e:
             # html.parser raises AssertionError in rare cases to
             # indicate a fatal problem with the markup, especially
             # when there's an error in the doctype declaration.
             raise ParserRejectedMarkup(e)
-        parser.already_closed_empty_element = []
+
+    def close_incremental(self) -> None:
+        """Process any markup the parser has been holding back."""
+        if self.parser is None:
+            # Nothing was ever fed in; parse an empty document so the
+            # parser sees the same events it would for "".
+            self.feed_incremental("")
+        assert self.parser is not None
+        try:
+            self.parser.close()
+        except AssertionError as e:
+            raise ParserRejectedMarkup(e)
+        self.parser.already_closed_empty_element = []
+        self.parser = None
+
+    def reset(self) -> None:
+        """Discard any parser left over from a previous document."""
+        self.parser = None
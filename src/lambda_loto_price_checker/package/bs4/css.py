@@ -10,6 +10,19 @@ functions is that you don't need to keep passing the `element.Tag` to be
 selected against, since the `CSS` object is permanently scoped to that
 `element.Tag`.
 
+Selectors are compiled through Soup Sieve's shared cache,
+``soupsieve.cache``. To keep the first call to select() from paying
+to compile a selector, compile it ahead of time with
+``soupsieve.prewarm()``, or restore a cache saved by another process
+with ``soupsieve.cache.load()``.
+
+To run many selectors against a document that isn't changing, make
+an index of it with `CSS.index` and pass it to select() and its
+relatives as ``index``. Selectors that name an ID, a class or a tag
+are then answered from the index instead of by looking at every tag.
+The index doesn't notice changes to the document: after changing
+it, call the index's ``rebuild()`` method before using it again.
+
 """
 
 from __future__ import annotations
@@ -18,16 +31,19 @@ from types import ModuleType
 from typing import (
     Any,
     cast,
+    Dict,
     Iterable,
     Iterator,
+    Mapping,
     Optional,
     TYPE_CHECKING,
+    Union,
 )
 import warnings
 from bs4._typing import _NamespaceMapping
 
 if TYPE_CHECKING:
-    from soupsieve import SoupSieve
+    from soupsieve import DocumentIndex, SoupSieve
     from bs4 import element
     from bs4.element import ResultSet, Tag
 
@@ -128,6 +144,18 @@ class CSS(object):
         """
         return self.api.compile(select, self._ns(namespaces, select), flags, **kwargs)
 
+    def index(self) -> DocumentIndex:
+        """Index the document this `element.Tag` belongs to, for
+        select(), select_one(), iselect() and select_many() to look
+        tags up in.
+
+        The index covers the whole document, so one index can be used
+        with any `element.Tag` in it.
+
+        :return: A ``soupsieve.DocumentIndex``.
+        """
+        return self.api.DocumentIndex(self.tag)
+
     def select_one(
         self,
         select: str,
@@ -195,6 +223,57 @@ class CSS(object):
             )
         )
 
+    def select_many(
+        self,
+        selects: Mapping[str, str],
+        namespaces: Optional[_NamespaceMapping] = None,
+        limit: Union[int, Mapping[str, int]] = 0,
+        flags: int = 0,
+        index: Optional[DocumentIndex] = None,
+        **kwargs: Any,
+    ) -> Dict[str, ResultSet[element.Tag]]:
+        """Perform several CSS selection operations on the current
+        `element.Tag` at once.
+
+        This is faster than calling select() once per selector:
+        selectors that can be answered from ``index`` are answered
+        that way, and all the others share a single pass over the
+        document.
+
+        :param selects: A dictionary mapping names to CSS selectors
+            (or precompiled selectors).
+
+        :param namespaces: A dictionary mapping namespace prefixes
+            used in the CSS selectors to namespace URIs. By default,
+            Beautiful Soup will pass in the prefixes it encountered while
+            parsing the document.
+
+        :param limit: After finding this number of results for a
+            selector, stop looking. This can be a single number, or a
+            dictionary mapping some of the names in ``selects`` to
+            numbers. Once every selector has reached its limit, the
+            search stops.
+
+        :param flags: Flags to be passed into Soup Sieve's
+            `soupsieve.compile() <https://facelessuser.github.io/soupsieve/api/#soupsievecompile>`_ method.
+
+        :param index: An index of the document, made by `CSS.index`.
+
+        :param kwargs: Keyword arguments to be passed into Soup Sieve's
+           `soupsieve.compile() <https://facelessuser.github.io/soupsieve/api/#soupsievecompile>`_ method.
+
+        :return: A dictionary mapping each name in ``selects`` to a
+            `ResultSet` of the tags that matched its selector.
+        """
+        if limit is None:
+            limit = 0
+        compiled = {
+            name: self.compile(select, namespaces, flags, **kwargs)
+            for name, select in selects.items()
+        }
+        results = self.api.select_many(compiled, self.tag, limit=limit, index=index)
+        return {name: self._rs(tags) for name, tags in results.items()}
+
     def iselect(
         self,
         select: str,
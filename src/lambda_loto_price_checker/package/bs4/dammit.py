@@ -68,14 +68,54 @@ except ImportError:
             pass
 
 
-def _chardet_dammit(s: bytes) -> Optional[str]:
-    """Try as hard as possible to detect the encoding of a bytestring."""
+def _chardet_dammit(
+    s: bytes, sniff_size: Optional[int] = None, min_confidence: float = 0.0
+) -> Optional[str]:
+    """Try as hard as possible to detect the encoding of a bytestring.
+
+    :param sniff_size: If this is not None, only the first
+        ``sniff_size`` bytes are passed to the detector at first. If
+        the detector is less than ``min_confidence`` sure of its
+        guess, it's given four times as many bytes, and so on until
+        it's sure or it has seen the whole bytestring.
+    :param min_confidence: How sure the detector must be of a guess
+        based on part of the bytestring.
+    """
     if chardet_module is None or isinstance(s, str):
         return None
     module = chardet_module
+    if sniff_size is not None:
+        # All-ASCII data only proves the encoding is ASCII if that's
+        # all there is.
+        ascii_is_conclusive = s.isascii()
+        while sniff_size < len(s):
+            result = module.detect(_sniff_window(s, sniff_size))
+            encoding = result["encoding"]
+            if (
+                encoding is not None
+                and (result.get("confidence") or 0) >= min_confidence
+                and (ascii_is_conclusive or encoding.lower() != "ascii")
+            ):
+                return encoding
+            sniff_size *= 4
     return module.detect(s)["encoding"]
 
 
+def _sniff_window(s: bytes, size: int) -> bytes:
+    """Cut a bytestring down to about ``size`` bytes, for passing into
+    a detector.
+
+    If possible, the bytestring is cut just before a less-than sign,
+    which in any ASCII-compatible encoding can't be in the middle of
+    a multibyte character. A multibyte character cut in two can
+    convince a detector the data isn't in the right encoding.
+    """
+    cut = s.rfind(b"<", size // 2, size)
+    if cut == -1:
+        cut = size
+    return s[:cut]
+
+
 # Build bytestring and Unicode versions of regular expressions for finding
 # a declared encoding inside an XML or HTML document.
 xml_encoding: str = "^\\s*<\\?.*encoding=['\"](.*?)['\"].*\\?>"  #: :meta private:
@@ -83,6 +123,11 @@ html_meta: str = (
     "<\\s*meta[^>]+charset\\s*=\\s*[\"']?([^>]*?)[ /;'\">]"  #: :meta private:
 )
 
+# The charset parameter of an HTTP Content-Type header.
+content_type_charset_re: Pattern[str] = re.compile(
+    ";\\s*charset\\s*=\\s*[\"']?([^\"';\\s]+)", re.I
+)  #: :meta private:
+
 # TODO-TYPING: The Pattern type here could use more refinement, but it's tricky.
 encoding_res: Dict[Type, Dict[str, Pattern]] = dict()
 encoding_res[bytes] = {
@@ -125,6 +170,28 @@ class EntitySubstitution(object):
     #: :meta hide-value:
     CHARACTER_TO_HTML_ENTITY_WITH_AMPERSAND_RE: Pattern[str]
 
+    #: A `str.translate` table mapping each character that can be
+    #: replaced with a named HTML entity, no matter what characters
+    #: surround it, to that entity.
+    #:
+    #: :meta hide-value:
+    CHARACTER_TO_HTML_ENTITY_TABLE: Dict[int, str]
+
+    #: CHARACTER_TO_HTML_ENTITY_TABLE, plus an entry that escapes
+    #: ampersands.
+    #:
+    #: :meta hide-value:
+    CHARACTER_TO_HTML_ENTITY_WITH_AMPERSAND_TABLE: Dict[int, str]
+
+    #: A regular expression that matches the character strings that
+    #: CHARACTER_TO_HTML_ENTITY_RE matches, but which can't go into
+    #: CHARACTER_TO_HTML_ENTITY_TABLE: multi-character strings, and
+    #: characters that only get replaced when they're not part of
+    #: a multi-character string.
+    #:
+    #: :meta hide-value:
+    CHARACTER_TO_HTML_ENTITY_IN_CONTEXT_RE: Pattern[str]
+
     @classmethod
     def _populate_class_variables(cls) -> None:
         """Initialize variables used by this class to manage the plethora of
@@ -148,6 +215,13 @@ class EntitySubstitution(object):
         also matches unescaped ampersands. This is used by the 'html'
         formatted to provide backwards-compatibility, even though the HTML5
         spec allows most ampersands to go unescaped.
+
+        CHARACTER_TO_HTML_ENTITY_TABLE,
+        CHARACTER_TO_HTML_ENTITY_WITH_AMPERSAND_TABLE and
+        CHARACTER_TO_HTML_ENTITY_IN_CONTEXT_RE: The same substitutions
+        as the two regular expressions, split into a table used to
+        replace single characters with `str.translate`, and a much
+        smaller regular expression for everything else.
         """
         unicode_to_name = {}
         name_to_unicode = {}
@@ -237,6 +311,20 @@ class EntitySubstitution(object):
 
         re_definition = "(%s)" % "|".join(particles)
 
+        # A character can go into the translation table if it's always
+        # replaced on its own: it's not the start of a multi-character
+        # string that gets replaced, and it's not part of one
+        # either.
+        in_context = set()
+        for long_entities in long_entities_by_first_character.values():
+            for long_entity in long_entities:
+                in_context.update(long_entity)
+        translatable = short_entities - in_context
+        in_context_particles = [
+            particle for particle in particles if particle not in translatable
+        ]
+        re_definition_in_context = "(%s)" % "|".join(in_context_particles)
+
         particles.add("&")
         re_definition_with_ampersand = "(%s)" % "|".join(particles)
 
@@ -256,6 +344,17 @@ class EntitySubstitution(object):
         cls.CHARACTER_TO_HTML_ENTITY_WITH_AMPERSAND_RE = re.compile(
             re_definition_with_ampersand
         )
+        cls.CHARACTER_TO_HTML_ENTITY_TABLE = {
+            ord(character): "&%s;" % unicode_to_name[character]
+            for character in translatable
+        }
+        cls.CHARACTER_TO_HTML_ENTITY_WITH_AMPERSAND_TABLE = dict(
+            cls.CHARACTER_TO_HTML_ENTITY_TABLE
+        )
+        cls.CHARACTER_TO_HTML_ENTITY_WITH_AMPERSAND_TABLE[ord("&")] = "&amp;"
+        cls.CHARACTER_TO_HTML_ENTITY_IN_CONTEXT_RE = re.compile(
+            re_definition_in_context
+        )
 
     #: A map of Unicode strings to the corresponding named XML entities.
     #:
@@ -371,7 +470,10 @@ class EntitySubstitution(object):
          with named entities.
         """
         # Escape angle brackets and ampersands.
-        value = cls.AMPERSAND_OR_BRACKET.sub(cls._substitute_xml_entity, value)
+        if "&" in value or "<" in value or ">" in value:
+            value = (
+                value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            )
 
         if make_quoted_attribute:
             value = cls.quoted_attribute_value(value)
@@ -393,7 +495,12 @@ class EntitySubstitution(object):
         """
         # Escape angle brackets, and ampersands that aren't part of
         # entities.
-        value = cls.BARE_AMPERSAND_OR_BRACKET.sub(cls._substitute_xml_entity, value)
+        if "&" in value:
+            value = cls.BARE_AMPERSAND_OR_BRACKET.sub(
+                cls._substitute_xml_entity, value
+            )
+        elif "<" in value or ">" in value:
+            value = value.replace("<", "&lt;").replace(">", "&gt;")
 
         if make_quoted_attribute:
             value = cls.quoted_attribute_value(value)
@@ -416,7 +523,32 @@ class EntitySubstitution(object):
            HTML entities.
         """
         # Convert any appropriate characters to HTML entities.
-        return cls.CHARACTER_TO_HTML_ENTITY_WITH_AMPERSAND_RE.sub(
+        return cls._substitute_html_entities(
+            s, cls.CHARACTER_TO_HTML_ENTITY_WITH_AMPERSAND_TABLE
+        )
+
+    @classmethod
+    def _substitute_html_entities(cls, s: str, table: Dict[int, str]) -> str:
+        """Do what `CHARACTER_TO_HTML_ENTITY_RE` (or
+        `CHARACTER_TO_HTML_ENTITY_WITH_AMPERSAND_RE`, depending on
+        ``table``) would do, but faster.
+        """
+        if s.isascii():
+            # The only ASCII characters that get replaced are angle
+            # brackets, and possibly ampersands. Every multi-character
+            # string that gets replaced contains a non-ASCII
+            # character.
+            if "&" in s and ord("&") in table:
+                s = s.replace("&", "&amp;")
+            if "<" in s or ">" in s:
+                s = s.replace("<", "&lt;").replace(">", "&gt;")
+            return s
+
+        # Multi-character strings, and the characters that might be
+        # part of them, have to be found with a regular
+        # expression. Everything else is in the table.
+        s = s.translate(table)
+        return cls.CHARACTER_TO_HTML_ENTITY_IN_CONTEXT_RE.sub(
             cls._substitute_html_entity, s
         )
 
@@ -447,10 +579,11 @@ class EntitySubstitution(object):
            HTML entities.
         """
         # First, escape any HTML entities found in the markup.
-        s = cls.ANY_ENTITY_RE.sub(cls._escape_entity_name, s)
+        if "&" in s:
+            s = cls.ANY_ENTITY_RE.sub(cls._escape_entity_name, s)
 
         # Next, convert any appropriate characters to unescaped HTML entities.
-        s = cls.CHARACTER_TO_HTML_ENTITY_RE.sub(cls._substitute_html_entity, s)
+        s = cls._substitute_html_entities(s, cls.CHARACTER_TO_HTML_ENTITY_TABLE)
 
         return s
 
@@ -470,11 +603,12 @@ class EntitySubstitution(object):
         # First, escape the ampersand for anything that looks like an
         # entity but isn't in the list of recognized entities. All other
         # ampersands can be left alone.
-        s = cls.ANY_ENTITY_RE.sub(cls._escape_unrecognized_entity_name, s)
+        if "&" in s:
+            s = cls.ANY_ENTITY_RE.sub(cls._escape_unrecognized_entity_name, s)
 
         # Then, convert a range of Unicode characters to unescaped
         # HTML entities.
-        s = cls.CHARACTER_TO_HTML_ENTITY_RE.sub(cls._substitute_html_entity, s)
+        s = cls._substitute_html_entities(s, cls.CHARACTER_TO_HTML_ENTITY_TABLE)
 
         return s
 
@@ -560,6 +694,8 @@ class EncodingDetector:
         self.chardet_encoding = None
         self.is_html = False if is_html is None else is_html
         self.declared_encoding: Optional[str] = None
+        self._searched_for_declared_encoding = False
+        self._ran_chardet = False
 
         # First order of business: strip a byte-order mark.
         self.markup, self.sniffed_encoding = self.strip_byte_order_mark(markup)
@@ -572,6 +708,26 @@ class EncodingDetector:
     declared_encoding: Optional[_Encoding]
     markup: bytes
     sniffed_encoding: Optional[_Encoding]
+    _searched_for_declared_encoding: bool
+    _ran_chardet: bool
+
+    #: How much of a document to look at when trying to find its
+    #: encoding. A <meta> tag declaring an encoding is only looked for
+    #: this far into a document, and statistical detection starts out
+    #: looking at this many bytes, only looking further if it's not
+    #: confident in its guess. Set this to None to always look at the
+    #: whole document.
+    SNIFF_SIZE: Optional[int] = 64 * 1024
+
+    #: How confident statistical detection needs to be in a guess
+    #: based on the first `EncodingDetector.SNIFF_SIZE` bytes of a
+    #: document before it stops looking at more of the document.
+    CHARDET_MIN_CONFIDENCE: float = 0.8
+
+    #: How much of a document `EncodingDetector.known_encodings`
+    #: searches for an encoding declared in a <meta> tag or XML
+    #: declaration.
+    KNOWN_ENCODING_SEARCH_SIZE: int = 4096
 
     def _usable(self, encoding: Optional[_Encoding], tried: Set[_Encoding]) -> bool:
         """Should we even bother to try this encoding?
@@ -619,10 +775,15 @@ class EncodingDetector:
 
         # Look within the document for an XML or HTML encoding
         # declaration.
-        if self.declared_encoding is None:
+        #
+        # This and the statistical detection below can be expensive,
+        # and `encodings` may be iterated more than once, so each one
+        # is only done once, even if it finds nothing.
+        if not self._searched_for_declared_encoding:
             self.declared_encoding = self.find_declared_encoding(
                 self.markup, self.is_html
             )
+            self._searched_for_declared_encoding = True
         if self.declared_encoding is not None and self._usable(
             self.declared_encoding, tried
         ):
@@ -630,8 +791,11 @@ class EncodingDetector:
 
         # Use third-party character set detection to guess at the
         # encoding.
-        if self.chardet_encoding is None:
-            self.chardet_encoding = _chardet_dammit(self.markup)
+        if not self._ran_chardet:
+            self.chardet_encoding = _chardet_dammit(
+                self.markup, self.SNIFF_SIZE, self.CHARDET_MIN_CONFIDENCE
+            )
+            self._ran_chardet = True
         if self.chardet_encoding is not None and self._usable(
             self.chardet_encoding, tried
         ):
@@ -642,6 +806,68 @@ class EncodingDetector:
             if self._usable(e, tried):
                 yield e
 
+    @classmethod
+    def content_type_charset(cls, content_type: Optional[str]) -> Optional[_Encoding]:
+        """Find the encoding named in the ``charset`` parameter of an
+        HTTP Content-Type header.
+
+        Unlike ``requests.utils.get_encoding_from_headers``, this
+        doesn't fall back to ISO-8859-1 for text/* documents that
+        don't name a charset; a default like that is a guess, not a
+        known definite encoding.
+
+        :param content_type: The value of a Content-Type header.
+        :return: The lowercased encoding, or None if no charset is named.
+        """
+        if not content_type:
+            return None
+        match = content_type_charset_re.search(content_type)
+        if match is None:
+            return None
+        return match.group(1).lower()
+
+    @classmethod
+    def known_encodings(
+        cls,
+        markup: bytes,
+        content_type: Optional[str] = None,
+        is_html: bool = True,
+    ) -> _Encodings:
+        """Find the encodings of a document that can be known without
+        any statistical detection, in the order the HTML standard
+        gives them precedence.
+
+        Pass the result into `UnicodeDammit` as
+        ``known_definite_encodings`` (or pass its first element into
+        the `BeautifulSoup` constructor as ``from_encoding``) and, as
+        long as one of them works, the document will be decoded
+        without ever running chardet over it.
+
+        :param markup: A document, or at least the first few kilobytes of one.
+        :param content_type: The value of the Content-Type header
+            the document was served with, if any.
+        :param is_html: If True, look for an encoding declared in a
+            <meta> tag as well as in an XML declaration.
+        :return: A list containing, in order and without duplicates,
+            the encoding implied by the document's byte-order mark,
+            the encoding named in ``content_type``, and the encoding
+            declared in the first
+            `EncodingDetector.KNOWN_ENCODING_SEARCH_SIZE` bytes of the
+            document.
+        """
+        head = markup[: cls.KNOWN_ENCODING_SEARCH_SIZE]
+        head, sniffed = cls.strip_byte_order_mark(head)
+        candidates = [
+            sniffed,
+            cls.content_type_charset(content_type),
+            cls.find_declared_encoding(head, is_html, search_entire_document=True),
+        ]
+        encodings: List[_Encoding] = []
+        for encoding in candidates:
+            if encoding is not None and encoding not in encodings:
+                encodings.append(encoding)
+        return encodings
+
     @classmethod
     def strip_byte_order_mark(cls, data: bytes) -> Tuple[bytes, Optional[_Encoding]]:
         """If a byte-order mark is present, strip it and return the encoding it implies.
@@ -701,7 +927,8 @@ class EncodingDetector:
         :param search_entire_document: Since an encoding is supposed
             to declared near the beginning of the document, most of
             the time it's only necessary to search a few kilobytes of
-            data.  Set this to True to force this method to search the
+            data (and never more than `EncodingDetector.SNIFF_SIZE`
+            bytes). Set this to True to force this method to search the
             entire document.
         :return: The declared encoding, if one is found.
         """
@@ -710,6 +937,8 @@ class EncodingDetector:
         else:
             xml_endpos = 1024
             html_endpos = max(2048, int(len(markup) * 0.05))
+            if cls.SNIFF_SIZE is not None:
+                html_endpos = min(html_endpos, max(2048, cls.SNIFF_SIZE))
 
         if isinstance(markup, bytes):
             res = encoding_res[bytes]
@@ -1373,36 +1602,245 @@ class UnicodeDammit:
                 "UTF-8 is the only currently supported main encoding."
             )
 
-        byte_chunks = []
-
-        chunk_start = 0
-        pos = 0
-        while pos < len(in_bytes):
-            byte = in_bytes[pos]
-            if byte >= cls.FIRST_MULTIBYTE_MARKER and byte <= cls.LAST_MULTIBYTE_MARKER:
-                # This is the start of a UTF-8 multibyte character. Skip
-                # to the end.
-                for start, end, size in cls.MULTIBYTE_MARKERS_AND_SIZES:
-                    if byte >= start and byte <= end:
-                        pos += size
-                        break
-            elif byte >= 0x80 and byte in cls.WINDOWS_1252_TO_UTF8:
-                # We found a Windows-1252 character!
-                # Save the string up to this point as a chunk.
-                byte_chunks.append(in_bytes[chunk_start:pos])
-
-                # Now translate the Windows-1252 character into UTF-8
-                # and add it as another, one-byte chunk.
-                byte_chunks.append(cls.WINDOWS_1252_TO_UTF8[byte])
-                pos += 1
-                chunk_start = pos
-            else:
-                # Go on to the next character.
-                pos += 1
-        if chunk_start == 0:
+        # Let the UTF-8 codec skip over everything that's valid
+        # UTF-8. Only the bytes it can't decode are passed to
+        # _detwingle_error, which converts them as appropriate. Any
+        # bytes that should be left alone come back as lone
+        # surrogates, and are turned back into the original bytes
+        # on the way out.
+        try:
+            in_bytes.decode("utf8")
+        except UnicodeDecodeError:
+            pass
+        else:
             # The string is unchanged.
             return in_bytes
-        else:
-            # Store the final chunk.
-            byte_chunks.append(in_bytes[chunk_start:])
-        return b"".join(byte_chunks)
+        out_bytes = in_bytes.decode("utf8", "bs4-detwingle").encode(
+            "utf8", "surrogateescape"
+        )
+        if out_bytes == in_bytes:
+            # There was invalid UTF-8, but no Windows-1252 characters.
+            return in_bytes
+        return out_bytes
+
+
+# What `UnicodeDammit.detwingle` turns each byte into, if the byte is
+# neither ASCII nor the start of a UTF-8 multibyte character:
+# Windows-1252 characters are converted, and other bytes become lone
+# surrogates, so they'll be turned back into the original bytes.
+_detwingle_single_bytes_table: Dict[int, str] = {
+    byte: UnicodeDammit.WINDOWS_1252_TO_UTF8[byte].decode("utf8")
+    if byte in UnicodeDammit.WINDOWS_1252_TO_UTF8
+    else chr(0xDC00 + byte)
+    for byte in range(0x80, 0x100)
+    if byte < UnicodeDammit.FIRST_MULTIBYTE_MARKER
+    or byte > UnicodeDammit.LAST_MULTIBYTE_MARKER
+}
+
+
+def _detwingle_error(error: UnicodeError) -> Tuple[str, int]:
+    """A codec error handler that does what `UnicodeDammit.detwingle`
+    does with bytes that aren't valid UTF-8.
+    """
+    assert isinstance(error, UnicodeDecodeError)
+    in_bytes = error.object
+    pos = error.start
+    byte = in_bytes[pos]
+    if (
+        byte >= UnicodeDammit.FIRST_MULTIBYTE_MARKER
+        and byte <= UnicodeDammit.LAST_MULTIBYTE_MARKER
+    ):
+        # This is the start of a UTF-8 multibyte character, albeit a
+        # broken one. Leave it, and the bytes that would be part of
+        # it, alone.
+        for start, end, size in UnicodeDammit.MULTIBYTE_MARKERS_AND_SIZES:
+            if byte >= start and byte <= end:
+                end = min(pos + size, len(in_bytes))
+                break
+        return in_bytes[pos:end].decode("utf8", "surrogateescape"), end
+
+    # This byte, and any like it that immediately follow it, are
+    # characters on their own.
+    table = _detwingle_single_bytes_table
+    converted = table[byte]
+    pos += 1
+    while pos < len(in_bytes) and in_bytes[pos] in table:
+        converted += table[in_bytes[pos]]
+        pos += 1
+    return converted, pos
+
+
+codecs.register_error("bs4-detwingle", _detwingle_error)
+
+
+class IncrementalUnicodeDammit(UnicodeDammit):
+    """The incremental counterpart of `UnicodeDammit`: converts a
+    bytestream to Unicode one chunk at a time.
+
+    The first `IncrementalUnicodeDammit.SNIFF_SIZE` bytes are
+    buffered and used to choose an encoding, following the same order
+    of precedence as `EncodingDetector`. From then on, each chunk is
+    run through an incremental decoder as soon as it arrives, so the
+    whole bytestring never needs to be in memory at once.
+
+    Unlike `UnicodeDammit`, this class can't go back and try a
+    different encoding once it's started decoding. If a later chunk
+    turns out not to be valid in the chosen encoding, the bad bytes
+    are replaced with REPLACEMENT CHARACTER and
+    `UnicodeDammit.contains_replacement_characters` is set.
+
+    :param known_definite_encodings: These encodings will be tried
+        first, in order. See `UnicodeDammit`.
+
+    :param is_html: If True, the markup is treated as an HTML
+       document. Otherwise it's treated as an XML document.
+
+    :param exclude_encodings: These encodings will not be considered,
+       even if the sniffing code thinks they might make sense.
+
+    :param user_encodings: These encodings will be tried after the
+        ``known_definite_encodings`` and the byte-order mark. See
+        `UnicodeDammit`.
+    """
+
+    #: How many bytes to collect before choosing an encoding. This
+    #: matches the smallest window `EncodingDetector.find_declared_encoding`
+    #: searches for an encoding declared in a <meta> tag.
+    SNIFF_SIZE: int = 2048
+
+    def __init__(
+        self,
+        known_definite_encodings: Optional[_Encodings] = None,
+        is_html: bool = False,
+        exclude_encodings: Optional[_Encodings] = None,
+        user_encodings: Optional[_Encodings] = None,
+    ):
+        self.smart_quotes_to = None
+        self.tried_encodings = []
+        self.contains_replacement_characters = False
+        self.is_html = is_html
+        self.log = getLogger(__name__)
+        self.known_definite_encodings = known_definite_encodings
+        self.exclude_encodings = exclude_encodings
+        self.user_encodings = user_encodings
+
+        # The detector isn't created until enough data has been
+        # buffered to run it on.
+        self.detector = None
+        self.markup = b""
+        self.unicode_markup = None
+        self.original_encoding = None
+        self._buffer = []
+        self._buffered = 0
+        self._decoder = None
+
+    detector: Optional[EncodingDetector]  # type:ignore
+    known_definite_encodings: Optional[_Encodings]
+    exclude_encodings: Optional[_Encodings]
+    user_encodings: Optional[_Encodings]
+    _buffer: List[bytes]
+    _buffered: int
+    _decoder: Optional[codecs.IncrementalDecoder]
+
+    @property
+    def declared_html_encoding(self) -> Optional[_Encoding]:
+        """If the markup is an HTML document, returns the encoding, if any,
+        declared *inside* the document.
+        """
+        if self.detector is None:
+            return None
+        return super(IncrementalUnicodeDammit, self).declared_html_encoding
+
+    def decode(self, data: bytes, final: bool = False) -> str:
+        """Convert the next chunk of the bytestream to Unicode.
+
+        :param data: The next chunk of the bytestream.
+        :param final: True if this is the last chunk. Any bytes
+            still being held back will be decoded.
+        :return: As much Unicode as could be decoded so far. This may
+            be the empty string if data is still being buffered.
+        """
+        if self._decoder is None:
+            self._buffer.append(data)
+            self._buffered += len(data)
+            if self._buffered < self.SNIFF_SIZE and not final:
+                return ""
+            data = b"".join(self._buffer)
+            self._buffer = []
+            return self._start(data, final)
+
+        state = self._decoder.getstate()
+        try:
+            return self._decoder.decode(data, final)
+        except UnicodeDecodeError:
+            # Pick up where the strict decoder left off, but with a
+            # decoder that won't reject anything.
+            assert self.original_encoding is not None
+            self._replacing_decoder(self.original_encoding)
+            self._decoder.setstate(state)
+            return self._decoder.decode(data, final)
+
+    def _start(self, data: bytes, final: bool) -> str:
+        """Choose an encoding for the bytestream based on its first
+        few kilobytes, and decode those kilobytes.
+        """
+        self.detector = EncodingDetector(
+            data,
+            self.known_definite_encodings,
+            self.is_html,
+            self.exclude_encodings,
+            self.user_encodings,
+        )
+        data = self.detector.markup
+
+        for encoding in self.detector.encodings:
+            proposed = self.find_codec(encoding)
+            if proposed == "ascii":
+                # The first few kilobytes being pure ASCII says
+                # nothing about the rest of the document, so use an
+                # ASCII-compatible encoding that can cope if non-ASCII
+                # characters show up later.
+                proposed = "utf-8"
+            if proposed is None or (proposed, "strict") in self.tried_encodings:
+                continue
+            self.tried_encodings.append((proposed, "strict"))
+            try:
+                decoder = codecs.getincrementaldecoder(proposed)()
+                u = decoder.decode(data, final)
+            except Exception:
+                continue
+            self._decoder = decoder
+            self.original_encoding = proposed
+            return u
+
+        # None of the encodings worked, even on this small sample.
+        # Use the first one we can find a codec for, with character
+        # replacement.
+        for encoding in self.detector.encodings:
+            proposed = self.find_codec(encoding)
+            if proposed is None or proposed == "ascii":
+                continue
+            try:
+                self._replacing_decoder(proposed)
+            except LookupError:
+                continue
+            assert self._decoder is not None
+            self.original_encoding = proposed
+            return self._decoder.decode(data, final)
+
+        # This shouldn't be possible, since windows-1252 can decode
+        # anything.
+        raise UnicodeError("Could not find any encoding for this bytestream.")
+
+    def _replacing_decoder(self, encoding: _Encoding) -> None:
+        """Switch to a decoder that replaces undecodable bytes with
+        REPLACEMENT CHARACTER.
+        """
+        self._decoder = codecs.getincrementaldecoder(encoding)("replace")
+        self.tried_encodings.append((encoding, "replace"))
+        if not self.contains_replacement_characters:
+            self.log.warning(
+                "Some characters could not be decoded, and were "
+                "replaced with REPLACEMENT CHARACTER."
+            )
+        self.contains_replacement_characters = True
@@ -518,14 +518,37 @@ class PageElement(object):
         See `Tag` for information on which strings are considered
         interesting in a given context.
         """
-        for string in self._all_strings(True):
-            yield string
+        return iter(self._collect_strings(True))
+
+    def _collect_strings(
+        self, strip: bool = False, types: _OneOrMoreStringTypes = default
+    ) -> List[str]:
+        """Make a list of all strings of certain classes, possibly
+        stripping them.
+
+        This does the same work as `_all_strings`, but `Tag`
+        implements it as a single pass over the tree with no
+        generator overhead.
+        """
+        return list(self._all_strings(strip, types))
+
+    #: Text cached by get_text(cache=True), keyed by the arguments
+    #: that were passed in. Any change to the tree beneath this
+    #: element sets this back to None.
+    _text_cache: Optional[Dict[Tuple[str, bool, Any], str]] = None
+
+    #: True if this element may be inside a `Tag` with cached text.
+    #: Filling a cache sets this on every `Tag` beneath it, so that a
+    #: change to the tree only has to look up through the parents
+    #: that have it set.
+    _under_text_cache: bool = False
 
     def get_text(
         self,
         separator: str = "",
         strip: bool = False,
         types: Iterable[Type[NavigableString]] = default,
+        cache: bool = False,
     ) -> str:
         """Get all child strings of this PageElement, concatenated using the
         given separator.
@@ -542,9 +565,35 @@ class PageElement(object):
             and CData objects. That means no comments, processing
             instructions, etc.
 
+        :param cache: If True, the text will be remembered, and calling
+            get_text() again with the same arguments will return it
+            without looking at the tree again. Modifying the tree
+            through the Beautiful Soup API (append(), extract(),
+            replace_with(), and so on) wipes out the remembered text of
+            every affected element. Changes made by modifying
+            ``.contents`` directly won't be noticed.
+
         :return: A string.
         """
-        return separator.join([s for s in self._all_strings(strip, types=types)])
+        if not cache:
+            return separator.join(self._collect_strings(strip, types))
+
+        if types is self.default or types is None or isinstance(types, type):
+            key = (separator, strip, types)
+        else:
+            key = (separator, strip, frozenset(types))
+        text_cache = self._text_cache
+        if text_cache is None:
+            text_cache = self._text_cache = {}
+        text = text_cache.get(key)
+        if text is None:
+            text = text_cache[key] = separator.join(
+                self._collect_strings(strip, types)
+            )
+            for descendant in self.descendants:
+                if isinstance(descendant, Tag):
+                    descendant._under_text_cache = True
+        return text
 
     getText = get_text
     text = property(get_text)
@@ -597,6 +646,7 @@ class PageElement(object):
             if _self_index is None:
                 _self_index = self.parent.index(self)
             del self.parent.contents[_self_index]
+            self.parent._invalidate_text_cache()
 
         # Find the two elements that would be next to each other if
         # this element (and any children) hadn't been parsed. Connect
@@ -1921,6 +1971,62 @@ class Tag(PageElement):
 
     strings = property(_all_strings)
 
+    def _collect_strings(
+        self, strip: bool = False, types: _OneOrMoreStringTypes = PageElement.default
+    ) -> List[str]:
+        """Make a list of all strings of certain classes, possibly
+        stripping them.
+
+        This has the same arguments and results as `Tag._all_strings`,
+        but it walks the next_element chain directly instead of going
+        through the `Tag.descendants` generator.
+        """
+        if types is self.default:
+            if self.interesting_string_types is None:
+                types = self.MAIN_CONTENT_STRING_TYPES
+            else:
+                types = self.interesting_string_types
+        if isinstance(types, type):
+            types = (types,)
+
+        strings: List[str] = []
+        if not self.contents:
+            return strings
+        append = strings.append
+        stop = cast(PageElement, self._last_descendant()).next_element
+        current: _AtMostOneElement = self.contents[0]
+        while current is not stop and current is not None:
+            # A Tag is never in the set of interesting string types,
+            # so checking the type also skips over Tags.
+            if (
+                isinstance(current, NavigableString)
+                if types is None
+                else current.__class__ in types
+            ):
+                if strip:
+                    stripped = current.strip()
+                    if stripped:
+                        append(stripped)
+                else:
+                    append(current)  # type:ignore
+            current = current.next_element
+        return strings
+
+    def _invalidate_text_cache(self) -> None:
+        """Wipe out text cached by get_text(cache=True) on this `Tag`
+        and all of its parents, because something beneath it has
+        changed.
+        """
+        tag: Optional[Tag] = self
+        while tag is not None and (
+            tag._text_cache is not None or tag._under_text_cache
+        ):
+            # None of the parents above the first Tag that's neither
+            # cached nor inside a cached Tag has any text cached.
+            tag._text_cache = None
+            tag._under_text_cache = False
+            tag = tag.parent
+
     def insert(self, position: int, *new_children: _InsertableElement) -> List[PageElement]:
         """Insert one or more new PageElements as a child of this `Tag`.
 
@@ -2024,6 +2130,7 @@ class Tag(PageElement):
                 new_childs_last_element
             )
         self.contents.insert(position, new_child)
+        self._invalidate_text_cache()
 
         return [new_child]
 
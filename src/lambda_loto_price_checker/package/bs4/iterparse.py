@@ -0,0 +1,575 @@
+"""Parse an HTML document into a stream of events, without building
+a parse tree.
+
+When all you want is a few values out of a large document, building
+(and keeping in memory) a `BeautifulSoup` object for the whole thing
+is wasted effort. `iterparse` runs the document through
+:py:class:`html.parser.HTMLParser`, the same way `HTMLParserTreeBuilder`
+does, but instead of linking every node into a tree it yields a
+``(event, element)`` 2-tuple as each node is encountered, and then
+forgets about it.
+"""
+from __future__ import annotations
+
+# Use of this source code is governed by the MIT license.
+__license__ = "MIT"
+
+__all__ = [
+    "iterparse",
+]
+
+from collections import Counter
+import re
+from typing import (
+    Any,
+    Callable,
+    Counter as CounterType,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
+
+from bs4 import BeautifulSoup
+from bs4.builder._htmlparser import (
+    BeautifulSoupHTMLParser,
+    HTMLParserTreeBuilder,
+)
+from bs4.dammit import IncrementalUnicodeDammit
+from bs4.element import (
+    NavigableString,
+    PageElement,
+    Tag,
+)
+from bs4.exceptions import ParserRejectedMarkup
+
+if TYPE_CHECKING:
+    from bs4._typing import (
+        _Encoding,
+        _Encodings,
+        _IncomingMarkup,
+        _RawAttributeValues,
+        _RawMarkup,
+    )
+
+#: An event and the `Tag` or `NavigableString` it happened to.
+_Event = Tuple[str, PageElement]
+
+#: The events `iterparse` knows how to generate.
+EVENTS: Tuple[str, ...] = ("start", "end", "text")
+
+
+def iterparse(
+    markup: Union[_IncomingMarkup, Iterable[_RawMarkup]],
+    events: Iterable[str] = EVENTS,
+    select: Optional[str] = None,
+    from_encoding: Optional[_Encoding] = None,
+    exclude_encodings: Optional[_Encodings] = None,
+    chunk_size: int = 16 * 1024,
+    **kwargs: Any,
+) -> Iterator[_Event]:
+    """Parse an HTML document with html.parser, yielding events as
+    the parser encounters tags and strings.
+
+    The events are:
+
+    * ``("start", tag)`` when a tag is opened. The `Tag` has its name
+      and attributes, but you can't count on it having any contents.
+    * ``("end", tag)`` when a tag is closed, either explicitly or
+      because the tag it was inside was closed.
+    * ``("text", string)`` for every string, as a `NavigableString`
+      (or subclass, such as `Comment` or `Script`) with the same
+      content it would have in a `BeautifulSoup` tree.
+
+    Tags and strings aren't connected to each other, and nothing is
+    kept once it's been yielded, apart from the tags that are
+    currently open. Memory use doesn't depend on the size of the
+    document, and if you stop iterating, parsing stops too.
+
+    If you pass in a CSS selector as ``select``, only tags that match
+    it generate events, and those tags are built out into complete
+    subtrees: by the time a tag's "end" event comes around, you can
+    call `Tag.get_text`, `Tag.select` and so on, just as you would on
+    a tag from a `BeautifulSoup` tree. Strings don't generate events
+    when ``select`` is used. Only a simple subset of CSS is
+    supported, since tags are matched as soon as they're opened: type,
+    universal, ``#id``, ``.class`` and attribute selectors, combined
+    with the descendant and child (``>``) combinators, in a
+    comma-separated list.
+
+    :param markup: A string or bytestring, an open filehandle, or an
+        iterable that yields strings or bytestrings (such as
+        ``response.iter_content()``).
+    :param events: The events to generate. By default, all of them.
+    :param select: A CSS selector. If present, only tags that match
+        the selector will generate events.
+    :param from_encoding: If the markup is a bytestring, try this
+        encoding first.
+    :param exclude_encodings: If the markup is a bytestring, don't try
+        any of these encodings.
+    :param chunk_size: Strings, bytestrings and filehandles are fed
+        into the parser this many characters (or bytes) at a time.
+    :param kwargs: Keyword arguments for the `HTMLParserTreeBuilder`
+        constructor, such as ``on_duplicate_attribute``.
+
+    :raise ParserRejectedMarkup: If html.parser can't parse the markup.
+    :raise ValueError: If the selector uses CSS that can't be matched
+        as tags are opened.
+    """
+    events = set(events)
+    unknown = events - set(EVENTS)
+    if unknown:
+        raise ValueError("Unknown event(s): %s" % ", ".join(sorted(unknown)))
+
+    builder = HTMLParserTreeBuilder(**kwargs)
+    target = _EventTarget(
+        builder, events, _SimpleSelector(select) if select is not None else None
+    )
+    args, parser_kwargs = builder.parser_args
+    parser = BeautifulSoupHTMLParser(target, *args, **parser_kwargs)  # type:ignore
+
+    dammit: Optional[IncrementalUnicodeDammit] = None
+    for chunk in _chunks(markup, chunk_size):
+        data: str
+        if isinstance(chunk, bytes):
+            if dammit is None:
+                dammit = IncrementalUnicodeDammit(
+                    known_definite_encodings=[from_encoding] if from_encoding else [],
+                    is_html=True,
+                    exclude_encodings=exclude_encodings,
+                )
+            data = dammit.decode(chunk)
+            # handle_charref needs this to interpret numeric
+            # character references.
+            target.original_encoding = dammit.original_encoding
+        else:
+            data = chunk
+        if data:
+            _feed(parser, data)
+            yield from target.drain()
+
+    if dammit is not None:
+        data = dammit.decode(b"", final=True)
+        target.original_encoding = dammit.original_encoding
+        if data:
+            _feed(parser, data)
+    try:
+        parser.close()
+    except AssertionError as e:
+        raise ParserRejectedMarkup(e)
+    target.close()
+    yield from target.drain()
+
+
+def _feed(parser: BeautifulSoupHTMLParser, data: str) -> None:
+    """Feed some markup into the parser, converting html.parser's
+    fatal errors into ParserRejectedMarkup, as HTMLParserTreeBuilder does.
+    """
+    try:
+        parser.feed(data)
+    except AssertionError as e:
+        raise ParserRejectedMarkup(e)
+
+
+def _chunks(
+    markup: Union[_IncomingMarkup, Iterable[_RawMarkup]], chunk_size: int
+) -> Iterator[_RawMarkup]:
+    """Split incoming markup into chunks for the parser."""
+    if hasattr(markup, "read"):
+        while True:
+            chunk = markup.read(chunk_size)  # type:ignore
+            if not chunk:
+                return
+            yield chunk
+    elif isinstance(markup, (str, bytes)):
+        for i in range(0, len(markup), chunk_size):
+            yield markup[i : i + chunk_size]
+    else:
+        yield from markup  # type:ignore
+
+
+class _EventTarget(object):
+    """Stands in for a `BeautifulSoup` object as the target of a
+    `BeautifulSoupHTMLParser`, turning tree construction calls into
+    events.
+
+    This mirrors the bookkeeping `BeautifulSoup` does while building
+    a tree (whitespace handling, string container classes, and
+    closing every open tag up to the one named in an end tag), so
+    the events describe the same document a tree would.
+    """
+
+    def __init__(
+        self,
+        builder: HTMLParserTreeBuilder,
+        events: Iterable[str],
+        selector: Optional[_SimpleSelector],
+    ):
+        self.builder = builder
+        self.selector = selector
+        self.want_start = "start" in events
+        self.want_end = "end" in events
+        self.want_text = "text" in events and selector is None
+        self.original_encoding = None
+
+        self.events = []
+        self.current_data = []
+        self.tag_stack = []
+        self.matched_stack = []
+        self.open_tag_counter = Counter()
+        self.preserve_whitespace_depth = 0
+        self.string_container_stack = []
+        self.subtree = None
+        self.subtree_depth = 0
+
+    builder: HTMLParserTreeBuilder
+    selector: Optional[_SimpleSelector]
+    original_encoding: Optional[_Encoding]
+    events: List[_Event]
+    current_data: List[str]
+
+    #: The tags that are currently open, outermost first.
+    tag_stack: List[Tag]
+
+    #: For each tag in `tag_stack`, whether or not it matched the selector.
+    matched_stack: List[bool]
+
+    open_tag_counter: CounterType[str]
+    preserve_whitespace_depth: int
+    string_container_stack: List[str]
+
+    #: While a tag matching the selector is open, its contents are
+    #: built into a real tree using this `BeautifulSoup` object.
+    subtree: Optional[BeautifulSoup]
+
+    #: The depth in `tag_stack` of the outermost tag in `subtree`.
+    subtree_depth: int
+
+    def drain(self) -> List[_Event]:
+        """Hand over the events generated so far."""
+        events = self.events
+        self.events = []
+        return events
+
+    def close(self) -> None:
+        """The document is over; close everything that's still open."""
+        self.endData()
+        while self.tag_stack:
+            self._pop()
+
+    def handle_starttag(
+        self,
+        name: str,
+        namespace: Optional[str],
+        nsprefix: Optional[str],
+        attrs: _RawAttributeValues,
+        sourceline: Optional[int] = None,
+        sourcepos: Optional[int] = None,
+        namespaces: Optional[Dict[str, str]] = None,
+    ) -> Tag:
+        self.endData()
+        tag: Optional[Tag]
+        if self.subtree is not None:
+            tag = self.subtree.handle_starttag(
+                name, namespace, nsprefix, attrs, sourceline, sourcepos
+            )
+            assert tag is not None
+        else:
+            tag = Tag(
+                None,
+                self.builder,
+                name,
+                namespace,
+                nsprefix,
+                attrs,
+                sourceline=sourceline,
+                sourcepos=sourcepos,
+            )
+
+        matched = self.selector is None or self.selector.match(tag, self.tag_stack)
+        if matched and self.selector is not None and self.subtree is None:
+            # Build this tag's contents into a tree, so they'll be
+            # available when the tag is closed.
+            self.subtree = self._new_subtree(tag)
+            self.subtree_depth = len(self.tag_stack)
+
+        self.tag_stack.append(tag)
+        self.matched_stack.append(matched)
+        self.open_tag_counter[name] += 1
+        if name in self.builder.preserve_whitespace_tags:
+            self.preserve_whitespace_depth += 1
+        if name in self.builder.string_containers:
+            self.string_container_stack.append(name)
+        if matched and self.want_start:
+            self.events.append(("start", tag))
+        return tag
+
+    def _new_subtree(self, tag: Tag) -> BeautifulSoup:
+        """Start building a tree, rooted at `tag`, out of the tags and
+        strings that show up until it's closed.
+        """
+        subtree = BeautifulSoup("", builder=self.builder)
+        subtree.reset()
+        subtree.pushTag(tag)
+        subtree._most_recent_element = tag
+        if self.preserve_whitespace_depth and not subtree.preserve_whitespace_tag_stack:
+            # The tag is inside a <pre> or similar, so its whitespace
+            # needs to be preserved even though the subtree doesn't
+            # contain the <pre>.
+            subtree.preserve_whitespace_tag_stack.append(tag)
+        return subtree
+
+    def handle_endtag(self, name: str, nsprefix: Optional[str] = None) -> None:
+        self.endData()
+        if not self.open_tag_counter.get(name):
+            # This tag isn't open, so there's nothing to close.
+            return
+        while self.tag_stack:
+            tag = self._pop()
+            if tag.name == name and tag.prefix == nsprefix:
+                break
+
+    def _pop(self) -> Tag:
+        """Close the innermost open tag."""
+        tag = self.tag_stack.pop()
+        matched = self.matched_stack.pop()
+        self.open_tag_counter[tag.name] -= 1
+        if tag.name in self.builder.preserve_whitespace_tags:
+            self.preserve_whitespace_depth -= 1
+        if tag.name in self.builder.string_containers:
+            self.string_container_stack.pop()
+
+        if self.subtree is not None:
+            self.subtree.popTag()
+            if len(self.tag_stack) == self.subtree_depth:
+                # The tag at the root of the subtree has been closed.
+                # It was never given a parent, so letting go of the
+                # BeautifulSoup object leaves it standing on its own.
+                self.subtree = None
+
+        if matched and self.want_end:
+            self.events.append(("end", tag))
+        return tag
+
+    def handle_data(self, data: str) -> None:
+        if self.subtree is not None:
+            self.subtree.handle_data(data)
+        elif self.want_text:
+            self.current_data.append(data)
+
+    def endData(self, containerClass: Optional[Type[NavigableString]] = None) -> None:
+        if self.subtree is not None:
+            self.subtree.endData(containerClass)
+            return
+        if not self.current_data:
+            return
+        current_data = "".join(self.current_data)
+        self.current_data = []
+
+        # Strings consisting entirely of whitespace are collapsed, as
+        # in BeautifulSoup.endData.
+        if not self.preserve_whitespace_depth and not current_data.strip(
+            BeautifulSoup.ASCII_SPACES
+        ):
+            if "\n" in current_data:
+                current_data = "\n"
+            else:
+                current_data = " "
+
+        container = containerClass or NavigableString
+        if self.string_container_stack and container is NavigableString:
+            container = self.builder.string_containers.get(
+                self.string_container_stack[-1], container
+            )
+        self.events.append(("text", container(current_data)))
+
+
+#: Tokens in the subset of CSS understood by `_SimpleSelector`.
+_SELECTOR_TOKEN: Pattern[str] = re.compile(
+    r"""
+    \s*(?P<comma>,)\s*
+  | \s*(?P<child>>)\s*
+  | (?P<descendant>\s+)
+  | (?P<type>\*|[\w-]+)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<class>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*
+      (?:(?P<op>[~^$*|]?=)\s*
+         (?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[\w-]+))\s*)?
+    \]
+    """,
+    re.X,
+)
+
+#: How each attribute selector operator compares an attribute value
+#: with the value in the selector.
+_ATTRIBUTE_OPERATORS: Dict[str, Callable[[str, str], bool]] = {
+    "=": lambda actual, wanted: actual == wanted,
+    "~=": lambda actual, wanted: wanted in actual.split(),
+    "^=": lambda actual, wanted: bool(wanted) and actual.startswith(wanted),
+    "$=": lambda actual, wanted: bool(wanted) and actual.endswith(wanted),
+    "*=": lambda actual, wanted: bool(wanted) and wanted in actual,
+    "|=": lambda actual, wanted: actual == wanted
+    or actual.startswith(wanted + "-"),
+}
+
+
+class _Compound(object):
+    """A compound selector such as ``div#main.results[data-x]``: a
+    set of conditions that must all hold for a single tag.
+    """
+
+    def __init__(self) -> None:
+        self.name = None
+        self.id = None
+        self.classes = []
+        self.attrs = []
+
+    name: Optional[str]
+    id: Optional[str]
+    classes: List[str]
+    attrs: List[Tuple[str, Optional[str], Optional[str]]]
+
+    def match(self, tag: Tag) -> bool:
+        if self.name is not None and tag.name != self.name:
+            return False
+        if self.id is not None and tag.get("id") != self.id:
+            return False
+        if self.classes:
+            classes = tag.get_attribute_list("class")
+            for cls in self.classes:
+                if cls not in classes:
+                    return False
+        for attr, op, wanted in self.attrs:
+            value = tag.get(attr)
+            if value is None:
+                return False
+            if op is None:
+                continue
+            if isinstance(value, list):
+                value = " ".join(value)
+            assert wanted is not None
+            if not _ATTRIBUTE_OPERATORS[op](value, wanted):
+                return False
+        return True
+
+
+class _SimpleSelector(object):
+    """A CSS selector that can be matched against a tag using nothing
+    but the tag and its ancestors, as is necessary when tags are
+    matched as soon as they're opened.
+
+    :param selector: A comma-separated list of selectors, made out of
+        type, universal, id, class and attribute selectors joined by
+        descendant and child combinators.
+    :raise ValueError: If the selector uses anything else.
+    """
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self.alternatives = []
+
+        compounds: List[_Compound] = []
+        combinators: List[str] = []
+        current: Optional[_Compound] = None
+        pos = 0
+        text = selector.strip()
+        while pos < len(text):
+            match = _SELECTOR_TOKEN.match(text, pos)
+            if match is None:
+                raise ValueError(
+                    "Can't match %r as tags are opened; only type, id, class and attribute selectors, and the descendant and child combinators, are supported."
+                    % selector
+                )
+            pos = match.end()
+            kind = match.lastgroup
+            if kind in ("comma", "child", "descendant"):
+                if current is None:
+                    raise ValueError("Malformed selector: %r" % selector)
+                compounds.append(current)
+                current = None
+                if kind == "comma":
+                    self.alternatives.append((compounds, combinators))
+                    compounds, combinators = [], []
+                else:
+                    combinators.append(">" if kind == "child" else " ")
+                continue
+
+            if current is None:
+                current = _Compound()
+            if match.group("type") is not None:
+                if current.name is not None or current.id or current.classes or current.attrs:
+                    raise ValueError("Malformed selector: %r" % selector)
+                type_ = match.group("type")
+                if type_ != "*":
+                    current.name = type_.lower()
+            elif match.group("id") is not None:
+                current.id = match.group("id")
+            elif match.group("class") is not None:
+                current.classes.append(match.group("class"))
+            else:
+                op = match.group("op")
+                wanted = None
+                if op is not None:
+                    wanted = next(
+                        v
+                        for v in (match.group("dq"), match.group("sq"), match.group("bare"))
+                        if v is not None
+                    )
+                current.attrs.append((match.group("attr").lower(), op, wanted))
+
+        if current is None:
+            raise ValueError("Malformed selector: %r" % selector)
+        compounds.append(current)
+        self.alternatives.append((compounds, combinators))
+
+    selector: str
+
+    #: Each alternative in the comma-separated list, as a list of
+    #: compound selectors and the combinators between them.
+    alternatives: List[Tuple[List[_Compound], List[str]]]
+
+    def match(self, tag: Tag, ancestors: List[Tag]) -> bool:
+        """Does `tag` match this selector?
+
+        :param tag: A tag that's just been opened.
+        :param ancestors: The tags it's inside, outermost first.
+        """
+        for compounds, combinators in self.alternatives:
+            if compounds[-1].match(tag) and self._match_ancestors(
+                compounds, combinators, len(compounds) - 2, ancestors, len(ancestors) - 1
+            ):
+                return True
+        return False
+
+    def _match_ancestors(
+        self,
+        compounds: List[_Compound],
+        combinators: List[str],
+        i: int,
+        ancestors: List[Tag],
+        j: int,
+    ) -> bool:
+        """Can compounds[:i+1] be matched by ancestors[:j+1], given that
+        compounds[i+1] matched the tag that follows ancestors[j]?
+        """
+        if i < 0:
+            return True
+        if combinators[i] == ">":
+            return (
+                j >= 0
+                and compounds[i].match(ancestors[j])
+                and self._match_ancestors(compounds, combinators, i - 1, ancestors, j - 1)
+            )
+        for k in range(j, -1, -1):
+            if compounds[i].match(ancestors[k]) and self._match_ancestors(
+                compounds, combinators, i - 1, ancestors, k - 1
+            ):
+                return True
+        return False
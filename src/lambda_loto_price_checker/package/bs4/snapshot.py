@@ -0,0 +1,532 @@
+"""Save a parsed document in a compact binary format, and restore it
+without parsing it again.
+
+Pickling a `BeautifulSoup` object stores the document as markup, so
+unpickling it costs a full parse. A snapshot stores the parse tree
+itself, as a handful of flat arrays:
+
+* A table of interned names: tag names, attribute names, namespace
+  prefixes and URIs, and the names of string classes. Each distinct
+  name is stored once and referred to by its index.
+* One entry per node, in document order, giving its kind (tag or
+  string) and two numbers whose meaning depends on the kind: for a
+  tag, its name and its number of children; for a string, its
+  content and its class.
+* One entry per tag, giving its namespace, prefix, source position
+  and attributes.
+* All distinct string content--text nodes and attribute
+  values--concatenated into a single UTF-8 blob, with a table of
+  offsets marking where each string ends.
+
+Restoring a snapshot walks those arrays once, creating `Tag` and
+`NavigableString` objects and linking them together directly, which
+is much faster than running the markup back through a parser.
+"""
+from __future__ import annotations
+
+# Use of this source code is governed by the MIT license.
+__license__ = "MIT"
+
+__all__ = [
+    "dump",
+    "dumps",
+    "load",
+    "loads",
+]
+
+from array import array
+import json
+import struct
+import sys
+from typing import (
+    Dict,
+    IO,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from bs4 import BeautifulSoup
+from bs4.builder import (
+    builder_registry,
+    TreeBuilder,
+)
+from bs4.builder._htmlparser import HTMLParserTreeBuilder
+from bs4.element import (
+    CData,
+    Comment,
+    Declaration,
+    Doctype,
+    NavigableString,
+    PageElement,
+    ProcessingInstruction,
+    RubyParenthesisString,
+    RubyTextString,
+    Script,
+    Stylesheet,
+    Tag,
+    TemplateString,
+    XMLProcessingInstruction,
+)
+from bs4.exceptions import FeatureNotFound
+
+#: The first bytes of every snapshot.
+MAGIC: bytes = b"BS4\x00snap"
+
+#: Incremented whenever the snapshot format changes incompatibly.
+VERSION: int = 2
+
+# The magic number, version, flags, the number of children of the
+# document itself, the indexes (in the name table) of the builder's
+# name, the original encoding and the builder's multi-valued
+# attributes, and the sizes of each of the sections that follow.
+_HEADER = struct.Struct("<8sHHIIIIIIIIIIII")
+
+# Bits in the header's flags.
+_IS_XML = 0x1
+_CONTAINS_REPLACEMENT_CHARACTERS = 0x2
+
+# The kinds of node.
+_TAG = 0
+_STRING = 1
+
+#: Stands in for None wherever a name or string index is expected.
+_NONE = 0xFFFFFFFF
+
+# Stands in for None as a source line or position.
+_NO_POSITION = -1
+
+# Attribute values are either strings or lists of strings.
+_ATTRIBUTE_STRING = 0
+_ATTRIBUTE_LIST = 1
+
+#: The string classes a snapshot knows how to restore. A string of
+#: any other class is restored as the closest of these it inherits from.
+STRING_CLASSES: Dict[str, Type[NavigableString]] = dict(
+    (cls.__name__, cls)
+    for cls in (
+        NavigableString,
+        CData,
+        Comment,
+        Declaration,
+        Doctype,
+        ProcessingInstruction,
+        XMLProcessingInstruction,
+        RubyParenthesisString,
+        RubyTextString,
+        Script,
+        Stylesheet,
+        TemplateString,
+    )
+)
+
+
+def _array(typecode: str, data: Union[bytes, memoryview, None] = None) -> array:
+    """Create an array whose items are stored little-endian in a
+    snapshot, whatever the platform's byte order.
+    """
+    a = array(typecode)
+    if data is not None:
+        a.frombytes(data)
+        if sys.byteorder != "little":
+            a.byteswap()
+    return a
+
+
+def _array_bytes(a: array) -> bytes:
+    if sys.byteorder != "little":
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a.tobytes()
+
+
+class _Writer(object):
+    """Flattens a parse tree into the arrays that make up a snapshot."""
+
+    def __init__(self) -> None:
+        self.names = []
+        self.name_index = {}
+        self.texts = []
+        self.text_index = {}
+        self.node_kinds = _array("B")
+        self.node_a = _array("I")
+        self.node_b = _array("I")
+        self.tag_info = _array("I")
+        self.tag_positions = _array("i")
+        self.attr_info = _array("I")
+        self.attr_values = _array("I")
+
+    names: List[str]
+    name_index: Dict[str, int]
+    texts: List[str]
+    text_index: Dict[str, int]
+
+    #: One item per node: _TAG or _STRING.
+    node_kinds: array
+
+    #: One item per node: a tag's name, or a string's content.
+    node_a: array
+
+    #: One item per node: a tag's number of children, or a
+    #: string's class name.
+    node_b: array
+
+    #: Four items per tag: namespace, prefix, first attribute,
+    #: number of attributes.
+    tag_info: array
+
+    #: Two items per tag: source line and source position.
+    tag_positions: array
+
+    #: Four items per attribute: name, kind of value, first value,
+    #: number of values.
+    attr_info: array
+
+    #: The indexes of attribute values in the text table.
+    attr_values: array
+
+    def name(self, name: Optional[str]) -> int:
+        """Find (or add) a name in the table of interned names."""
+        if name is None:
+            return _NONE
+        index = self.name_index.get(name)
+        if index is None:
+            index = self.name_index[name] = len(self.names)
+            self.names.append(name)
+        return index
+
+    def text(self, value: str) -> int:
+        """Find (or add) a string in the text table. Strings are
+        interned too, since documents tend to repeat the same
+        whitespace, attribute values and bits of text many times.
+        """
+        index = self.text_index.get(value)
+        if index is None:
+            index = self.text_index[value] = len(self.texts)
+            self.texts.append(value)
+        return index
+
+    def string_class_name(self, cls: Type[NavigableString]) -> str:
+        for base in cls.__mro__:
+            if STRING_CLASSES.get(base.__name__) is base:
+                return base.__name__
+        return NavigableString.__name__
+
+    def add(self, element: PageElement) -> None:
+        """Add an element, but not its children, to the arrays."""
+        if isinstance(element, Tag):
+            self.node_kinds.append(_TAG)
+            self.node_a.append(self.name(element.name))
+            self.node_b.append(len(element.contents))
+            self.tag_info.append(self.name(element.namespace))
+            self.tag_info.append(self.name(element.prefix))
+            self.tag_info.append(len(self.attr_info) // 4)
+            self.tag_info.append(len(element.attrs))
+            for position in (element.sourceline, element.sourcepos):
+                self.tag_positions.append(
+                    _NO_POSITION if position is None else position
+                )
+            for key, value in element.attrs.items():
+                self.attr_info.append(self.name(key))
+                if isinstance(value, list):
+                    self.attr_info.append(_ATTRIBUTE_LIST)
+                    values = value
+                else:
+                    self.attr_info.append(_ATTRIBUTE_STRING)
+                    values = [value]
+                self.attr_info.append(len(self.attr_values))
+                self.attr_info.append(len(values))
+                for v in values:
+                    self.attr_values.append(self.text(str(v)))
+        else:
+            assert isinstance(element, NavigableString)
+            self.node_kinds.append(_STRING)
+            self.node_a.append(self.text(str(element)))
+            self.node_b.append(self.name(self.string_class_name(type(element))))
+
+    def write(self, soup: BeautifulSoup) -> bytes:
+        for element in soup.descendants:
+            self.add(element)
+        # The document's own children are stored in the header.
+        root_children = len(soup.contents)
+
+        flags = 0
+        if soup.is_xml:
+            flags |= _IS_XML
+        if getattr(soup, "contains_replacement_characters", False):
+            flags |= _CONTAINS_REPLACEMENT_CHARACTERS
+        builder_name = soup.builder.NAME if soup.builder is not None else ""
+        self.name(builder_name)
+        self.name(soup.original_encoding or "")
+        multi_valued = self.name(self.multi_valued_attributes(soup.builder))
+
+        name_offsets, name_blob = self._blob(self.names)
+        text_offsets, text_blob = self._blob(self.texts)
+
+        header = _HEADER.pack(
+            MAGIC,
+            VERSION,
+            flags,
+            root_children,
+            self.name(builder_name),
+            self.name(soup.original_encoding or ""),
+            multi_valued,
+            len(self.names),
+            len(self.texts),
+            len(self.node_kinds),
+            len(self.tag_positions) // 2,
+            len(self.attr_info) // 4,
+            len(self.attr_values),
+            len(name_blob),
+            len(text_blob),
+        )
+        return b"".join(
+            [
+                header,
+                _array_bytes(name_offsets),
+                _array_bytes(text_offsets),
+                _array_bytes(self.node_a),
+                _array_bytes(self.node_b),
+                _array_bytes(self.tag_info),
+                _array_bytes(self.tag_positions),
+                _array_bytes(self.attr_info),
+                _array_bytes(self.attr_values),
+                self.node_kinds.tobytes(),
+                name_blob,
+                text_blob,
+            ]
+        )
+
+    def multi_valued_attributes(
+        self, builder: Optional[TreeBuilder]
+    ) -> Optional[str]:
+        """Describe the builder's multi-valued attributes, if they
+        aren't its class's defaults, so the restored document treats
+        attributes the same way the original did.
+        """
+        if builder is None:
+            return None
+        cdata_list_attributes = builder.cdata_list_attributes
+        if cdata_list_attributes is builder.DEFAULT_CDATA_LIST_ATTRIBUTES:
+            return None
+        if cdata_list_attributes is None:
+            return json.dumps(None)
+        return json.dumps(
+            dict(
+                (tag, sorted(attributes))
+                for tag, attributes in cdata_list_attributes.items()
+            ),
+            sort_keys=True,
+        )
+
+    def _blob(self, strings: List[str]) -> Tuple[array, bytes]:
+        """Concatenate strings into one blob, recording the
+        (character) offset where each one ends.
+        """
+        offsets = _array("I")
+        end = 0
+        for s in strings:
+            end += len(s)
+            offsets.append(end)
+        return offsets, "".join(strings).encode("utf8", "surrogatepass")
+
+
+def dumps(soup: BeautifulSoup) -> bytes:
+    """Save a parsed document as a snapshot.
+
+    :param soup: A `BeautifulSoup` object.
+    :return: A bytestring that can be passed into `loads` to restore
+        the document.
+    """
+    return _Writer().write(soup)
+
+
+def dump(soup: BeautifulSoup, fp: IO[bytes]) -> None:
+    """Save a parsed document as a snapshot, written to a binary
+    filehandle.
+    """
+    fp.write(dumps(soup))
+
+
+def _split(offsets: array, blob: Union[bytes, memoryview]) -> List[str]:
+    """Reverse _Writer._blob."""
+    text = str(blob, "utf8", "surrogatepass")
+    strings = []
+    start = 0
+    for end in offsets:
+        strings.append(text[start:end])
+        start = end
+    return strings
+
+
+def loads(
+    data: Union[bytes, bytearray, memoryview],
+    builder: Optional[Union[TreeBuilder, Type[TreeBuilder]]] = None,
+) -> BeautifulSoup:
+    """Restore a document from a snapshot created with `dumps`.
+
+    :param data: The snapshot.
+    :param builder: The `TreeBuilder` to associate with the restored
+        document. By default, a new instance of the kind of
+        `TreeBuilder` that parsed the original document is used,
+        with its default settings except for the multi-valued
+        attributes, which are those of the original builder. The
+        same goes if a `TreeBuilder` subclass is passed in; an
+        instance is used as it is.
+    :raise ValueError: If ``data`` isn't a snapshot this version of
+        Beautiful Soup can read.
+    :raise FeatureNotFound: If the snapshot is of an XML document and
+        no XML tree builder is installed.
+    """
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise ValueError("Data is too short to be a Beautiful Soup snapshot.")
+    (
+        magic,
+        version,
+        flags,
+        root_children,
+        builder_name_index,
+        encoding_index,
+        multi_valued_index,
+        n_names,
+        n_texts,
+        n_nodes,
+        n_tags,
+        n_attrs,
+        n_attr_values,
+        name_blob_size,
+        text_blob_size,
+    ) = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Data is not a Beautiful Soup snapshot.")
+    if version != VERSION:
+        raise ValueError("Unsupported Beautiful Soup snapshot version: %d" % version)
+
+    pos = _HEADER.size
+
+    def section(size: int) -> memoryview:
+        nonlocal pos
+        if pos + size > len(view):
+            raise ValueError("Beautiful Soup snapshot is truncated.")
+        data = view[pos : pos + size]
+        pos += size
+        return data
+
+    name_offsets = _array("I", section(n_names * 4))
+    text_offsets = _array("I", section(n_texts * 4))
+    node_a = _array("I", section(n_nodes * 4))
+    node_b = _array("I", section(n_nodes * 4))
+    tag_info = _array("I", section(n_tags * 16))
+    tag_positions = _array("i", section(n_tags * 8))
+    attr_info = _array("I", section(n_attrs * 16))
+    attr_values = _array("I", section(n_attr_values * 4))
+    node_kinds = section(n_nodes)
+    names = _split(name_offsets, section(name_blob_size))
+    texts = _split(text_offsets, section(text_blob_size))
+
+    if builder is None:
+        builder_name = names[builder_name_index]
+        builder_class = builder_registry.lookup(builder_name) if builder_name else None
+        if builder_class is None:
+            if flags & _IS_XML:
+                raise FeatureNotFound(
+                    "Couldn't find the tree builder this document was parsed with (%s). Do you need to install a parser library?"
+                    % builder_name
+                )
+            builder_class = HTMLParserTreeBuilder
+        builder = builder_class
+    if isinstance(builder, type) and multi_valued_index != _NONE:
+        multi_valued: Optional[Dict[str, Set[str]]] = None
+        described = json.loads(names[multi_valued_index])
+        if described is not None:
+            multi_valued = dict(
+                (tag, set(attributes)) for tag, attributes in described.items()
+            )
+        builder = builder(multi_valued_attributes=multi_valued)
+    soup = BeautifulSoup("", builder=builder)
+    soup.original_encoding = names[encoding_index] or None
+    soup.contains_replacement_characters = bool(
+        flags & _CONTAINS_REPLACEMENT_CHARACTERS
+    )
+    tree_builder = soup.builder
+    attribute_dict_class = tree_builder.attribute_dict_class
+    attribute_value_list_class = tree_builder.attribute_value_list_class
+
+    string_classes: Dict[int, Type[NavigableString]] = {}
+    stack: List[Tuple[Tag, int]] = []
+    parent: Tag = soup
+    remaining = root_children
+    # As in a parsed tree, the BeautifulSoup object itself is not part
+    # of the next_element/previous_element chain.
+    previous: Optional[PageElement] = None
+    tag_i = 0
+    element: PageElement
+    for i in range(n_nodes):
+        while remaining == 0:
+            parent, remaining = stack.pop()
+        remaining -= 1
+
+        if node_kinds[i] == _TAG:
+            namespace, prefix, first_attr, n_tag_attrs = tag_info[
+                tag_i * 4 : tag_i * 4 + 4
+            ]
+            sourceline, sourcepos = tag_positions[tag_i * 2 : tag_i * 2 + 2]
+            tag_i += 1
+            attrs = attribute_dict_class()
+            for a in range(first_attr * 4, (first_attr + n_tag_attrs) * 4, 4):
+                key, kind, first_value, n_values = attr_info[a : a + 4]
+                values = [
+                    texts[v] for v in attr_values[first_value : first_value + n_values]
+                ]
+                if kind == _ATTRIBUTE_LIST:
+                    attrs[names[key]] = attribute_value_list_class(values)
+                else:
+                    attrs[names[key]] = values[0]
+            element = Tag(
+                soup,
+                tree_builder,
+                names[node_a[i]],
+                None if namespace == _NONE else names[namespace],
+                None if prefix == _NONE else names[prefix],
+                attrs,
+                sourceline=None if sourceline == _NO_POSITION else sourceline,
+                sourcepos=None if sourcepos == _NO_POSITION else sourcepos,
+            )
+        else:
+            cls = string_classes.get(node_b[i])
+            if cls is None:
+                cls = string_classes[node_b[i]] = STRING_CLASSES.get(
+                    names[node_b[i]], NavigableString
+                )
+            element = cls(texts[node_a[i]])
+
+        # Link the new element into the tree.
+        element.parent = parent
+        if previous is not None:
+            element.previous_element = previous
+            previous.next_element = element
+        if parent.contents:
+            last_child = parent.contents[-1]
+            last_child.next_sibling = element
+            element.previous_sibling = last_child
+        parent.contents.append(element)
+        previous = element
+
+        if node_kinds[i] == _TAG and node_b[i]:
+            # The next node will be this tag's first child.
+            stack.append((parent, remaining))
+            parent = element  # type:ignore
+            remaining = node_b[i]
+    return soup
+
+
+def load(
+    fp: IO[bytes],
+    builder: Optional[Union[TreeBuilder, Type[TreeBuilder]]] = None,
+) -> BeautifulSoup:
+    """Restore a document from a snapshot read from a binary filehandle."""
+    return loads(fp.read(), builder)
@@ -0,0 +1,86 @@
+"""Tests of parallel extraction in bs4.batch."""
+
+import pytest
+
+from bs4.batch import (
+    extract,
+    extract_many,
+)
+
+
+def title_and_link_count(soup):
+    # Functions used as extraction specs need to be picklable.
+    return (soup.title.string, len(soup.find_all("a")))
+
+
+def fail(soup):
+    raise RuntimeError("Extraction failed.")
+
+
+def document(i):
+    return (
+        "<html><head><title>Page %d</title></head><body>"
+        '<p class="price">%d.00</p>%s</body></html>' % (i, i, "<a>x</a>" * i)
+    ).encode("utf8")
+
+
+class TestExtract(object):
+    def test_selector(self):
+        assert extract(document(2), "p.price") == ["2.00"]
+        assert extract(document(2), "a") == ["x", "x"]
+
+    def test_selector_dict(self):
+        assert extract(document(1), {"title": "title", "price": ".price"}) == {
+            "title": ["Page 1"],
+            "price": ["1.00"],
+        }
+
+    def test_function(self):
+        assert extract(document(3), title_and_link_count) == ("Page 3", 3)
+
+    def test_bad_spec(self):
+        with pytest.raises(TypeError):
+            extract(document(1), 1)
+
+
+class TestExtractMany(object):
+    def items(self, n):
+        specs = ["p.price", {"title": "title"}, title_and_link_count]
+        return [(document(i), specs[i % 3]) for i in range(n)]
+
+    def expect(self, n):
+        return [extract(markup, spec) for markup, spec in self.items(n)]
+
+    @pytest.mark.parametrize(
+        "max_workers,chunksize,max_pending",
+        [(0, 1, None), (1, 1, None), (2, 3, None), (2, 1, 1), (2, 100, None)],
+    )
+    def test_results_in_order(self, max_workers, chunksize, max_pending):
+        results = extract_many(
+            iter(self.items(10)),
+            max_workers=max_workers,
+            chunksize=chunksize,
+            max_pending=max_pending,
+        )
+        assert list(results) == self.expect(10)
+
+    def test_no_items(self):
+        assert list(extract_many([], max_workers=2)) == []
+
+    def test_constructor_arguments(self):
+        [result] = extract_many(
+            [(b"<p>\xe9</p>", "p")], max_workers=1, from_encoding="latin-1"
+        )
+        assert result == ["\xe9"]
+
+    def test_worker_exception(self):
+        results = extract_many(
+            [(document(1), "p"), (document(2), fail)], max_workers=1, chunksize=1
+        )
+        assert next(results) == ["1.00"]
+        with pytest.raises(RuntimeError):
+            next(results)
+
+    def test_bad_chunksize(self):
+        with pytest.raises(ValueError):
+            list(extract_many([], chunksize=0))
@@ -405,6 +405,28 @@ class TestCSSSelectors(SoupTest):
         assert len(els) == 1
         assert els[0].string == "Some text"
 
+    def test_nth_child_without_whitespace(self):
+        # Positions count tags only, up to and including the last child.
+        soup = BeautifulSoup(
+            "<ul><li>1</li><li>2</li><b>3</b><li>4</li><li>5</li></ul>", "html.parser"
+        )
+
+        def texts(selector):
+            return [x.string for x in soup.select(selector)]
+
+        assert texts("li:nth-child(2n+1)") == ["1", "5"]
+        assert texts(":nth-child(n+3)") == ["3", "4", "5"]
+        assert texts("ul > :nth-child(-n+2)") == ["1", "2"]
+        assert texts("ul :nth-last-child(2n+1)") == ["1", "3", "5"]
+        assert texts("li:nth-of-type(n+3)") == ["4", "5"]
+        assert texts("li:nth-last-of-type(-n+1)") == ["5"]
+        assert texts("ul :last-child") == ["5"]
+        assert soup.select("ul:nth-child(1)") == [soup.ul]
+
+        # Changing the tree changes the positions.
+        soup.ul.insert(0, soup.new_tag("li", string="0"))
+        assert texts("li:nth-child(2n+1)") == ["0", "2", "4"]
+
     def test_id_child_selector_nth_of_type(self):
         self.assert_css_selects("#inner > p:nth-of-type(2)", ["p1"])
 
@@ -501,6 +523,128 @@ class TestCSSSelectors(SoupTest):
         for element in soup.find_all(class_=["c1", "c2"]):
             assert element in selected
 
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_select_with_required_ancestors(self, indexed, monkeypatch):
+        # Selectors that require certain ancestors must find the same
+        # tags however deeply nested they are, and must take
+        # into account ancestors above the tag being searched.
+        markup = (
+            '<div class="results" id="r"><section><section>'
+            '<span class="amount">1</span></section>'
+            '<p><span class="amount">2</span></p></section></div>'
+            '<section><span class="amount">3</span></section>'
+            '<p class="results"><span>4</span></p>'
+        )
+        soup = BeautifulSoup(markup, "html.parser")
+        index = soup.css.index() if indexed else None
+        # Use the index however few tags there are to search.
+        monkeypatch.setattr("soupsieve.css_match.INDEX_MIN_SPAN", 0)
+
+        def texts(tag, selector):
+            return [x.string for x in tag.select(selector, index=index)]
+
+        assert texts(soup, "div.results span.amount") == ["1", "2"]
+        assert texts(soup, "#r > section p > span") == ["2"]
+        assert texts(soup, ".results span") == ["1", "2", "4"]
+        assert texts(soup, "div p span, section > span") == ["1", "2", "3"]
+        assert texts(soup, "section ~ p span") == ["2", "4"]
+        assert texts(soup, "div ~ section span") == ["3"]
+        assert texts(soup, "div section + p span") == ["2"]
+        assert texts(soup, "DIV.results span") == ["1", "2"]
+        assert texts(soup, "div.other span") == []
+        assert texts(soup, "div span:not(.amount), p span") == ["2", "4"]
+
+        inner = soup.section.section
+        assert texts(inner, "div.results span") == ["1"]
+        assert texts(inner, "#r section span") == ["1"]
+        assert texts(soup.div, "section span.amount") == ["1", "2"]
+        assert texts(soup.div, "div section span, section p span") == ["1", "2"]
+        assert texts(soup, "span.amount") == ["1", "2", "3"]
+        assert len(soup.select("div.results span.amount", limit=1, index=index)) == 1
+
+    def test_select_sees_changes_to_the_tree(self):
+        # Without an index, every change to the tree shows up in the
+        # results, including changes made to a tag's attributes and
+        # name in place.
+        soup = BeautifulSoup(
+            '<div id="main"><p class="a">1</p><p>2</p></div><p class="a">3</p>',
+            "html.parser",
+        )
+
+        def texts(selector, tag=soup):
+            return [x.string for x in tag.select(selector)]
+
+        assert texts(".a") == ["1", "3"]
+        assert texts("#main p") == ["1", "2"]
+        assert texts("p", soup.div) == ["1", "2"]
+
+        soup.find_all("p")[1]["class"] = "a"
+        assert texts(".a") == ["1", "2", "3"]
+        del soup.p["class"]
+        assert texts(".a") == ["2", "3"]
+        soup.p.attrs["class"] = ["b"]
+        assert texts(".b") == ["1"]
+        soup.p["class"].append("c")
+        assert texts("#main .c") == ["1"]
+        soup.p.name = "span"
+        assert texts("#main p") == ["2"]
+        assert texts("span.c") == ["1"]
+
+        new_tag = soup.new_tag("p", attrs={"class": "a"}, string="4")
+        soup.div.insert(0, new_tag)
+        assert texts("#main .a") == ["4", "2"]
+        soup.div.p.string = "5"
+        assert texts("#main .a") == ["5", "2"]
+
+        div = soup.div.extract()
+        assert texts("p") == ["3"]
+        assert texts("#main") == []
+        assert texts(".a", div) == ["5", "2"]
+        soup.append(div)
+        assert texts("#main .a, p") == ["3", "5", "2"]
+
+    def test_select_with_index(self, monkeypatch):
+        soup = BeautifulSoup(
+            '<div id="main"><p class="a">1</p><p>2</p></div><p class="a">3</p>'
+            "<table><tr><td>x</td><td class='price'>4</td></tr>"
+            "<tr><td class='price'>5</td></tr></table>",
+            "html.parser",
+        )
+        index = soup.css.index()
+        monkeypatch.setattr("soupsieve.css_match.INDEX_MIN_SPAN", 0)
+
+        def texts(selector, tag=soup):
+            return [x.string for x in tag.select(selector, index=index)]
+
+        assert texts(".a") == ["1", "3"]
+        assert texts("#main p") == ["1", "2"]
+        assert texts("p, .a, td.price") == ["1", "2", "3", "4", "5"]
+        assert texts("p", soup.div) == ["1", "2"]
+        assert texts("td, .price", soup.tr) == ["x", "4"]
+        assert [
+            row.select_one("td.price", index=index).string
+            for row in soup.select("tr", index=index)
+        ] == ["4", "5"]
+        assert soup.css.select_many({"a": ".a", "td": "tr td"}, index=index) == {
+            "a": soup.select(".a"),
+            "td": soup.select("tr td"),
+        }
+
+        # One index serves the whole document, whichever tag it was
+        # made from.
+        assert soup.td.css.index().spans == index.spans
+
+        # The index doesn't notice changes to the tree until it's
+        # rebuilt.
+        soup.div.insert(0, soup.new_tag("p", attrs={"class": "a"}, string="0"))
+        assert texts("#main .a") == ["1"]
+        index.rebuild()
+        assert texts("#main .a") == ["0", "1"]
+
+        # An index of another document isn't used.
+        other = BeautifulSoup('<p class="a">other</p>', "html.parser")
+        assert texts(".a", other) == ["other"]
+
     def test_closest(self):
         inner = self._soup.find("div", id="inner")
         closest = inner.css.closest("div[id=main]")
@@ -512,6 +656,88 @@ class TestCSSSelectors(SoupTest):
         assert inner.css.match("div[id=main]") is False
         assert main.css.match("div[id=main]") is True
 
+    def test_select_many(self):
+        soup = BeautifulSoup(
+            '<div id="results"><p class="jackpot">$1</p><p class="date">Mon</p>'
+            '<p class="jackpot">$2</p></div><p class="date">Tue</p>'
+            "<ul><li>a</li><li>b</li><li>c</li></ul>",
+            "html.parser",
+        )
+        selects = {
+            "jackpot": ".jackpot",
+            "dates": "#results ~ p.date, div > .date",
+            "items": "li:nth-child(odd)",
+            "first_p": "p:first-child",
+            "missing": ":not(*)",
+        }
+        results = soup.css.select_many(selects)
+        assert list(results) == list(selects)
+        for name, select in selects.items():
+            assert isinstance(results[name], ResultSet)
+            assert results[name] == soup.select(select)
+
+        # A limit can be given for all selectors, or for some.
+        results = soup.css.select_many(selects, limit=1)
+        for name, select in selects.items():
+            assert results[name] == soup.select(select, limit=1)
+
+        results = soup.css.select_many(selects, limit={"items": 1, "dates": 1})
+        assert [x.string for x in results["items"]] == ["a"]
+        assert [x.string for x in results["dates"]] == ["Mon"]
+        assert [x.string for x in results["jackpot"]] == ["$1", "$2"]
+
+        # The search is scoped to the tag.
+        results = soup.ul.css.select_many({"li": "li", "p": "p"})
+        assert len(results["li"]) == 3
+        assert results["p"] == []
+
+        # Precompiled selectors work too.
+        compiled = soup.css.compile("li")
+        assert soup.css.select_many({"li": compiled})["li"] == soup.select("li")
+
+    def test_selector_cache(self):
+        import pickle
+        import soupsieve
+
+        soup = BeautifulSoup('<p class="a">1</p><p class="b">2</p>', "html.parser")
+        cache = soupsieve.cache
+        maxsize = cache.maxsize
+        soupsieve.purge()
+        try:
+            # Selectors compiled ahead of time are used by Beautiful Soup.
+            soupsieve.prewarm(["p.a", "p.b"])
+            assert cache.info() == (0, 2, 0, maxsize, 2)
+            assert soup.select_one("p.a").string == "1"
+            assert soup.css.select("p.b")[0].string == "2"
+            assert cache.info().hits == 2
+
+            # The least recently used selector is evicted when the
+            # cache is full.
+            cache.maxsize = 2
+            soup.select("p")
+            info = cache.info()
+            assert (info.misses, info.evictions, info.currsize) == (3, 1, 2)
+
+            # The cache can be saved and restored.
+            data = cache.dumps()
+            soupsieve.purge()
+            assert cache.loads(data) == 2
+            soup.select("p")
+            soup.select("p.b")
+            assert cache.info() == (2, 0, 0, 2, 2)
+
+            # Data from another version is ignored.
+            format, version, entries = pickle.loads(data)
+            soupsieve.purge()
+            assert cache.loads(pickle.dumps((format, "0.0", entries))) == 0
+            assert cache.info().currsize == 0
+
+            with pytest.raises(ValueError):
+                cache.maxsize = -1
+        finally:
+            cache.maxsize = maxsize
+            soupsieve.purge()
+
     def test_iselect(self):
         gen = self._soup.css.iselect("h2")
         assert isinstance(gen, types.GeneratorType)
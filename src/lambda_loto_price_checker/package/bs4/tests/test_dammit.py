@@ -7,6 +7,7 @@ from bs4 import BeautifulSoup
 from bs4.dammit import (
     EntitySubstitution,
     EncodingDetector,
+    IncrementalUnicodeDammit,
     UnicodeDammit,
 )
 
@@ -123,7 +124,7 @@ class TestEncodingDetector(object):
         logging.disable(logging.WARNING)
         try:
 
-            def noop(str):
+            def noop(str, *args):
                 return None
 
             bs4.dammit._chardet_dammit = noop
@@ -144,6 +145,15 @@ class TestEncodingDetector(object):
         assert "<a>áé</a>" == dammit.unicode_markup
         assert "utf-16le" == dammit.original_encoding
 
+    def test_incremental_byte_order_mark_split_across_chunks(self):
+        data = b"\xff\xfe<\x00a\x00>\x00\xe1\x00\xe9\x00<\x00/\x00a\x00>\x00"
+        dammit = IncrementalUnicodeDammit()
+        decoded = "".join(dammit.decode(data[i : i + 1]) for i in range(len(data)))
+        decoded += dammit.decode(b"", final=True)
+        assert "<a>áé</a>" == decoded
+        assert "utf-16le" == dammit.original_encoding
+        assert not dammit.contains_replacement_characters
+
     def test_known_definite_versus_user_encodings(self):
         # The known_definite_encodings are used before sniffing the
         # byte-order mark; the user_encodings are used afterwards.
@@ -238,6 +248,21 @@ class TestEncodingDetector(object):
             output = UnicodeDammit.detwingle(input)
             assert output == input
 
+    @pytest.mark.parametrize(
+        "input,expect",
+        [
+            # Bytes that are undefined in Windows-1252 are left alone.
+            (b"a\x81b\x9d", b"a\x81b\x9d"),
+            # So is a broken multibyte character, along with the
+            # bytes that would have been part of it.
+            (b"\xe2\x98<p>\x93", b"\xe2\x98<p>\xe2\x80\x9c"),
+            (b"\x93\x94\xc3", b"\xe2\x80\x9c\xe2\x80\x9d\xc3"),
+            (b"\xff\xfe\xf0\x9f\x98", b"\xff\xc3\xbe\xf0\x9f\x98"),
+        ],
+    )
+    def test_detwingle_invalid_utf8(self, input, expect):
+        assert UnicodeDammit.detwingle(input) == expect
+
     def test_find_declared_encoding(self):
         # Test our ability to find a declared encoding inside an
         # XML or HTML document.
@@ -279,6 +304,113 @@ class TestEncodingDetector(object):
         assert m(b" " + xml_bytes, search_entire_document=True) == "iso-8859-1"
         assert m(b"a" + xml_bytes, search_entire_document=True) is None
 
+    def test_statistical_detection_uses_a_sniff_window(self, monkeypatch):
+        class Detector:
+            def __init__(self):
+                self.sizes = []
+
+            def detect(self, data):
+                # This detector is only confident once it's seen
+                # 100 kilobytes.
+                self.sizes.append(len(data))
+                confidence = 0.9 if len(data) >= 100 * 1024 else 0.5
+                return {"encoding": "euc-jp", "confidence": confidence}
+
+        detector = Detector()
+        monkeypatch.setattr(bs4.dammit, "chardet_module", detector)
+
+        # A small document is passed to the detector whole.
+        list(EncodingDetector(b"<p>" * 10).encodings)
+        assert detector.sizes == [30]
+
+        # A large one is sniffed in escalating windows, each cut
+        # just before a tag, until the detector is confident.
+        detector.sizes = []
+        markup = b"<p>" * 300000
+        list(EncodingDetector(markup).encodings)
+        assert detector.sizes == [65535, 262143]
+
+        # A guess of ASCII doesn't count if there's non-ASCII data
+        # outside the window.
+        class ASCIIDetector:
+            def detect(self, data):
+                detector.sizes.append(len(data))
+                return {"encoding": "ascii", "confidence": 1.0}
+
+        monkeypatch.setattr(bs4.dammit, "chardet_module", ASCIIDetector())
+        detector.sizes = []
+        list(EncodingDetector(markup + b"\xe9").encodings)
+        assert detector.sizes == [65535, 262143, 900001]
+
+        # Setting SNIFF_SIZE to None turns windowing off.
+        monkeypatch.setattr(EncodingDetector, "SNIFF_SIZE", None)
+        detector.sizes = []
+        list(EncodingDetector(markup).encodings)
+        assert detector.sizes == [900000]
+
+    @pytest.mark.parametrize(
+        "content_type,expect",
+        [
+            (None, None),
+            ("text/html", None),
+            ("text/html; charset=UTF-8", "utf-8"),
+            ('text/html;charset="Shift_JIS"', "shift_jis"),
+            ("text/html; Charset = 'euc-jp'; foo=bar", "euc-jp"),
+            ("application/json", None),
+        ],
+    )
+    def test_content_type_charset(self, content_type, expect):
+        assert EncodingDetector.content_type_charset(content_type) == expect
+
+    def test_known_encodings(self):
+        m = EncodingDetector.known_encodings
+        html = b'<html><head><meta charset="windows-1252"></head></html>'
+
+        # The byte-order mark takes precedence over the Content-Type
+        # header, which takes precedence over the document itself.
+        assert m(b"\xef\xbb\xbf" + html, "text/html; charset=euc-jp") == [
+            "utf-8",
+            "euc-jp",
+            "windows-1252",
+        ]
+        assert m(html, "text/html; charset=windows-1252") == ["windows-1252"]
+        assert m(html, "text/html") == ["windows-1252"]
+        assert m(html, is_html=False) == []
+        assert m(b"<p>No clues.</p>") == []
+
+        # Only the start of the document is searched.
+        spacer = b" " * EncodingDetector.KNOWN_ENCODING_SEARCH_SIZE
+        assert m(spacer + html) == []
+
+    def test_statistical_detection_runs_at_most_once(self, monkeypatch):
+        calls = []
+
+        def detect(markup, *args):
+            calls.append(markup)
+            return None
+
+        monkeypatch.setattr(bs4.dammit, "_chardet_dammit", detect)
+
+        # No encoding works, so the encodings are tried twice--once
+        # strictly, and once with character replacement--but the
+        # document is only sent to the detector once.
+        data = b"<p>\xe9\x80</p>"
+        dammit = UnicodeDammit(data, is_html=True, exclude_encodings=["windows-1252"])
+        assert dammit.contains_replacement_characters
+        assert len(calls) == 1
+
+        # If a known encoding works, the detector never runs.
+        calls.clear()
+        markup = "<p>Caf\xe9</p>".encode("euc-jp")
+        known = EncodingDetector.known_encodings(markup, "text/html; charset=euc-jp")
+        dammit = UnicodeDammit(markup, known_definite_encodings=known, is_html=True)
+        assert dammit.original_encoding == "euc-jp"
+        assert calls == []
+
+        soup = BeautifulSoup(markup, "html.parser", from_encoding=known[0])
+        assert soup.p.string == "Caf\xe9"
+        assert calls == []
+
 
 class TestEntitySubstitution(object):
     """Standalone tests of the EntitySubstitution class."""
@@ -295,10 +427,22 @@ class TestEntitySubstitution(object):
             # MS smart quotes are a common source of frustration, so we
             # give them a special test.
             ("‘’foo“”", "&lsquo;&rsquo;foo&ldquo;&rdquo;"),
+            # Strings with nothing to substitute come back unchanged.
+            ("", ""),
+            ("plain text", "plain text"),
+            ("a < b & c", "a &lt; b &amp; c"),
+            # A character that's the start of a longer string with its
+            # own entity is only substituted on its own when the
+            # longer string isn't there.
+            ("\u2267\u0338 \u2267", "&ngeqq; &geqq;"),
+            ("<\u20d2<", "&nvlt;&lt;"),
         ],
     )
     def test_substitute_html(self, original, substituted):
         assert self.sub.substitute_html(original) == substituted
+        assert self.sub.CHARACTER_TO_HTML_ENTITY_WITH_AMPERSAND_RE.sub(
+            self.sub._substitute_html_entity, original
+        ) == substituted
 
     def test_html5_entity(self):
         for entity, u in (
@@ -8,6 +8,7 @@ from bs4.builder._htmlparser import (
     BeautifulSoupHTMLParser,
     HTMLParserTreeBuilder,
 )
+from bs4 import BeautifulSoup
 from bs4.exceptions import ParserRejectedMarkup
 from typing import Any
 from . import HTMLTreeBuilderSmokeTest
@@ -159,3 +160,65 @@ class TestHTMLParserTreeBuilder(HTMLTreeBuilderSmokeTest):
         markup = "<p>a &nosuchentity; b</p>"
         soup = self.soup(markup)
         assert "<p>a &amp;nosuchentity b</p>" == soup.p.decode()
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64, 4096])
+    def test_incremental_matches_one_shot(self, chunk_size):
+        # Feeding a bytestring in a chunk at a time, split anywhere,
+        # builds the same tree as parsing it all at once.
+        markup = (
+            '<html><head><meta charset="iso-8859-1"></head><body>'
+            + '<p class="a">Caf\xe9 &#147;x&#148; <b>bold</b><br></p>\n' * 100
+            + "</body></html>"
+        ).encode("latin-1")
+        expect = self.soup(markup)
+
+        soup = BeautifulSoup.incremental(builder=self.default_builder)
+        for i in range(0, len(markup), chunk_size):
+            soup.feed(markup[i : i + chunk_size])
+        soup.close()
+        assert soup.decode() == expect.decode()
+        assert soup.original_encoding == "iso-8859-1"
+        assert soup.declared_html_encoding == "iso-8859-1"
+        assert soup.builder.soup is None
+
+    def test_incremental_multibyte_character_split_across_chunks(self):
+        markup = "<p>Sacr\N{LATIN SMALL LETTER E WITH ACUTE} \N{SNOWMAN}</p>".encode(
+            "utf8"
+        )
+        soup = BeautifulSoup.incremental(builder=self.default_builder)
+        for i in range(len(markup)):
+            soup.feed(markup[i : i + 1])
+        soup.close()
+        assert soup.p.string == "Sacr\N{LATIN SMALL LETTER E WITH ACUTE} \N{SNOWMAN}"
+        assert soup.original_encoding == "utf-8"
+
+    def test_incremental_unicode_chunks(self):
+        soup = BeautifulSoup.incremental(builder=self.default_builder)
+        for chunk in ("<p>Some ", "<b>bo", "ld</b> te", "xt"):
+            soup.feed(chunk)
+        soup.close()
+        assert soup.decode() == "<p>Some <b>bold</b> text</p>"
+        assert soup.original_encoding is None
+
+    def test_incremental_bad_bytes_after_encoding_chosen(self):
+        # Once an encoding has been chosen, bytes that don't fit it
+        # are replaced rather than starting over.
+        soup = BeautifulSoup.incremental(builder=self.default_builder)
+        soup.feed(b"<p>" + b"a" * 4096 + b"</p>")
+        soup.feed(b"<p>\xff</p>")
+        soup.close()
+        assert soup.original_encoding == "utf-8"
+        assert soup.contains_replacement_characters is True
+        assert soup.find_all("p")[1].string == "\N{REPLACEMENT CHARACTER}"
+
+    def test_incremental_misuse(self):
+        with pytest.raises(ValueError):
+            self.soup("<p>").feed("<b>")
+
+        soup = BeautifulSoup.incremental(builder=self.default_builder)
+        soup.feed(b"<p>")
+        with pytest.raises(TypeError):
+            soup.feed("<b>")
+        soup.close()
+        with pytest.raises(ValueError):
+            soup.close()
@@ -0,0 +1,164 @@
+"""Tests of the tree-less event stream in bs4.iterparse."""
+
+import io
+import pytest
+
+from bs4 import BeautifulSoup
+from bs4.element import (
+    Comment,
+    NavigableString,
+    Script,
+    Tag,
+)
+from bs4.exceptions import ParserRejectedMarkup
+from bs4.iterparse import iterparse
+
+
+class TestIterparse(object):
+    markup = (
+        '<html><body><div class="results" id="main">'
+        '<span class="amount">$1<b>00</b></span>'
+        "<pre>  x  </pre> <!--c--><script>a<b</script>"
+        "<p>one<p>two</div><br><img src=x></body></html>"
+    )
+
+    def summarize(self, events):
+        return [
+            (event, element.name if isinstance(element, Tag) else str(element))
+            for event, element in events
+        ]
+
+    def test_events_describe_the_same_document_as_a_tree(self):
+        events = list(iterparse(self.markup))
+
+        # The strings are the same strings, with the same classes,
+        # that would show up in a tree.
+        soup = BeautifulSoup(self.markup, "html.parser")
+        expect_strings = [x for x in soup.descendants if isinstance(x, str)]
+        strings = [element for event, element in events if event == "text"]
+        assert strings == expect_strings
+        assert [type(x) for x in strings] == [type(x) for x in expect_strings]
+        assert isinstance(strings[-4], Comment)
+        assert isinstance(strings[-3], Script)
+
+        # Every tag is opened and closed, in document order, even
+        # when the markup doesn't close it explicitly.
+        expect_tags = [x.name for x in soup.descendants if isinstance(x, Tag)]
+        assert [
+            element.name for event, element in events if event == "start"
+        ] == expect_tags
+        assert self.summarize(events)[-9:] == [
+            ("end", "p"),
+            ("end", "p"),
+            ("end", "div"),
+            ("start", "br"),
+            ("end", "br"),
+            ("start", "img"),
+            ("end", "img"),
+            ("end", "body"),
+            ("end", "html"),
+        ]
+
+    def test_elements_are_not_connected(self):
+        for event, element in iterparse(self.markup):
+            assert element.parent is None
+            assert element.next_element is None
+            if isinstance(element, Tag):
+                assert element.contents == []
+
+    def test_attributes(self):
+        [(event, div)] = iterparse(self.markup, events=["start"], select="div")
+        assert div["class"] == ["results"]
+        assert div["id"] == "main"
+
+    def test_event_filter(self):
+        events = list(iterparse("<p>a<b>b</b></p>", events=["end"]))
+        assert self.summarize(events) == [("end", "b"), ("end", "p")]
+
+        with pytest.raises(ValueError):
+            list(iterparse("<p>", events=["start-ns"]))
+
+    @pytest.mark.parametrize(
+        "selector,expect",
+        [
+            ("span", ["span"]),
+            (".amount", ["span"]),
+            ("#main", ["div"]),
+            ("div.results span.amount", ["span"]),
+            ("div > span", ["span"]),
+            ("body > span", []),
+            ("body span", ["span"]),
+            ("html > body > div#main.results > span b", ["b"]),
+            ("[src]", ["img"]),
+            ("img[src=x]", ["img"]),
+            ("[class~=results]", ["div"]),
+            ('[class^="res"]', ["div"]),
+            ("[class$=lts]", ["div"]),
+            ("[class*='sul']", ["div"]),
+            ("b, img", ["b", "img"]),
+            ("*", ["html", "body", "div", "span", "b", "pre", "script", "p", "p", "br", "img"]),
+        ],
+    )
+    def test_select(self, selector, expect):
+        events = list(iterparse(self.markup, events=["start"], select=selector))
+        assert [tag.name for event, tag in events] == expect
+
+        # The results are the same as from a tree.
+        soup = BeautifulSoup(self.markup, "html.parser")
+        assert [tag.name for tag in soup.select(selector)] == expect
+
+    def test_selected_tags_have_complete_subtrees(self):
+        results = [
+            (event, tag.get_text())
+            for event, tag in iterparse(self.markup, events=["end"], select="span.amount, p")
+        ]
+        assert results == [("end", "$100"), ("end", "two"), ("end", "onetwo")]
+
+        [(event, span)] = iterparse(self.markup, events=["end"], select="span")
+        assert span.parent is None
+        assert span.select_one("b").string == "00"
+        assert span.decode() == '<span class="amount">$1<b>00</b></span>'
+
+    def test_subtree_inside_pre_preserves_whitespace(self):
+        [(event, b)] = iterparse("<pre><b>  \n  </b></pre>", events=["end"], select="b")
+        assert b.string == "  \n  "
+
+    def test_unsupported_selector(self):
+        for selector in ("p:first-child", "p + p", "p ~ p", "", "p,", "> p"):
+            with pytest.raises(ValueError):
+                list(iterparse("<p>", select=selector))
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+    def test_chunked_input(self, chunk_size):
+        markup = '<p class="x">Caf\xe9 \N{SNOWMAN}</p>'
+        expect = self.summarize(iterparse(markup))
+        encoded = markup.encode("utf8")
+
+        assert self.summarize(iterparse(encoded, chunk_size=chunk_size)) == expect
+        assert (
+            self.summarize(iterparse(io.BytesIO(encoded), chunk_size=chunk_size))
+            == expect
+        )
+        chunks = [encoded[i : i + chunk_size] for i in range(0, len(encoded), chunk_size)]
+        assert self.summarize(iterparse(iter(chunks))) == expect
+
+    def test_encoding(self):
+        markup = '<meta charset="windows-1252"><p>&#147;Caf\xe9&#148;</p>'.encode(
+            "windows-1252"
+        )
+        strings = [x for event, x in iterparse(markup, events=["text"])]
+        assert strings == ["\N{LEFT DOUBLE QUOTATION MARK}Caf\xe9\N{RIGHT DOUBLE QUOTATION MARK}"]
+        assert all(isinstance(x, NavigableString) for x in strings)
+
+    def test_stopping_early(self):
+        # Parsing only goes as far as the consumer asks.
+        def chunks():
+            yield "<p>first</p>"
+            raise AssertionError("Should not have read this far.")
+
+        events = iterparse(chunks(), events=["text"])
+        assert next(events) == ("text", "first")
+
+    def test_rejected_markup(self):
+        with pytest.raises(ParserRejectedMarkup):
+            list(iterparse(b"<![UNKNOWN[]]>"))
@@ -0,0 +1,162 @@
+"""Tests of the binary snapshot format in bs4.snapshot."""
+
+import io
+import pytest
+
+from bs4 import BeautifulSoup
+from bs4 import snapshot
+from bs4.element import (
+    Comment,
+    Doctype,
+    NavigableString,
+    Script,
+    Stylesheet,
+    Tag,
+)
+
+
+class TestSnapshot(object):
+    markup = (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        "<script>if (a < b) {}</script><style>p {}</style></head>"
+        '<body><p class="a b" id="x" data-empty="">Caf\xe9 \N{SNOWMAN}'
+        "<!-- a comment --><br/><a href=\"/?a=1&amp;b=2\">link</a></p>"
+        "<pre>  preformatted\n</pre>\n\n<p>again</p></body></html>"
+    )
+
+    def roundtrip(self, soup):
+        return snapshot.loads(snapshot.dumps(soup))
+
+    def test_roundtrip(self):
+        soup = BeautifulSoup(self.markup.encode("utf8"), "html.parser")
+        restored = self.roundtrip(soup)
+        assert restored.decode() == soup.decode()
+        assert restored.original_encoding == soup.original_encoding
+        assert restored.builder.NAME == soup.builder.NAME
+
+        # String classes and multi-valued attributes survive.
+        assert isinstance(restored.contents[0], Doctype)
+        assert isinstance(restored.script.string, Script)
+        assert isinstance(restored.style.string, Stylesheet)
+        assert isinstance(restored.find(string=lambda x: "comment" in x), Comment)
+        assert restored.p["class"] == ["a", "b"]
+        assert restored.p["data-empty"] == ""
+        assert restored.pre.string == "  preformatted\n"
+
+        # The restored tree is fully functional.
+        assert restored.select_one("p#x > a")["href"] == "/?a=1&b=2"
+        assert restored.find_all("p")[1].string == "again"
+        assert restored.meta.sourceline == soup.meta.sourceline
+        assert restored.meta.sourcepos == soup.meta.sourcepos
+
+    def attrs(self, soup):
+        return [
+            (tag.name, dict(tag.attrs), [type(v) for v in tag.attrs.values()])
+            for tag in soup.find_all(True)
+        ]
+
+    @pytest.mark.parametrize(
+        "multi_valued_attributes",
+        [None, {"*": {"class", "rel"}}, {"p": {"id"}}],
+    )
+    def test_multi_valued_attributes_survive(self, multi_valued_attributes):
+        soup = BeautifulSoup(
+            self.markup,
+            "html.parser",
+            multi_valued_attributes=multi_valued_attributes,
+        )
+        restored = self.roundtrip(soup)
+        assert self.attrs(restored) == self.attrs(soup)
+        assert restored.decode() == soup.decode()
+        assert (
+            restored.builder.cdata_list_attributes
+            == soup.builder.cdata_list_attributes
+        )
+
+        # New tags made through the restored document are treated the
+        # same way too.
+        attrs = {"class": "a b", "id": "c d"}
+        assert restored.new_tag("p", attrs=attrs).attrs == soup.new_tag(
+            "p", attrs=attrs
+        ).attrs
+
+    def test_default_multi_valued_attributes(self):
+        soup = BeautifulSoup(self.markup, "html.parser")
+        restored = self.roundtrip(soup)
+        assert self.attrs(restored) == self.attrs(soup)
+        assert (
+            restored.builder.cdata_list_attributes
+            is restored.builder.DEFAULT_CDATA_LIST_ATTRIBUTES
+        )
+
+    def test_tree_is_linked_like_a_parsed_tree(self):
+        soup = BeautifulSoup(self.markup, "html.parser")
+        restored = self.roundtrip(soup)
+
+        def links(tree):
+            nodes = [tree] + list(tree.descendants)
+            index = {id(x): i for i, x in enumerate(nodes)}
+
+            def pos(x):
+                return None if x is None else index[id(x)]
+
+            return [
+                (
+                    pos(x.parent),
+                    pos(x.next_element),
+                    pos(x.previous_element),
+                    pos(x.next_sibling),
+                    pos(x.previous_sibling),
+                )
+                for x in nodes
+            ]
+
+        assert links(restored) == links(soup)
+
+        # Modifying the restored tree works.
+        restored.p.a.extract()
+        restored.body.append(restored.new_tag("footer"))
+        assert restored.body.contents[-1].name == "footer"
+        assert restored.find("a") is None
+
+    def test_empty_document(self):
+        soup = BeautifulSoup("", "html.parser")
+        restored = self.roundtrip(soup)
+        assert restored.contents == []
+        assert restored.decode() == ""
+
+    def test_unknown_string_subclass_falls_back(self):
+        class Custom(NavigableString):
+            pass
+
+        soup = BeautifulSoup("<p></p>", "html.parser")
+        soup.p.append(Custom("x"))
+        restored = self.roundtrip(soup)
+        assert type(restored.p.string) is NavigableString
+        assert restored.p.string == "x"
+
+    def test_dump_and_load(self):
+        soup = BeautifulSoup(self.markup, "html.parser")
+        fp = io.BytesIO()
+        snapshot.dump(soup, fp)
+        fp.seek(0)
+        restored = snapshot.load(fp)
+        assert restored.decode() == soup.decode()
+
+    def test_interned_strings(self):
+        # Repeated content is stored once.
+        one = snapshot.dumps(BeautifulSoup("<p>repeated text</p>", "html.parser"))
+        many = snapshot.dumps(
+            BeautifulSoup("<p>repeated text</p>" * 10, "html.parser")
+        )
+        assert many.count(b"repeated text") == 1
+        assert one.count(b"repeated text") == 1
+
+    def test_bad_data(self):
+        data = snapshot.dumps(BeautifulSoup(self.markup, "html.parser"))
+        with pytest.raises(ValueError):
+            snapshot.loads(b"not a snapshot")
+        with pytest.raises(ValueError):
+            snapshot.loads(b"X" + data[1:])
+        with pytest.raises(ValueError):
+            snapshot.loads(data[:-10])
@@ -566,7 +566,7 @@ class TestEncodingConversion(SoupTest):
         logging.disable(logging.WARNING)
         try:
 
-            def noop(str):
+            def noop(str, *args):
                 return None
 
             # Disable chardet, which will realize that the ASCII is ASCII.
@@ -1,4 +1,5 @@
 import warnings
+from bs4 import BeautifulSoup
 from bs4.element import (
     Comment,
     NavigableString,
@@ -124,6 +125,83 @@ class TestTag(SoupTest):
         assert soup.a.get_text(",") == "a,r, , t "
         assert soup.a.get_text(",", strip=True) == "a,r,t"
 
+    def test_stripped_strings(self):
+        soup = self.soup("<a> a <b>\n</b><!-- c --> <r> t </r></a>")
+        assert list(soup.a.stripped_strings) == ["a", "t"]
+        assert list(soup.a.b.stripped_strings) == []
+
+    def test_get_text_cache(self):
+        soup = self.soup("<a>a<b>r</b><i> t </i></a>")
+        a = soup.a
+        assert a.get_text(cache=True) == "ar t "
+        assert a.get_text(",", strip=True, cache=True) == "a,r,t"
+        assert a.get_text(types=[NavigableString], cache=True) == "ar t "
+
+        # Cached text is reused...
+        def fail(*args):
+            raise AssertionError("The tree should not have been walked.")
+
+        a._collect_strings = fail
+        assert a.get_text(cache=True) == "ar t "
+        del a._collect_strings
+
+        # ...until the tree beneath the tag is modified.
+        a.b.string = "R"
+        assert a.get_text(cache=True) == "aR t "
+        assert soup.get_text(cache=True) == "aR t "
+        a.i.extract()
+        assert a.get_text(cache=True) == "aR"
+        assert soup.get_text(cache=True) == "aR"
+        a.b.insert_after("!")
+        assert soup.get_text(cache=True) == "aR!"
+        a.b.replace_with("B")
+        assert soup.get_text(cache=True) == "aB!"
+        soup.a.smooth()
+        assert soup.get_text(",", cache=True) == "aB!"
+        assert soup.get_text(",", cache=False) == "aB!"
+
+    def test_get_text_cache_nested(self):
+        soup = self.soup("<a><b><c>one</c></b><d>two</d></a>")
+        assert soup.c.get_text(cache=True) == "one"
+        assert soup.a.get_text(cache=True) == "onetwo"
+
+        # Changing the tree clears the cache of every tag above the
+        # change, even when one of them has no text cached...
+        soup.d.append("!")
+        assert soup.a._text_cache is None
+        assert soup.c._text_cache is not None
+        soup.c.append("!")
+        assert soup.c.get_text(cache=True) == "one!"
+        assert soup.a.get_text(cache=True) == "one!two!"
+
+        # ...including tags added after the text was cached.
+        soup.d.append(soup.new_tag("e"))
+        assert soup.a.get_text(cache=True) == "one!two!"
+        soup.e.append("three")
+        assert soup.a.get_text(cache=True) == "one!two!three"
+
+    def test_get_text_cache_not_walked_without_cache(self):
+        soup = self.soup("<a><b>one</b></a><p>two</p>")
+        assert soup.b.get_text(cache=True) == "one"
+        soup.p.append("!")
+
+        # Only a tag inside cached text makes a change look at the
+        # tags above it.
+        soup.b.append("!")
+        assert not soup.a._under_text_cache
+        soup.a.append("!")
+        assert soup.get_text(cache=True) == "one!!two!"
+
+    def test_get_text_cache_while_parsing(self):
+        soup = BeautifulSoup.incremental("html.parser")
+        soup.feed("<p>one<b>")
+        assert soup.get_text(cache=True) == "one"
+        soup.feed("two</b></p><p>three<br>")
+        assert soup.get_text(cache=True) == "onetwothree"
+        soup.feed("four")
+        soup.close()
+        assert soup.get_text(cache=True) == "onetwothreefour"
+
     def test_get_text_ignores_special_string_containers(self):
         soup = self.soup("foo<!--IGNORE-->bar")
         assert soup.get_text() == "foobar"
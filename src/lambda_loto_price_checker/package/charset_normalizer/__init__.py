@@ -23,7 +23,8 @@ from __future__ import annotations
 
 import logging
 
-from .api import from_bytes, from_fp, from_path, is_binary
+from .api import StreamingDetector, from_bytes, from_fp, from_path, is_binary
+from .cache import DetectionCache, set_detection_cache
 from .legacy import detect
 from .models import CharsetMatch, CharsetMatches
 from .utils import set_logging_handler
@@ -34,6 +35,9 @@ __all__ = (
     "from_path",
     "from_bytes",
     "is_binary",
+    "StreamingDetector",
+    "DetectionCache",
+    "set_detection_cache",
     "detect",
     "CharsetMatch",
     "CharsetMatches",
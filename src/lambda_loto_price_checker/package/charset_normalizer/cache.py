@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from os import PathLike
+from typing import Any
+
+from .models import CharsetMatch, CharsetMatches
+from .utils import identify_sig_or_bom, should_strip_sig_or_bom
+
+_installed_cache: DetectionCache | None = None
+
+
+class DetectionCache:
+    """
+    Bounded (least recently used) store of detection results, keyed by a hash of the whole payload,
+    its length and the detection parameters. Byte-identical payloads get back the same CharsetMatches
+    without running the detection again.
+
+    Entries hold the detection outcome only, never the payload, so they can be saved to a JSON file
+    and loaded back by another process.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        path: str | bytes | PathLike | None = None,  # type: ignore[type-arg]
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("DetectionCache maxsize must be at least 1.")
+
+        self.maxsize: int = maxsize
+        self.path = path
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.time_saved: float = 0.0
+
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of lookups answered by the cache, from 0. to 1.
+        """
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def key(sequences: bytes | bytearray, *parameters: Any) -> str:
+        digest = blake2b(repr(parameters).encode("utf_8"), digest_size=16)
+        digest.update(sequences)
+
+        return f"{len(sequences)}:{digest.hexdigest()}"
+
+    def get(self, key: str, sequences: bytes | bytearray) -> CharsetMatches | None:
+        """
+        Rebuild the matches stored under key upon the given payload, or return None.
+        """
+        with self._lock:
+            entry: dict[str, Any] | None = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.time_saved += entry["elapsed"]
+
+        matches: CharsetMatches = CharsetMatches()
+        # Already in order, no need to sort them again.
+        matches._results = [
+            _load_match(sequences, match) for match in entry["matches"]
+        ]
+
+        return matches
+
+    def put(self, key: str, results: CharsetMatches, elapsed: float) -> None:
+        """
+        Store the matches of a detection that took elapsed seconds.
+        """
+        entry: dict[str, Any] = {
+            "elapsed": elapsed,
+            "matches": [_dump_match(match) for match in results],
+        }
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            self.time_saved = 0.0
+
+    def save(self, path: str | bytes | PathLike | None = None) -> None:  # type: ignore[type-arg]
+        """
+        Write the entries to a JSON file, path default to the one given at init.
+        """
+        path = path if path is not None else self.path
+
+        if path is None:
+            raise ValueError("No path given to save the DetectionCache to.")
+
+        with self._lock:
+            entries = list(self._entries.items())
+
+        temporary_path = os.fsdecode(path) + ".tmp"
+
+        with open(temporary_path, "w", encoding="utf_8") as fp:
+            json.dump({"maxsize": self.maxsize, "entries": entries}, fp)
+
+        os.replace(temporary_path, path)
+
+    def load(self, path: str | bytes | PathLike) -> None:  # type: ignore[type-arg]
+        """
+        Add the entries of a JSON file written by save().
+        """
+        with open(path, encoding="utf_8") as fp:
+            document: dict[str, Any] = json.load(fp)
+
+        with self._lock:
+            for key, entry in document["entries"]:
+                self._entries[key] = entry
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+def _dump_match(match: CharsetMatch) -> dict[str, Any]:
+    return {
+        "encoding": match.encoding,
+        "chaos": match.chaos,
+        "bom": match.bom,
+        "languages": match._languages,
+        "preemptive_declaration": match._preemptive_declaration,
+        "submatch": [_dump_match(leave) for leave in match.submatch],
+    }
+
+
+def _load_match(sequences: bytes | bytearray, entry: dict[str, Any]) -> CharsetMatch:
+    decoded_payload: str | None = None
+
+    # from_bytes hands over the payload decoded without its SIG/BOM.
+    if entry["bom"] and should_strip_sig_or_bom(entry["encoding"]):
+        _, sig_payload = identify_sig_or_bom(sequences)
+        decoded_payload = str(sequences[len(sig_payload) :], entry["encoding"])
+
+    match = CharsetMatch(
+        sequences,  # type: ignore[arg-type]
+        entry["encoding"],
+        entry["chaos"],
+        entry["bom"],
+        [(language, ratio) for language, ratio in entry["languages"]],
+        decoded_payload,
+        preemptive_declaration=entry["preemptive_declaration"],
+    )
+
+    for leave in entry["submatch"]:
+        match.add_submatch(_load_match(sequences, leave))
+
+    return match
+
+
+def set_detection_cache(cache: DetectionCache | None) -> None:
+    """
+    Make every detection (from_bytes, from_fp, from_path, detect...) consult the given cache unless told otherwise.
+    Give None to stop.
+    """
+    global _installed_cache
+    _installed_cache = cache
+
+
+def get_detection_cache() -> DetectionCache | None:
+    return _installed_cache
@@ -39,6 +39,9 @@ class CharsetMatch:
 
         self._preemptive_declaration: str | None = preemptive_declaration
 
+        # Set when the payload is only the beginning of what was detected, see StreamingDetector.
+        self._multi_byte_usage: float | None = None
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, CharsetMatch):
             if isinstance(other, str):
@@ -70,6 +73,8 @@ class CharsetMatch:
 
     @property
     def multi_byte_usage(self) -> float:
+        if self._multi_byte_usage is not None:
+            return self._multi_byte_usage
         return 1.0 - (len(str(self)) / len(self.raw))
 
     def __str__(self) -> str:
@@ -191,7 +196,9 @@ class CharsetMatch:
         if self._unicode_ranges is not None:
             return self._unicode_ranges
         # list detected ranges
-        detected_ranges: list[str | None] = [unicode_range(char) for char in str(self)]
+        detected_ranges: list[str | None] = [
+            unicode_range(char) for char in set(str(self))
+        ]
         # filter and sort
         self._unicode_ranges = sorted(list({r for r in detected_ranges if r}))
         return self._unicode_ranges
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import codecs
+from pathlib import Path
+
+import pytest
+
+from charset_normalizer import DetectionCache, from_bytes, set_detection_cache
+from charset_normalizer.models import CharsetMatches
+
+PAYLOADS = [
+    ("Привет мир, это проверка кодировки текста на русском. " * 50).encode("cp1251"),
+    ("안녕하세요 세계, 이것은 한국어 테스트 문장입니다. " * 50).encode("euc_kr"),
+    codecs.BOM_UTF8 + "Grüße aus Köln, naïve café.".encode("utf_8"),
+]
+
+
+def _summary(matches: CharsetMatches) -> list[tuple[str, float, str, list[str]]]:
+    return [
+        (
+            match.encoding,
+            match.chaos,
+            str(match),
+            [leave.encoding for leave in match.submatch],
+        )
+        for match in matches
+    ]
+
+
+class TestDetectionCache:
+    def test_hits_and_misses(self) -> None:
+        cache = DetectionCache()
+        payload = PAYLOADS[0]
+
+        detected = from_bytes(payload, cache=cache)
+        assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+        assert cache.time_saved == 0.0
+
+        cached = from_bytes(payload, cache=cache)
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+        assert cache.time_saved > 0.0
+        assert cache.hit_rate == 0.5
+        assert _summary(cached) == _summary(detected)
+
+        # Other parameters, another detection.
+        from_bytes(payload, threshold=0.3, cache=cache)
+        assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+    def test_bypassed(self) -> None:
+        cache = DetectionCache()
+        from_bytes(PAYLOADS[0], cache=cache, max_candidates=3)
+        from_bytes(PAYLOADS[0], cache=cache, explain=True)
+        assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+    def test_least_recently_used(self) -> None:
+        cache = DetectionCache(maxsize=2)
+        for payload in PAYLOADS:
+            from_bytes(payload, cache=cache)
+        assert len(cache) == 2
+
+        from_bytes(PAYLOADS[0], cache=cache)
+        assert (cache.hits, cache.misses) == (0, 4)
+        from_bytes(PAYLOADS[2], cache=cache)
+        assert (cache.hits, cache.misses) == (1, 4)
+
+    def test_installed(self) -> None:
+        cache = DetectionCache()
+        set_detection_cache(cache)
+        try:
+            from_bytes(PAYLOADS[1])
+            from_bytes(PAYLOADS[1])
+        finally:
+            set_detection_cache(None)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        from_bytes(PAYLOADS[1])
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        path = tmp_path / "detections.json"
+        cache = DetectionCache(path=path)
+        detected = [_summary(from_bytes(payload, cache=cache)) for payload in PAYLOADS]
+        cache.save()
+        assert path.exists()
+
+        loaded = DetectionCache(path=path)
+        assert len(loaded) == len(PAYLOADS)
+        assert [
+            _summary(from_bytes(payload, cache=loaded)) for payload in PAYLOADS
+        ] == detected
+        assert (loaded.hits, loaded.misses) == (len(PAYLOADS), 0)
+
+    def test_save_without_path(self) -> None:
+        with pytest.raises(ValueError):
+            DetectionCache().save()
+
+    def test_maxsize(self) -> None:
+        with pytest.raises(ValueError):
+            DetectionCache(maxsize=0)
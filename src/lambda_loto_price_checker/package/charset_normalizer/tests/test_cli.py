@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from charset_normalizer.cli import cli_detect
+
+CONTENTS = {
+    "russian.txt": (
+        "Привет мир, это проверка кодировки текста на русском. " * 50
+    ).encode("cp1251"),
+    "korean.txt": ("안녕하세요 세계, 이것은 한국어 테스트 문장입니다. " * 50).encode(
+        "euc_kr"
+    ),
+    "english.txt": b"The quick brown fox jumps over the lazy dog.\n" * 50,
+}
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> dict[str, Path]:
+    paths = {}
+    for name, content in CONTENTS.items():
+        paths[name] = tmp_path / name
+        paths[name].write_bytes(content)
+    return paths
+
+
+def _lines(output: str) -> dict[str, dict]:  # type: ignore[type-arg]
+    results = [json.loads(line) for line in output.splitlines()]
+    return {Path(result["path"]).name: result for result in results}
+
+
+class TestBatch:
+    @pytest.mark.parametrize("jobs", ["0", "2"])
+    def test_files(
+        self, files: dict[str, Path], jobs: str, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        paths = [str(path) for path in files.values()]
+        assert cli_detect(["--batch", "-j", jobs, "--chunk-size", "1", *paths]) == 0
+
+        out, err = capsys.readouterr()
+        results = _lines(out)
+        assert {name: result["encoding"] for name, result in results.items()} == {
+            "russian.txt": "cp1251",
+            "korean.txt": "cp949",
+            "english.txt": "ascii",
+        }
+        assert "3 file(s)" in err
+        assert "0 error(s)" in err
+
+    def test_glob_and_files_from(
+        self, files: dict[str, Path], tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        listing = tmp_path / "listing"
+        listing.write_text(str(files["korean.txt"]) + "\n\n", encoding="utf_8")
+
+        pattern = str(tmp_path / "*ss*.txt")
+        argv = ["--batch", "-j", "0", pattern, "--files-from", str(listing)]
+        assert cli_detect(argv) == 0
+
+        assert set(_lines(capsys.readouterr()[0])) == {"russian.txt", "korean.txt"}
+
+    def test_missing_file(
+        self, files: dict[str, Path], tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        missing = str(tmp_path / "missing.txt")
+        argv = ["--batch", "-j", "0", missing, str(files["english.txt"])]
+        assert cli_detect(argv) == 2
+
+        out, err = capsys.readouterr()
+        assert set(_lines(out)) == {"english.txt"}
+        assert "missing.txt" in err
+        assert "1 error(s)" in err
+
+    def test_normalize(
+        self, files: dict[str, Path], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        assert cli_detect(["--batch", "-j", "0", "-n", str(files["russian.txt"])]) == 0
+
+        result = _lines(capsys.readouterr()[0])["russian.txt"]
+        text = CONTENTS["russian.txt"].decode("cp1251")
+        assert Path(result["unicode_path"]).read_bytes() == text.encode("utf_8")
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--batch"],
+            ["--batch", "-t", "2", "x"],
+            ["--batch", "--chunk-size", "0", "x"],
+        ],
+    )
+    def test_usage_errors(
+        self, argv: list[str], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        assert cli_detect(argv) == 1
+        assert capsys.readouterr()[1]
+
+    def test_help(self, capsys: pytest.CaptureFixture[str]) -> None:
+        with pytest.raises(SystemExit) as exit_info:
+            cli_detect(["--help"])
+        assert exit_info.value.code == 0
+        assert "--batch" in capsys.readouterr()[0]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from charset_normalizer import StreamingDetector, from_bytes
+
+PAYLOADS = {
+    "euc_kr": ("안녕하세요 세계, 이것은 한국어 테스트 문장입니다. " * 4000).encode("euc_kr"),
+    "gb2312": ("你好世界，这是一个中文测试句子。" * 8000).encode("gb2312"),
+    "cp1251": ("Привет мир, это проверка кодировки текста на русском. " * 4000).encode(
+        "cp1251"
+    ),
+    "utf_8": ("Grüße aus Köln — naïve café ✓ " * 8000).encode("utf_8"),
+    # Past the head, nothing but ASCII tells the code pages apart.
+    "ascii, euc_kr": b"x" * 100000
+    + ("안녕하세요 세계, 이것은 한국어 테스트 문장입니다. " * 2000).encode("euc_kr"),
+    "ascii, cp1252": b"a" * 200000
+    + ("Ceci est un café déjà très élégant, naïve façon. " * 2000).encode("cp1252"),
+}
+
+
+def _detect(payload: bytes, stop: bool) -> str | None:
+    detector = StreamingDetector()
+    for start in range(0, len(payload), 8192):
+        detector.feed(payload[start : start + 8192])
+        if stop and detector.done:
+            break
+    best = detector.result().best()
+    return best.encoding if best else None
+
+
+class TestStreamingDetector:
+    @pytest.mark.parametrize("name", list(PAYLOADS))
+    @pytest.mark.parametrize("stop", [False, True])
+    def test_same_as_from_bytes(self, name: str, stop: bool) -> None:
+        payload = PAYLOADS[name]
+        assert len(payload) > StreamingDetector.HEAD_SIZE
+        best = from_bytes(payload).best()
+        assert best is not None
+        assert _detect(payload, stop) == best.encoding
+
+    def test_small_payload(self) -> None:
+        payload = "Ceci est un café déjà très élégant. ".encode("cp1252")
+        assert _detect(payload, False) == from_bytes(payload).best().encoding  # type: ignore[union-attr]
+
+    def test_not_done_on_ascii(self) -> None:
+        ascii = b"The quick brown fox jumps over the lazy dog.\n" * 5000
+        payload = ascii + "Ceci est un café déjà très élégant. ".encode("cp1252") * 50000
+        detector = StreamingDetector()
+        for start in range(0, len(payload), 8192):
+            detector.feed(payload[start : start + 8192])
+            if detector.done:
+                break
+        assert detector.done
+        assert start > len(ascii)
+
+    def test_feed_after_result(self) -> None:
+        detector = StreamingDetector()
+        detector.feed(b"hello")
+        detector.result()
+        with pytest.raises(ValueError):
+            detector.feed(b"world")
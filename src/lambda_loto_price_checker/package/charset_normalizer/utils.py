@@ -3,6 +3,8 @@ from __future__ import annotations
 import importlib
 import logging
 import unicodedata
+from array import array
+from bisect import bisect_right
 from codecs import IncrementalDecoder
 from encodings.aliases import aliases
 from functools import lru_cache
@@ -23,13 +25,64 @@ from .constant import (
 )
 
 
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
-def is_accentuated(character: str) -> bool:
+# Character classes, as stored in the low 16 bits of the per-codepoint table read by the predicates below.
+# The high bits hold the position of its Unicode range in _UNICODE_RANGE_NAMES, plus one (zero if none).
+_CLASSIFIED: int = 1 << 0
+_ACCENTUATED: int = 1 << 1
+_LATIN: int = 1 << 2
+_PUNCTUATION: int = 1 << 3
+_SYMBOL: int = 1 << 4
+_EMOTICON: int = 1 << 5
+_SEPARATOR: int = 1 << 6
+_CASE_VARIABLE: int = 1 << 7
+_CJK: int = 1 << 8
+_HIRAGANA: int = 1 << 9
+_KATAKANA: int = 1 << 10
+_HANGUL: int = 1 << 11
+_THAI: int = 1 << 12
+_ARABIC: int = 1 << 13
+_ARABIC_ISOLATED_FORM: int = 1 << 14
+_UNPRINTABLE: int = 1 << 15
+
+_UNICODE_RANGE_NAMES: list[str] = sorted(
+    UNICODE_RANGES_COMBINED,
+    key=lambda range_name: UNICODE_RANGES_COMBINED[range_name].start,
+)
+_UNICODE_RANGE_STARTS: list[int] = [
+    UNICODE_RANGES_COMBINED[range_name].start for range_name in _UNICODE_RANGE_NAMES
+]
+_UNICODE_RANGE_STOPS: list[int] = [
+    UNICODE_RANGES_COMBINED[range_name].stop for range_name in _UNICODE_RANGE_NAMES
+]
+
+# Classes of the Basic Multilingual Plane, filled as characters show up. 4 bytes per codepoint, 256 KiB.
+_BMP_CHARACTER_CLASSES: array[int] = array("I", bytes(4 * 0x10000))
+
+
+def _unicode_range_index(character_ord: int) -> int:
+    i: int = bisect_right(_UNICODE_RANGE_STARTS, character_ord) - 1
+
+    if i >= 0 and character_ord < _UNICODE_RANGE_STOPS[i]:
+        return i + 1
+
+    return 0
+
+
+def _classify(character: str) -> int:
+    range_index: int = _unicode_range_index(ord(character))
+    character_range: str | None = (
+        _UNICODE_RANGE_NAMES[range_index - 1] if range_index else None
+    )
+    character_category: str = unicodedata.category(character)
+
     try:
         description: str = unicodedata.name(character)
     except ValueError:  # Defensive: unicode database outdated?
-        return False
-    return (
+        description = ""
+
+    classes: int = _CLASSIFIED | range_index << 16
+
+    if (
         "WITH GRAVE" in description
         or "WITH ACUTE" in description
         or "WITH CEDILLA" in description
@@ -38,7 +91,87 @@ def is_accentuated(character: str) -> bool:
         or "WITH TILDE" in description
         or "WITH MACRON" in description
         or "WITH RING ABOVE" in description
-    )
+    ):
+        classes |= _ACCENTUATED
+    if "LATIN" in description:
+        classes |= _LATIN
+    if "P" in character_category or (
+        character_range is not None and "Punctuation" in character_range
+    ):
+        classes |= _PUNCTUATION
+    if (
+        "S" in character_category
+        or "N" in character_category
+        or (
+            character_range is not None
+            and "Forms" in character_range
+            and character_category != "Lo"
+        )
+    ):
+        classes |= _SYMBOL
+    if character_range is not None and (
+        "Emoticons" in character_range or "Pictographs" in character_range
+    ):
+        classes |= _EMOTICON
+    if (
+        character.isspace()
+        or character in {"｜", "+", "<", ">"}
+        or "Z" in character_category
+        or character_category in {"Po", "Pd", "Pc"}
+    ):
+        classes |= _SEPARATOR
+    if character.islower() != character.isupper():
+        classes |= _CASE_VARIABLE
+    if "CJK" in description:
+        classes |= _CJK
+    if "HIRAGANA" in description:
+        classes |= _HIRAGANA
+    if "KATAKANA" in description:
+        classes |= _KATAKANA
+    if "HANGUL" in description:
+        classes |= _HANGUL
+    if "THAI" in description:
+        classes |= _THAI
+    if "ARABIC" in description:
+        classes |= _ARABIC
+        if "ISOLATED FORM" in description:
+            classes |= _ARABIC_ISOLATED_FORM
+    if (
+        character.isspace() is False  # includes \n \t \r \v
+        and character.isprintable() is False
+        and character != "\x1a"  # Why? Its the ASCII substitute character.
+        and character != "\ufeff"  # bug discovered in Python,
+        # Zero Width No-Break Space located in 	Arabic Presentation Forms-B, Unicode 1.1 not acknowledged as space.
+    ):
+        classes |= _UNPRINTABLE
+
+    return classes
+
+
+@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
+def _classify_astral(character: str) -> int:
+    return _classify(character)
+
+
+def character_classes(character: str) -> int:
+    """
+    Retrieve the classes of a single character, computed at most once per codepoint of the BMP.
+    """
+    character_ord: int = ord(character)
+
+    if character_ord > 0xFFFF:
+        return _classify_astral(character)
+
+    classes: int = _BMP_CHARACTER_CLASSES[character_ord]
+
+    if not classes:
+        classes = _BMP_CHARACTER_CLASSES[character_ord] = _classify(character)
+
+    return classes
+
+
+def is_accentuated(character: str) -> bool:
+    return character_classes(character) & _ACCENTUATED != 0
 
 
 @lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
@@ -52,152 +185,65 @@ def remove_accent(character: str) -> str:
     return chr(int(codes[0], 16))
 
 
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def unicode_range(character: str) -> str | None:
     """
     Retrieve the Unicode range official name from a single character.
     """
-    character_ord: int = ord(character)
-
-    for range_name, ord_range in UNICODE_RANGES_COMBINED.items():
-        if character_ord in ord_range:
-            return range_name
+    range_index: int = character_classes(character) >> 16
 
-    return None
+    return _UNICODE_RANGE_NAMES[range_index - 1] if range_index else None
 
 
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_latin(character: str) -> bool:
-    try:
-        description: str = unicodedata.name(character)
-    except ValueError:  # Defensive: unicode database outdated?
-        return False
-    return "LATIN" in description
+    return character_classes(character) & _LATIN != 0
 
 
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_punctuation(character: str) -> bool:
-    character_category: str = unicodedata.category(character)
+    return character_classes(character) & _PUNCTUATION != 0
 
-    if "P" in character_category:
-        return True
 
-    character_range: str | None = unicode_range(character)
-
-    if character_range is None:
-        return False
-
-    return "Punctuation" in character_range
-
-
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_symbol(character: str) -> bool:
-    character_category: str = unicodedata.category(character)
-
-    if "S" in character_category or "N" in character_category:
-        return True
+    return character_classes(character) & _SYMBOL != 0
 
-    character_range: str | None = unicode_range(character)
 
-    if character_range is None:
-        return False
-
-    return "Forms" in character_range and character_category != "Lo"
-
-
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_emoticon(character: str) -> bool:
-    character_range: str | None = unicode_range(character)
+    return character_classes(character) & _EMOTICON != 0
 
-    if character_range is None:
-        return False
 
-    return "Emoticons" in character_range or "Pictographs" in character_range
-
-
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_separator(character: str) -> bool:
-    if character.isspace() or character in {"｜", "+", "<", ">"}:
-        return True
+    return character_classes(character) & _SEPARATOR != 0
 
-    character_category: str = unicodedata.category(character)
-
-    return "Z" in character_category or character_category in {"Po", "Pd", "Pc"}
 
-
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_case_variable(character: str) -> bool:
-    return character.islower() != character.isupper()
+    return character_classes(character) & _CASE_VARIABLE != 0
 
 
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_cjk(character: str) -> bool:
-    try:
-        character_name = unicodedata.name(character)
-    except ValueError:  # Defensive: unicode database outdated?
-        return False
+    return character_classes(character) & _CJK != 0
 
-    return "CJK" in character_name
 
-
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_hiragana(character: str) -> bool:
-    try:
-        character_name = unicodedata.name(character)
-    except ValueError:  # Defensive: unicode database outdated?
-        return False
+    return character_classes(character) & _HIRAGANA != 0
 
-    return "HIRAGANA" in character_name
 
-
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_katakana(character: str) -> bool:
-    try:
-        character_name = unicodedata.name(character)
-    except ValueError:  # Defensive: unicode database outdated?
-        return False
-
-    return "KATAKANA" in character_name
+    return character_classes(character) & _KATAKANA != 0
 
 
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_hangul(character: str) -> bool:
-    try:
-        character_name = unicodedata.name(character)
-    except ValueError:  # Defensive: unicode database outdated?
-        return False
-
-    return "HANGUL" in character_name
+    return character_classes(character) & _HANGUL != 0
 
 
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_thai(character: str) -> bool:
-    try:
-        character_name = unicodedata.name(character)
-    except ValueError:  # Defensive: unicode database outdated?
-        return False
+    return character_classes(character) & _THAI != 0
 
-    return "THAI" in character_name
 
-
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_arabic(character: str) -> bool:
-    try:
-        character_name = unicodedata.name(character)
-    except ValueError:  # Defensive: unicode database outdated?
-        return False
-
-    return "ARABIC" in character_name
+    return character_classes(character) & _ARABIC != 0
 
 
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_arabic_isolated_form(character: str) -> bool:
-    try:
-        character_name = unicodedata.name(character)
-    except ValueError:  # Defensive: unicode database outdated?
-        return False
-
-    return "ARABIC" in character_name and "ISOLATED FORM" in character_name
+    return character_classes(character) & _ARABIC_ISOLATED_FORM != 0
 
 
 @lru_cache(maxsize=len(UNICODE_RANGES_COMBINED))
@@ -205,15 +251,8 @@ def is_unicode_range_secondary(range_name: str) -> bool:
     return any(keyword in range_name for keyword in UNICODE_SECONDARY_RANGE_KEYWORD)
 
 
-@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
 def is_unprintable(character: str) -> bool:
-    return (
-        character.isspace() is False  # includes \n \t \r \v
-        and character.isprintable() is False
-        and character != "\x1a"  # Why? Its the ASCII substitute character.
-        and character != "\ufeff"  # bug discovered in Python,
-        # Zero Width No-Break Space located in 	Arabic Presentation Forms-B, Unicode 1.1 not acknowledged as space.
-    )
+    return character_classes(character) & _UNPRINTABLE != 0
 
 
 def any_specified_encoding(sequence: bytes, search_zone: int = 8192) -> str | None:
@@ -308,6 +347,26 @@ def iana_name(cp_name: str, strict: bool = True) -> str:
     return cp_name
 
 
+@lru_cache(maxsize=128)
+def undecodable_bytes(encoding_iana: str) -> bytes:
+    """
+    List every byte a single byte code page cannot decode. A payload containing any of them
+    is a hard failure for that code page, and for every other code page sharing the same list.
+    """
+    if is_multi_byte_encoding(encoding_iana):
+        raise ValueError(f"{encoding_iana} is not a single byte code page")
+
+    undecodable: list[int] = []
+
+    for i in range(256):
+        try:
+            bytes([i]).decode(encoding_iana)
+        except UnicodeDecodeError:
+            undecodable.append(i)
+
+    return bytes(undecodable)
+
+
 def cp_similarity(iana_name_a: str, iana_name_b: str) -> float:
     if is_multi_byte_encoding(iana_name_a) or is_multi_byte_encoding(iana_name_b):
         return 0.0
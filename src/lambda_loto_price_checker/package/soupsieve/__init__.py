@@ -32,15 +32,20 @@ from . import css_match as cm
 from . import css_types as ct
 from .util import DEBUG, SelectorSyntaxError  # noqa: F401
 import bs4
-from typing import Any, Iterator, Iterable
+from typing import Any, Iterator, Iterable, Mapping
 
 __all__ = (
-    'DEBUG', 'SelectorSyntaxError', 'SoupSieve',
-    'closest', 'compile', 'filter', 'iselect',
-    'match', 'select', 'select_one'
+    'DEBUG', 'DocumentIndex', 'SelectorCache', 'SelectorSyntaxError', 'SoupSieve',
+    'cache', 'closest', 'compile', 'filter', 'iselect',
+    'match', 'prewarm', 'select', 'select_many', 'select_one'
 )
 
 SoupSieve = cm.SoupSieve
+DocumentIndex = cm.DocumentIndex
+SelectorCache = cp.SelectorCache
+
+# The cache of compiled selectors used by all the functions in this module
+cache = cp._cache
 
 
 def compile(  # noqa: A001
@@ -76,6 +81,18 @@ def purge() -> None:
     cp._purge_cache()
 
 
+def prewarm(
+    patterns: Iterable[str],
+    namespaces: dict[str, str] | None = None,
+    flags: int = 0,
+    *,
+    custom: dict[str, str] | None = None
+) -> list[cm.SoupSieve]:
+    """Compile CSS patterns into the cache ahead of time."""
+
+    return cache.prewarm(patterns, namespaces, flags, custom=custom)
+
+
 def closest(
     select: str,
     tag: bs4.Tag,
@@ -125,11 +142,12 @@ def select_one(
     flags: int = 0,
     *,
     custom: dict[str, str] | None = None,
+    index: DocumentIndex | None = None,
     **kwargs: Any
 ) -> bs4.Tag | None:
     """Select a single tag."""
 
-    return compile(select, namespaces, flags, **kwargs).select_one(tag)
+    return compile(select, namespaces, flags, **kwargs).select_one(tag, index=index)
 
 
 def select(
@@ -140,11 +158,12 @@ def select(
     flags: int = 0,
     *,
     custom: dict[str, str] | None = None,
+    index: DocumentIndex | None = None,
     **kwargs: Any
 ) -> list[bs4.Tag]:
     """Select the specified tags."""
 
-    return compile(select, namespaces, flags, **kwargs).select(tag, limit)
+    return compile(select, namespaces, flags, **kwargs).select(tag, limit, index=index)
 
 
 def iselect(
@@ -155,11 +174,33 @@ def iselect(
     flags: int = 0,
     *,
     custom: dict[str, str] | None = None,
+    index: DocumentIndex | None = None,
     **kwargs: Any
 ) -> Iterator[bs4.Tag]:
     """Iterate the specified tags."""
 
-    yield from compile(select, namespaces, flags, **kwargs).iselect(tag, limit)
+    yield from compile(select, namespaces, flags, **kwargs).iselect(tag, limit, index=index)
+
+
+def select_many(
+    selects: Mapping[str, str | SoupSieve],
+    tag: bs4.Tag,
+    namespaces: dict[str, str] | None = None,
+    limit: int | Mapping[str, int] = 0,
+    flags: int = 0,
+    *,
+    custom: dict[str, str] | None = None,
+    index: DocumentIndex | None = None,
+    **kwargs: Any
+) -> dict[str, list[bs4.Tag]]:
+    """Select the tags matching each of several named selectors in one pass."""
+
+    return cm.select_many(
+        {name: compile(select, namespaces, flags, custom=custom, **kwargs) for name, select in selects.items()},
+        tag,
+        limit,
+        index
+    )
 
 
 def escape(ident: str) -> str:
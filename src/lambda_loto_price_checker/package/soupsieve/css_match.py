@@ -5,8 +5,10 @@ from . import util
 import re
 from . import css_types as ct
 import unicodedata
+import bisect
+import heapq
 import bs4
-from typing import Iterator, Iterable, Any, Callable, Sequence, Any, cast  # noqa: F401, F811
+from typing import Iterator, Iterable, Any, Callable, Mapping, Sequence, Any, cast  # noqa: F401, F811
 
 # Empty tag pattern (whitespace okay)
 RE_NOT_EMPTY = re.compile('[^ \t\r\n\f]')
@@ -37,6 +39,9 @@ DIR_MAP = {
     'auto': 0
 }
 
+# Fewest tags under a scope for `select()` to look candidates up in a `DocumentIndex`
+INDEX_MIN_SPAN = 32
+
 RE_NUM = re.compile(r"^(?P<value>-?(?:[0-9]{1,}(\.[0-9]+)?|\.[0-9]+))$")
 RE_TIME = re.compile(r'^(?P<hour>[0-9]{2}):(?P<minutes>[0-9]{2})$')
 RE_MONTH = re.compile(r'^(?P<year>[0-9]{4,})-(?P<month>[0-9]{2})$')
@@ -532,6 +537,87 @@ class Inputs:
         return parsed
 
 
+class DocumentIndex(_DocumentNav):
+    """
+    Index of the tags in a document by ID, class, and tag name.
+
+    Pass an index to `select()` (and the functions like it) to have selectors with an ID, a class, or a tag
+    name answered from the index instead of by walking the document. One index serves every tag in the
+    document it was made for.
+
+    The index is a snapshot of the document: it doesn't notice changes made to the document afterwards, and
+    selecting with an index that is out of date gives wrong results. After changing the document, call
+    `rebuild()` before using the index again.
+
+    Each index maps a key to the tags that have it and to their positions, both in document order. `spans`
+    maps the `id()` of each tag to its position in the document and the position of its last descendant, so
+    we can tell whether a tag is under a given scope.
+    """
+
+    def __init__(self, tag: bs4.Tag) -> None:
+        """Initialize."""
+
+        self.assert_valid_input(tag)
+        doc = tag
+        parent = self.get_parent(doc)
+        while parent:
+            doc = parent
+            parent = self.get_parent(doc)
+        self.doc = doc
+        self.is_xml = self.is_xml_tree(doc)
+        self.ids = {}  # type: dict[str, tuple[list[bs4.Tag], list[int]]]
+        self.classes = {}  # type: dict[str, tuple[list[bs4.Tag], list[int]]]
+        self.names = {}  # type: dict[str, tuple[list[bs4.Tag], list[int]]]
+        self.spans = {}  # type: dict[int, list[int]]
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Index the document again, after it was changed."""
+
+        ids = {}  # type: dict[str, tuple[list[bs4.Tag], list[int]]]
+        classes = {}  # type: dict[str, tuple[list[bs4.Tag], list[int]]]
+        names = {}  # type: dict[str, tuple[list[bs4.Tag], list[int]]]
+        spans = {}  # type: dict[int, list[int]]
+
+        def add(keys: dict[str, tuple[list[bs4.Tag], list[int]]], key: str, el: bs4.Tag, position: int) -> None:
+            """Add a tag and its position under a key."""
+
+            entry = keys.get(key)
+            if entry is None:
+                entry = keys[key] = ([], [])
+            entry[0].append(el)
+            entry[1].append(position)
+
+        position = 0
+        stack = []  # type: list[bs4.Tag]
+        for el in self.get_tag_descendants(self.doc):
+            parent = el.parent
+            while stack and stack[-1] is not parent:
+                spans[id(stack.pop())][1] = position
+            position += 1
+            spans[id(el)] = [position, position]
+            if el.contents:
+                stack.append(el)
+
+            name = self.get_tag_name(el)
+            add(names, (util.lower(name) if not self.is_xml else name) if name else '', el, position)
+            el_id = self.get_attribute_by_name(el, 'id')
+            if isinstance(el_id, str):
+                add(ids, el_id, el, position)
+            for c in set(self.get_classes(el)):
+                add(classes, c, el, position)
+        for el in stack:
+            spans[id(el)][1] = position
+
+        # The document itself spans everything.
+        spans[id(self.doc)] = [0, position]
+
+        self.ids = ids
+        self.classes = classes
+        self.names = names
+        self.spans = spans
+
+
 class CSSMatch(_DocumentNav):
     """Perform CSS matching."""
 
@@ -549,6 +635,7 @@ class CSSMatch(_DocumentNav):
         self.cached_meta_lang = []  # type: list[tuple[str, str]]
         self.cached_default_forms = []  # type: list[tuple[bs4.Tag, bs4.Tag]]
         self.cached_indeterminate_forms = []  # type: list[tuple[bs4.Tag, str, bool]]
+        self.cached_nth_positions = {}  # type: dict[tuple[int, ct.SelectorList, bool, bool], dict[int, tuple[int, int]]]
         self.selectors = selectors
         self.namespaces = {} if namespaces is None else namespaces  # type: ct.Namespaces | dict[str, str]
         self.flags = flags
@@ -575,6 +662,7 @@ class CSSMatch(_DocumentNav):
         # A document can be both XML and HTML (XHTML)
         self.is_xml = self.is_xml_tree(doc)
         self.is_html = not self.is_xml or self.has_html_namespace
+        self.doc = doc
 
     def supports_namespaces(self) -> bool:
         """Check if namespaces are supported in the HTML type."""
@@ -960,6 +1048,44 @@ class CSSMatch(_DocumentNav):
             (self.get_tag_ns(child) == self.get_tag_ns(el))
         )
 
+    def get_nth_positions(self, parent: bs4.Tag, n: ct.SelectorNth) -> dict[int, tuple[int, int]]:
+        """
+        Get the positions of a parent's children for `nth` matches.
+
+        Returns a dictionary mapping the `id()` of each child that counts towards `n` to its position
+        (starting at 1) counting from the first child and from the last child. Children that don't match
+        `n.selectors` (for `of S`) don't count. For `of-type`, children are counted separately for
+        each type.
+
+        The positions are cached for the rest of the pass, so matching every child of a parent only
+        counts the children once.
+        """
+
+        key = (id(parent), n.selectors, n.of_type, self.iframe_restrict)
+        positions = self.cached_nth_positions.get(key)
+        if positions is not None:
+            return positions
+
+        children = []  # type: list[tuple[int, Any, int]]
+        totals = {}  # type: dict[Any, int]
+        for child in self.get_children(parent, tags=True):
+            # Handle `of S` in `nth-child`
+            if n.selectors and not self.match_selectors(child, n.selectors):
+                continue
+            # Handle `of-type`
+            group = (self.get_tag(child), self.get_tag_ns(child)) if n.of_type else None
+            position = totals.get(group, 0) + 1
+            totals[group] = position
+            children.append((id(child), group, position))
+
+        positions = {
+            child: (position, totals[group] - position + 1)
+            for child, group, position in children
+        }
+        if not isinstance(parent, _FakeParent):
+            self.cached_nth_positions[key] = positions
+        return positions
+
     def match_nth(self, el: bs4.Tag, nth: tuple[ct.SelectorNth, ...]) -> bool:
         """Match `nth` elements."""
 
@@ -972,91 +1098,19 @@ class CSSMatch(_DocumentNav):
             parent = self.get_parent(el)  # type: bs4.Tag | None
             if parent is None:
                 parent = cast('bs4.Tag', self.create_fake_parent(el))
-            last = n.last
-            last_index = len(parent) - 1
-            index = last_index if last else 0
-            relative_index = 0
+            first, last = self.get_nth_positions(parent, n)[id(el)]
+            position = last if n.last else first
+
+            # Is there an `n >= 0` where `a * n + b` is the element's position?
+            # Without a variable, the position is given as `a`.
             a = n.a
             b = n.b
-            var = n.n
-            count = 0
-            count_incr = 1
-            factor = -1 if last else 1
-            idx = last_idx = a * count + b if var else a
-
-            # We can only adjust bounds within a variable index
-            if var:
-                # Abort if our nth index is out of bounds and only getting further out of bounds as we increment.
-                # Otherwise, increment to try to get in bounds.
-                adjust = None
-                while idx < 1 or idx > last_index:
-                    if idx < 0:
-                        diff_low = 0 - idx
-                        if adjust is not None and adjust == 1:
-                            break
-                        adjust = -1
-                        count += count_incr
-                        idx = last_idx = a * count + b if var else a
-                        diff = 0 - idx
-                        if diff >= diff_low:
-                            break
-                    else:
-                        diff_high = idx - last_index
-                        if adjust is not None and adjust == -1:
-                            break
-                        adjust = 1
-                        count += count_incr
-                        idx = last_idx = a * count + b if var else a
-                        diff = idx - last_index
-                        if diff >= diff_high:
-                            break
-                        diff_high = diff
-
-                # If a < 0, our count is working backwards, so floor the index by increasing the count.
-                # Find the count that yields the lowest, in bound value and use that.
-                # Lastly reverse count increment so that we'll increase our index.
-                lowest = count
-                if a < 0:
-                    while idx >= 1:
-                        lowest = count
-                        count += count_incr
-                        idx = last_idx = a * count + b if var else a
-                    count_incr = -1
-                count = lowest
-                idx = last_idx = a * count + b if var else a
-
-            # Evaluate elements while our calculated nth index is still in range
-            while 1 <= idx <= last_index + 1:
-                child = None  # type: bs4.element.PageElement | None
-                # Evaluate while our child index is still in range.
-                for child in self.get_children(parent, start=index, reverse=factor < 0):
-                    index += factor
-                    if not isinstance(child, bs4.Tag):
-                        continue
-                    # Handle `of S` in `nth-child`
-                    if n.selectors and not self.match_selectors(child, n.selectors):
-                        continue
-                    # Handle `of-type`
-                    if n.of_type and not self.match_nth_tag_type(el, child):
-                        continue
-                    relative_index += 1
-                    if relative_index == idx:
-                        if child is el:
-                            matched = True
-                        else:
-                            break
-                    if child is el:
-                        break
-                if child is el:
-                    break
-                last_idx = idx
-                count += count_incr
-                if count < 0:
-                    # Count is counting down and has now ventured into invalid territory.
-                    break
-                idx = a * count + b if var else a
-                if last_idx == idx:
-                    break
+            if not n.n:
+                matched = position == a
+            elif a == 0:
+                matched = position == b
+            else:
+                matched = (position - b) % a == 0 and (position - b) // a >= 0
             if not matched:
                 break
         return matched
@@ -1520,11 +1574,229 @@ class CSSMatch(_DocumentNav):
 
         return match
 
-    def select(self, limit: int = 0) -> Iterator[bs4.Tag]:
+    def get_selector_ancestor_requirements(
+        self,
+        selector: ct.Selector
+    ) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+        """
+        Get the tag names, IDs, and classes a selector requires a matching element's ancestors to have.
+
+        A compound to the left of a descendant or child combinator must match an ancestor of the element
+        (an ancestor of a sibling is an ancestor too); one to the left of a sibling combinator need not,
+        so it's skipped.
+        """
+
+        names = []  # type: list[str]
+        ids = []  # type: list[str]
+        classes = []  # type: list[str]
+        relation = selector.relation
+        while len(relation) == 1 and not relation.is_not and not relation.is_html:
+            sel = relation[0]
+            if isinstance(sel, ct.SelectorNull):
+                break
+            if sel.rel_type not in (REL_PARENT, REL_CLOSE_PARENT, REL_SIBLING, REL_CLOSE_SIBLING):
+                break
+            if sel.rel_type in (REL_PARENT, REL_CLOSE_PARENT):
+                if sel.tag is not None and sel.tag.name not in (None, '*'):
+                    names.append(util.lower(sel.tag.name) if not self.is_xml else sel.tag.name)
+                ids.extend(sel.ids)
+                classes.extend(sel.classes)
+            relation = sel.relation
+        return tuple(names), tuple(ids), tuple(classes)
+
+    def get_ancestor_requirements(self) -> list[tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]] | None:
+        """
+        Get the tag names, IDs, and classes a matching element's ancestors must have.
+
+        Returns one `(names, ids, classes)` tuple per selector. An element can only match a selector
+        if, among all of its ancestors, every one of the names, IDs, and classes is present.
+
+        If any selector requires nothing of an element's ancestors, no element can be ruled out this way,
+        so `None` is returned.
+        """
+
+        if self.selectors.is_not or self.selectors.is_html:
+            return None
+
+        requirements = []
+        for selector in self.selectors:
+            if isinstance(selector, ct.SelectorNull):
+                continue
+            names, ids, classes = self.get_selector_ancestor_requirements(selector)
+            if not names and not ids and not classes:
+                return None
+            requirements.append((names, ids, classes))
+        return requirements
+
+    def plan_select(self, index: DocumentIndex) -> list[tuple[list[bs4.Tag], list[int], int, int]] | None:
+        """
+        Plan a search by picking, for each selector, the shortest list of tags that could possibly match.
+
+        A tag can only match a compound selector if it has the compound's ID, each of its classes, and its
+        tag name, so the rightmost compound of each selector tells us which index entries to look at. Each
+        list is returned with the positions of its tags, and the range of them that's under the targeted tag.
+        If any selector has none of these, or the index isn't for this document, we can't plan the search,
+        and `None` is returned.
+        """
+
+        if self.selectors.is_not or self.selectors.is_html:
+            return None
+
+        selectors = [selector for selector in self.selectors if not isinstance(selector, ct.SelectorNull)]
+        for selector in selectors:
+            if (
+                not selector.ids and not selector.classes and
+                (selector.tag is None or selector.tag.name in (None, '*'))
+            ):
+                return None
+
+        span = index.spans.get(id(self.tag))
+        if index.doc is not self.doc or index.is_xml != self.is_xml or span is None:
+            # Either the index is for another document, or the tag we're searching isn't really part of
+            # it (its parent doesn't list it as a child).
+            return None
+        start, end = span
+
+        empty = ([], [])  # type: tuple[list[bs4.Tag], list[int]]
+        candidates = []
+        for selector in selectors:
+            lists = [index.ids.get(i, empty) for i in selector.ids]
+            lists.extend(index.classes.get(c, empty) for c in selector.classes)
+            if selector.tag is not None and selector.tag.name not in (None, '*'):
+                name = util.lower(selector.tag.name) if not self.is_xml else selector.tag.name
+                lists.append(index.names.get(name, empty))
+            tags, positions = min(lists, key=lambda entry: len(entry[0]))
+            lo = bisect.bisect_right(positions, start)
+            hi = bisect.bisect_right(positions, end, lo)
+
+            # If the selector requires an ancestor that's rarer than the tag itself, only keep the tags
+            # that are under one of those ancestors.
+            names, ids, classes = self.get_selector_ancestor_requirements(selector)
+            lists = [index.ids.get(i, empty) for i in ids]
+            lists.extend(index.classes.get(c, empty) for c in classes)
+            lists.extend(index.names.get(n, empty) for n in names)
+            if lists and lo < hi:
+                ancestors, ancestor_positions = min(lists, key=lambda entry: len(entry[0]))
+                ancestor_lo = bisect.bisect_right(ancestor_positions, start)
+                ancestor_hi = bisect.bisect_right(ancestor_positions, end, ancestor_lo)
+                if (
+                    ancestor_hi - ancestor_lo < hi - lo and
+                    not self.is_under(index, ancestors, ancestor_positions)
+                ):
+                    tags, positions = self.filter_descendants(
+                        index,
+                        tags[lo:hi],
+                        positions[lo:hi],
+                        ancestors[ancestor_lo:ancestor_hi]
+                    )
+                    lo, hi = 0, len(tags)
+            candidates.append((tags, positions, lo, hi))
+        return candidates
+
+    def is_under(self, index: DocumentIndex, tags: list[bs4.Tag], positions: list[int]) -> bool:
+        """Check whether the targeted tag is one of the tags (in document order), or under one of them."""
+
+        el = self.tag  # type: bs4.Tag | None
+        while el is not None:
+            i = bisect.bisect_left(positions, index.spans[id(el)][0])
+            if i < len(tags) and tags[i] is el:
+                return True
+            el = self.get_parent(el)
+        return False
+
+    @staticmethod
+    def filter_descendants(
+        index: DocumentIndex,
+        tags: list[bs4.Tag],
+        positions: list[int],
+        ancestors: list[bs4.Tag]
+    ) -> tuple[list[bs4.Tag], list[int]]:
+        """Get the tags (in document order) that are under one of the ancestors (also in document order)."""
+
+        spans = index.spans
+        # Spans are either nested or disjoint, so a span that starts inside the last one is inside it.
+        ranges = []  # type: list[list[int]]
+        for el in ancestors:
+            span = spans[id(el)]
+            if not ranges or span[0] > ranges[-1][1]:
+                ranges.append(span)
+
+        result = []  # type: list[bs4.Tag]
+        result_positions = []  # type: list[int]
+        i = 0
+        for el, position in zip(tags, positions):
+            while i < len(ranges) and ranges[i][1] < position:
+                i += 1
+            if i == len(ranges):
+                break
+            if position > ranges[i][0]:
+                result.append(el)
+                result_positions.append(position)
+        return result, result_positions
+
+    def select_candidates(
+        self,
+        index: DocumentIndex,
+        candidates: list[tuple[list[bs4.Tag], list[int], int, int]],
+        lim: int | None
+    ) -> Iterator[bs4.Tag]:
+        """Match the candidate tags that are under the targeted tag, in document order."""
+
+        start, end = index.spans[id(self.tag)]
+        candidates = [candidate for candidate in candidates if candidate[2] < candidate[3]]
+
+        if not candidates:
+            return
+        elif len(candidates) == 1:
+            tags, _, lo, hi = candidates[0]
+            found = (tags[i] for i in range(lo, hi))  # type: Iterable[bs4.Tag]
+        elif sum(hi - lo for _, _, lo, hi in candidates) >= end - start:
+            # There are about as many candidates as tags under the targeted tag, so it's cheaper to look at
+            # those than to put the candidates in order.
+            found = self.get_tag_descendants(self.tag)
+        else:
+            # Several selectors can pick the same tag, so merge the lists by position and skip duplicates.
+            found = self.merge_candidates(candidates)
+
+        for el in found:
+            if self.match(el):
+                yield el
+                if lim is not None:
+                    lim -= 1
+                    if lim < 1:
+                        break
+
+    @staticmethod
+    def merge_candidates(candidates: list[tuple[list[bs4.Tag], list[int], int, int]]) -> Iterator[bs4.Tag]:
+        """Merge the ranges of several lists of candidates into document order, without duplicates."""
+
+        last = -1
+        for position, el in heapq.merge(
+            *(zip(positions[lo:hi], tags[lo:hi]) for tags, positions, lo, hi in candidates),
+            key=lambda item: item[0]
+        ):
+            if position != last:
+                last = position
+                yield el
+
+    def select(self, limit: int = 0, index: DocumentIndex | None = None) -> Iterator[bs4.Tag]:
         """Match all tags under the targeted tag."""
 
         lim = None if limit < 1 else limit
 
+        span = index.spans.get(id(self.tag)) if index is not None else None
+        # Planning costs about as much as matching a few dozen tags, so a scope with fewer is walked instead.
+        if span is not None and span[1] - span[0] > INDEX_MIN_SPAN:
+            candidates = self.plan_select(index)  # type: ignore[arg-type]
+            if candidates is not None:
+                yield from self.select_candidates(index, candidates, lim)
+                return
+
+        requirements = self.get_ancestor_requirements()
+        if requirements is not None:
+            yield from self.select_filtered(requirements, lim)
+            return
+
         for child in self.get_tag_descendants(self.tag):
             if self.match(child):
                 yield child
@@ -1533,6 +1805,86 @@ class CSSMatch(_DocumentNav):
                     if lim < 1:
                         break
 
+    def select_filtered(
+        self,
+        requirements: list[tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]],
+        lim: int | None
+    ) -> Iterator[bs4.Tag]:
+        """
+        Match all tags under the targeted tag, skipping tags whose ancestors can't satisfy the selectors.
+
+        While descending, keep a count of the tag names, IDs, and classes of the current tag's ancestors.
+        Before running the full match on a tag, check that some selector has all of its ancestor
+        requirements in the counts; if none does, the tag can't match, and matching it would have meant
+        walking up the parent chain (possibly many times) to find that out. This is the same trick as the
+        ancestor bloom filter used by browser engines, but a dictionary of counts is cheaper than a bit
+        array in Python, and never gives false positives.
+        """
+
+        need_ids = any(ids for _, ids, _ in requirements)
+        need_classes = any(classes for _, _, classes in requirements)
+        counts = {}  # type: dict[tuple[int, str], int]
+
+        def keys(el: bs4.Tag) -> list[tuple[int, str]]:
+            """Get the keys an element adds to the counts."""
+
+            result = [(0, self.get_tag(el) or '')]
+            if need_ids:
+                el_id = self.get_attribute_by_name(el, 'id')
+                if isinstance(el_id, str):
+                    result.append((1, el_id))
+            if need_classes:
+                result.extend((2, c) for c in self.get_classes(el))
+            return result
+
+        def add(el_keys: list[tuple[int, str]]) -> None:
+            """Add an element's keys to the counts."""
+
+            for key in el_keys:
+                counts[key] = counts.get(key, 0) + 1
+
+        def remove(el_keys: list[tuple[int, str]]) -> None:
+            """Remove an element's keys from the counts."""
+
+            for key in el_keys:
+                count = counts[key] - 1
+                if count:
+                    counts[key] = count
+                else:
+                    del counts[key]
+
+        checks = [
+            [(0, n) for n in names] + [(1, i) for i in ids] + [(2, c) for c in classes]
+            for names, ids, classes in requirements
+        ]
+
+        # Everything above the scope is an ancestor of every tag we'll look at.
+        ancestor = self.tag  # type: bs4.Tag | None
+        while ancestor is not None:
+            add(keys(ancestor))
+            ancestor = self.get_parent(ancestor)
+
+        stack = []  # type: list[tuple[bs4.Tag, list[tuple[int, str]]]]
+        for child in self.get_tag_descendants(self.tag):
+            parent = child.parent
+            while stack and stack[-1][0] is not parent:
+                remove(stack.pop()[1])
+
+            if (
+                any(all(key in counts for key in check) for check in checks) and
+                self.match(child)
+            ):
+                yield child
+                if lim is not None:
+                    lim -= 1
+                    if lim < 1:
+                        break
+
+            if child.contents:
+                el_keys = keys(child)
+                add(el_keys)
+                stack.append((child, el_keys))
+
     def closest(self) -> bs4.Tag | None:
         """Match closest ancestor."""
 
@@ -1615,21 +1967,21 @@ class SoupSieve(ct.Immutable):
         else:
             return [node for node in iterable if not CSSMatch.is_navigable_string(node) and self.match(node)]
 
-    def select_one(self, tag: bs4.Tag) -> bs4.Tag | None:
+    def select_one(self, tag: bs4.Tag, *, index: DocumentIndex | None = None) -> bs4.Tag | None:
         """Select a single tag."""
 
-        tags = self.select(tag, limit=1)
+        tags = self.select(tag, limit=1, index=index)
         return tags[0] if tags else None
 
-    def select(self, tag: bs4.Tag, limit: int = 0) -> list[bs4.Tag]:
+    def select(self, tag: bs4.Tag, limit: int = 0, *, index: DocumentIndex | None = None) -> list[bs4.Tag]:
         """Select the specified tags."""
 
-        return list(self.iselect(tag, limit))
+        return list(self.iselect(tag, limit, index=index))
 
-    def iselect(self, tag: bs4.Tag, limit: int = 0) -> Iterator[bs4.Tag]:
+    def iselect(self, tag: bs4.Tag, limit: int = 0, *, index: DocumentIndex | None = None) -> Iterator[bs4.Tag]:
         """Iterate the specified tags."""
 
-        yield from CSSMatch(self.selectors, tag, self.namespaces, self.flags).select(limit)
+        yield from CSSMatch(self.selectors, tag, self.namespaces, self.flags).select(limit, index)
 
     def __repr__(self) -> str:  # pragma: no cover
         """Representation."""
@@ -1642,4 +1994,51 @@ class SoupSieve(ct.Immutable):
     __str__ = __repr__
 
 
+def select_many(
+    patterns: Mapping[str, SoupSieve],
+    tag: bs4.Tag,
+    limit: int | Mapping[str, int] = 0,
+    index: DocumentIndex | None = None
+) -> dict[str, list[bs4.Tag]]:
+    """
+    Select the tags matching each of several compiled patterns.
+
+    Patterns that can be answered from the document's index, if one is given, are; the rest are matched
+    together, in a single walk of the tag's descendants, which stops as soon as every pattern with a limit has
+    reached it.
+    """
+
+    results = {}  # type: dict[str, list[bs4.Tag]]
+    remaining = []  # type: list[tuple[str, CSSMatch, int | None]]
+    for name, pattern in patterns.items():
+        lim = limit.get(name, 0) if isinstance(limit, Mapping) else limit
+        matcher = CSSMatch(pattern.selectors, tag, pattern.namespaces, pattern.flags)
+        candidates = matcher.plan_select(index) if index is not None else None
+        if candidates is not None:
+            results[name] = list(matcher.select_candidates(index, candidates, None if lim < 1 else lim))  # type: ignore[arg-type]
+        else:
+            results[name] = []
+            remaining.append((name, matcher, None if lim < 1 else lim))
+
+    if remaining:
+        for el in remaining[0][1].get_tag_descendants(tag):
+            done = False
+            for name, matcher, lim in remaining:
+                if matcher.match(el):
+                    found = results[name]
+                    found.append(el)
+                    if lim is not None and len(found) >= lim:
+                        done = True
+            if done:
+                remaining = [
+                    (name, matcher, lim) for name, matcher, lim in remaining
+                    if lim is None or len(results[name]) < lim
+                ]
+                if not remaining:
+                    break
+
+    # Keep the order the patterns were given in.
+    return {name: results[name] for name in patterns}
+
+
 ct.pickle_register(SoupSieve)
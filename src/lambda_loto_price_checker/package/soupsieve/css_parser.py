@@ -1,13 +1,16 @@
 """CSS selector parser."""
 from __future__ import annotations
 import re
-from functools import lru_cache
+from collections import OrderedDict
+import pickle
+import threading
+from .__meta__ import __version__
 from . import util
 from . import css_match as cm
 from . import css_types as ct
 from .util import SelectorSyntaxError
 import warnings
-from typing import Match, Any, Iterator, cast
+from typing import IO, Iterable, Match, Any, Iterator, NamedTuple, Optional, Tuple, cast
 
 UNICODE_REPLACEMENT_CHAR = 0xFFFD
 
@@ -200,15 +203,201 @@ FLG_FORGIVE = 0x400
 # Maximum cached patterns to store
 _MAXCACHE = 500
 
+# Version of the serialized cache format
+_CACHE_FORMAT = 1
 
-@lru_cache(maxsize=_MAXCACHE)
-def _cached_css_compile(
+_CacheKey = Tuple[str, Optional[ct.Namespaces], Optional[ct.CustomSelectors], int]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics about the compiled selector cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+
+class SelectorCache:
+    """
+    Least recently used cache of compiled selectors.
+
+    Every selector compiled through the module level functions (and so every selector used by Beautiful Soup)
+    goes through the same cache. The cache can be resized, inspected, warmed up with the selectors a program
+    is going to use, and saved to and restored from bytes, so a new process can skip parsing selectors
+    altogether.
+
+    Restoring a cache unpickles it, so only restore data you saved yourself.
+    """
+
+    def __init__(self, maxsize: int | None = _MAXCACHE) -> None:
+        """Initialize."""
+
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()  # type: OrderedDict[_CacheKey, cm.SoupSieve]
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self) -> int | None:
+        """Maximum number of compiled selectors to keep (`None` for no limit)."""
+
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int | None) -> None:
+        """Resize the cache, evicting the least recently used selectors if needed."""
+
+        if value is not None and value < 0:
+            raise ValueError("The cache size can't be negative")
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def _evict(self) -> None:
+        """Evict the least recently used selectors until the cache fits."""
+
+        if self._maxsize is not None:
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    @staticmethod
+    def _key(
+        pattern: str,
+        namespaces: ct.Namespaces | None,
+        custom: ct.CustomSelectors | None,
+        flags: int
+    ) -> _CacheKey:
+        """
+        Get the cache key for a pattern.
+
+        No namespaces and an empty namespace dictionary match the same way, so they share a key.
+        """
+
+        return (pattern, namespaces or None, custom, flags)
+
+    def compile(  # noqa: A001
+        self,
+        pattern: str,
+        namespaces: ct.Namespaces | None,
+        custom: ct.CustomSelectors | None,
+        flags: int
+    ) -> cm.SoupSieve:
+        """Get a compiled pattern, compiling it if it isn't in the cache."""
+
+        key = self._key(pattern, namespaces, custom, flags)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return compiled
+            self.misses += 1
+
+        compiled = _css_compile(pattern, namespaces, custom, flags)
+        with self._lock:
+            self._entries[key] = compiled
+            self._evict()
+        return compiled
+
+    def prewarm(
+        self,
+        patterns: Iterable[str],
+        namespaces: dict[str, str] | None = None,
+        flags: int = 0,
+        *,
+        custom: dict[str, str] | None = None
+    ) -> list[cm.SoupSieve]:
+        """Compile patterns ahead of time, so they're in the cache when they're needed."""
+
+        return [
+            self.compile(
+                pattern,
+                ct.Namespaces(namespaces) if namespaces is not None else namespaces,
+                ct.CustomSelectors(custom) if custom is not None else custom,
+                flags
+            )
+            for pattern in patterns
+        ]
+
+    def info(self) -> CacheInfo:
+        """Get cache statistics."""
+
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self._maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """Remove all compiled patterns from the cache and reset the statistics."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def dumps(self) -> bytes:
+        """
+        Serialize the cached patterns.
+
+        The compiled selectors are stored along with the Soup Sieve version; they'll only be restored
+        by the same version.
+        """
+
+        with self._lock:
+            entries = [
+                (
+                    pattern,
+                    dict(namespaces) if namespaces is not None else None,
+                    dict(custom) if custom is not None else None,
+                    flags,
+                    compiled.selectors
+                )
+                for (pattern, namespaces, custom, flags), compiled in self._entries.items()
+            ]
+        return pickle.dumps((_CACHE_FORMAT, __version__, entries), pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> int:
+        """
+        Restore patterns serialized with `dumps`, and return how many were restored.
+
+        Data from a different version of Soup Sieve is ignored, as the compiled form may have changed.
+        """
+
+        cache_format, version, entries = pickle.loads(data)
+        if cache_format != _CACHE_FORMAT or version != __version__:
+            return 0
+
+        count = 0
+        for pattern, namespaces, custom, flags, selectors in entries:
+            ns = ct.Namespaces(namespaces) if namespaces is not None else None
+            cs = ct.CustomSelectors(custom) if custom is not None else None
+            compiled = cm.SoupSieve(pattern, selectors, ns, cs, flags)
+            with self._lock:
+                self._entries[self._key(pattern, ns, cs, flags)] = compiled
+                self._evict()
+            count += 1
+        return count
+
+    def dump(self, fp: IO[bytes]) -> None:
+        """Serialize the cached patterns to a binary file."""
+
+        fp.write(self.dumps())
+
+    def load(self, fp: IO[bytes]) -> int:
+        """Restore patterns from a binary file written by `dump`, and return how many were restored."""
+
+        return self.loads(fp.read())
+
+
+def _css_compile(
     pattern: str,
     namespaces: ct.Namespaces | None,
     custom: ct.CustomSelectors | None,
     flags: int
 ) -> cm.SoupSieve:
-    """Cached CSS compile."""
+    """Compile CSS without the cache."""
 
     custom_selectors = process_custom(custom)
     return cm.SoupSieve(
@@ -224,10 +413,25 @@ def _cached_css_compile(
     )
 
 
+# The cache shared by everything that compiles selectors
+_cache = SelectorCache()
+
+
+def _cached_css_compile(
+    pattern: str,
+    namespaces: ct.Namespaces | None,
+    custom: ct.CustomSelectors | None,
+    flags: int
+) -> cm.SoupSieve:
+    """Cached CSS compile."""
+
+    return _cache.compile(pattern, namespaces, custom, flags)
+
+
 def _purge_cache() -> None:
     """Purge the cache."""
 
-    _cached_css_compile.cache_clear()
+    _cache.clear()
 
 
 def process_custom(custom: ct.CustomSelectors | None) -> dict[str, str | ct.SelectorList]:
@@ -152,6 +152,10 @@ class RecentlyUsedContainer(typing.Generic[_KT, _VT], typing.MutableMapping[_KT,
         with self.lock:
             return set(self._container.keys())
 
+    def values(self) -> list[_VT]:  # type: ignore[override]
+        with self.lock:
+            return list(self._container.values())
+
 
 class HTTPHeaderDictItemView(set[tuple[str, str]]):
     """
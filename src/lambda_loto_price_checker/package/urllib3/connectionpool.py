@@ -4,6 +4,7 @@ import errno
 import logging
 import queue
 import sys
+import time
 import typing
 import warnings
 import weakref
@@ -57,6 +58,7 @@ if typing.TYPE_CHECKING:
     from typing_extensions import Self
 
     from ._base_connection import BaseHTTPConnection, BaseHTTPSConnection
+    from .metrics import PoolMetrics
 
 log = logging.getLogger(__name__)
 
@@ -164,6 +166,10 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         A dictionary with proxy headers, should not be used directly,
         instead, see :class:`urllib3.ProxyManager`
 
+    :param metrics:
+        A :class:`urllib3.metrics.PoolMetrics` to record connection reuse,
+        waits and timings into. Nothing is recorded without one.
+
     :param \\**conn_kw:
         Additional parameters are used to create fresh :class:`urllib3.connection.HTTPConnection`,
         :class:`urllib3.connection.HTTPSConnection` instances.
@@ -184,6 +190,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         _proxy: Url | None = None,
         _proxy_headers: typing.Mapping[str, str] | None = None,
         _proxy_config: ProxyConfig | None = None,
+        metrics: PoolMetrics | None = None,
         **conn_kw: typing.Any,
     ):
         ConnectionPool.__init__(self, host, port)
@@ -204,6 +211,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         self.proxy = _proxy
         self.proxy_headers = _proxy_headers or {}
         self.proxy_config = _proxy_config
+        self.metrics = metrics
 
         # Fill the queue up so that doing get() on it will block properly
         for _ in range(maxsize):
@@ -266,10 +274,14 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             :prop:`.block` is ``True``.
         """
         conn = None
+        metrics = self.metrics
 
         if self.pool is None:
             raise ClosedPoolError(self, "Pool is closed.")
 
+        if metrics is not None:
+            started = time.monotonic()
+
         try:
             conn = self.pool.get(block=self.block, timeout=timeout)
 
@@ -277,6 +289,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             raise ClosedPoolError(self, "Pool is closed.") from None  # Defensive:
 
         except queue.Empty:
+            if metrics is not None:
+                metrics.increment(self, "pool_empty")
+                metrics.observe(self, "queue_wait", time.monotonic() - started)
             if self.block:
                 raise EmptyPoolError(
                     self,
@@ -284,12 +299,25 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 ) from None
             pass  # Oh well, we'll create a new connection then
 
+        else:
+            if metrics is not None:
+                metrics.observe(self, "queue_wait", time.monotonic() - started)
+
         # If this is a persistent connection, check if it got disconnected
         if conn and is_connection_dropped(conn):
             log.debug("Resetting dropped connection: %s", self.host)
             conn.close()
+            if metrics is not None:
+                metrics.connection_opened(self, conn, reset=True)
+        elif conn and metrics is not None:
+            metrics.connection_reused(self, conn)
 
-        return conn or self._new_conn()
+        if not conn:
+            conn = self._new_conn()
+            if metrics is not None:
+                metrics.connection_opened(self, conn, reset=False)
+
+        return conn
 
     def _put_conn(self, conn: BaseHTTPConnection | None) -> None:
         """
@@ -324,6 +352,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                         "Pool reached maximum size and no more connections are allowed.",
                     ) from None
 
+                if self.metrics is not None:
+                    self.metrics.increment(self, "connections_discarded")
+
                 log.warning(
                     "Connection pool is full, discarding connection: %s. Connection pool size: %s",
                     self.host,
@@ -334,6 +365,49 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         if conn:
             conn.close()
 
+    def resize(self, maxsize: int) -> int:
+        """
+        Change the number of connections the pool keeps, and return the
+        size it ends up with.
+
+        Growing takes effect at once. Shrinking gives up free slots and
+        idle connections, closing the latter; connections in use are not
+        waited for, so the pool may stay larger than asked for until it is
+        resized again.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        pool = self.pool
+        if pool is None:
+            raise ClosedPoolError(self, "Pool is closed.")
+
+        with pool.mutex:
+            added = maxsize - pool.maxsize
+            if added > 0:
+                pool.maxsize = maxsize
+
+        # Same as in __init__, new slots are filled so that get() on them
+        # doesn't block. A connection returned in the meantime may take
+        # a slot first, which is just as good.
+        for _ in range(added):
+            try:
+                pool.put(None, block=False)
+            except queue.Full:
+                break
+
+        while pool.maxsize > maxsize:
+            try:
+                conn = pool.get(block=False)
+            except queue.Empty:
+                break
+            with pool.mutex:
+                pool.maxsize -= 1
+            if conn:
+                conn.close()
+
+        return pool.maxsize
+
     def _validate_conn(self, conn: BaseHTTPConnection) -> None:
         """
         Called right before a request is made, after the socket is created.
@@ -453,6 +527,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             value of Content-Length header, if present. Otherwise, raise error.
         """
         self.num_requests += 1
+        if self.metrics is not None:
+            self.metrics.increment(self, "requests")
 
         timeout_obj = self._get_timeout(timeout)
         timeout_obj.start_connect()
@@ -487,6 +563,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 new_e = _wrap_proxy_error(new_e, conn.proxy.scheme)
             raise new_e
 
+        if self.metrics is not None:
+            sent = time.monotonic()
+
         # conn.request() calls http.client.*.request, not the method in
         # urllib3.request. It also calls makefile (recv) on the socket.
         try:
@@ -536,6 +615,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             self._raise_timeout(err=e, url=url, timeout_value=read_timeout)
             raise
 
+        if self.metrics is not None:
+            self.metrics.observe(self, "time_to_first_byte", time.monotonic() - sent)
+
         # Set properties that are used by the pooling layer.
         response.retries = retries
         response._connection = response_conn  # type: ignore[attr-defined]
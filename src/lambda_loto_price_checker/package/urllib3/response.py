@@ -69,9 +69,22 @@ log = logging.getLogger(__name__)
 
 
 class ContentDecoder:
-    def decompress(self, data: bytes) -> bytes:
+    def decompress(self, data: bytes, max_length: int = -1) -> bytes:
+        """
+        Decompress ``data``, returning at most ``max_length`` bytes if it is
+        positive. Input that could not be decompressed within the limit is
+        kept, and comes out of later calls, which may pass ``b""``.
+        """
         raise NotImplementedError()
 
+    @property
+    def has_unconsumed_tail(self) -> bool:
+        """
+        Whether the last call to decompress() stopped at ``max_length``, in
+        which case calling it again may produce output without new input.
+        """
+        return False
+
     def flush(self) -> bytes:
         raise NotImplementedError()
 
@@ -81,17 +94,27 @@ class DeflateDecoder(ContentDecoder):
         self._first_try = True
         self._data = b""
         self._obj = zlib.decompressobj()
+        self._unconsumed_tail = b""
+        self._output_full = False
+
+    @property
+    def has_unconsumed_tail(self) -> bool:
+        return self._output_full
 
-    def decompress(self, data: bytes) -> bytes:
-        if not data:
+    def decompress(self, data: bytes, max_length: int = -1) -> bytes:
+        if self._unconsumed_tail:
+            data = self._unconsumed_tail + data
+            self._unconsumed_tail = b""
+
+        if not data and not self._output_full:
             return data
 
         if not self._first_try:
-            return self._obj.decompress(data)
+            return self._decompress(data, max_length)
 
         self._data += data
         try:
-            decompressed = self._obj.decompress(data)
+            decompressed = self._decompress(data, max_length)
             if decompressed:
                 self._first_try = False
                 self._data = None  # type: ignore[assignment]
@@ -100,12 +123,22 @@ class DeflateDecoder(ContentDecoder):
             self._first_try = False
             self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
             try:
-                return self.decompress(self._data)
+                return self.decompress(self._data, max_length)
             finally:
                 self._data = None  # type: ignore[assignment]
 
+    def _decompress(self, data: bytes, max_length: int) -> bytes:
+        # zlib takes 0, not a negative number, for "no limit".
+        decompressed = self._obj.decompress(data, max(max_length, 0))
+        # Past the end of the stream, the tail is the same as unused_data.
+        if not self._obj.eof:
+            self._unconsumed_tail = self._obj.unconsumed_tail
+        self._output_full = 0 < max_length <= len(decompressed)
+        return decompressed
+
     def flush(self) -> bytes:
-        return self._obj.flush()
+        ret = self.decompress(b"")
+        return ret + self._obj.flush()
 
 
 class GzipDecoderState:
@@ -118,30 +151,52 @@ class GzipDecoder(ContentDecoder):
     def __init__(self) -> None:
         self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
         self._state = GzipDecoderState.FIRST_MEMBER
+        self._unconsumed_tail = b""
+        self._output_full = False
 
-    def decompress(self, data: bytes) -> bytes:
+    @property
+    def has_unconsumed_tail(self) -> bool:
+        return self._output_full
+
+    def decompress(self, data: bytes, max_length: int = -1) -> bytes:
         ret = bytearray()
-        if self._state == GzipDecoderState.SWALLOW_DATA or not data:
+        if self._unconsumed_tail:
+            data = self._unconsumed_tail + data
+            self._unconsumed_tail = b""
+        if self._state == GzipDecoderState.SWALLOW_DATA or (
+            not data and not self._output_full
+        ):
             return bytes(ret)
         while True:
+            if 0 < max_length <= len(ret):
+                # The next member has to wait for the next call.
+                self._unconsumed_tail = data
+                break
             try:
-                ret += self._obj.decompress(data)
+                ret += self._obj.decompress(data, max(max_length - len(ret), 0))
             except zlib.error:
                 previous_state = self._state
                 # Ignore data after the first error
                 self._state = GzipDecoderState.SWALLOW_DATA
+                self._output_full = False
                 if previous_state == GzipDecoderState.OTHER_MEMBERS:
                     # Allow trailing garbage acceptable in other gzip clients
                     return bytes(ret)
                 raise
+            if self._obj.unconsumed_tail and not self._obj.eof:
+                self._unconsumed_tail = self._obj.unconsumed_tail
+                break
             data = self._obj.unused_data
             if not data:
-                return bytes(ret)
+                break
             self._state = GzipDecoderState.OTHER_MEMBERS
             self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._output_full = 0 < max_length <= len(ret)
+        return bytes(ret)
 
     def flush(self) -> bytes:
-        return self._obj.flush()
+        ret = self.decompress(b"")
+        return ret + self._obj.flush()
 
 
 if brotli is not None:
@@ -153,9 +208,14 @@ if brotli is not None:
         def __init__(self) -> None:
             self._obj = brotli.Decompressor()
             if hasattr(self._obj, "decompress"):
-                setattr(self, "decompress", self._obj.decompress)
+                self._decompress = self._obj.decompress
             else:
-                setattr(self, "decompress", self._obj.process)
+                self._decompress = self._obj.process
+
+        def decompress(self, data: bytes, max_length: int = -1) -> bytes:
+            # Neither package can bound the output, so max_length is
+            # not honoured.
+            return self._decompress(data)  # type: ignore[no-any-return]
 
         def flush(self) -> bytes:
             if hasattr(self._obj, "flush"):
@@ -169,7 +229,9 @@ if HAS_ZSTD:
         def __init__(self) -> None:
             self._obj = zstd.ZstdDecompressor().decompressobj()
 
-        def decompress(self, data: bytes) -> bytes:
+        def decompress(self, data: bytes, max_length: int = -1) -> bytes:
+            # zstandard's decompressobj can't bound the output, so
+            # max_length is not honoured.
             if not data:
                 return b""
             data_parts = [self._obj.decompress(data)]
@@ -198,12 +260,18 @@ class MultiDecoder(ContentDecoder):
     def __init__(self, modes: str) -> None:
         self._decoders = [_get_decoder(m.strip()) for m in modes.split(",")]
 
+    @property
+    def has_unconsumed_tail(self) -> bool:
+        return any(d.has_unconsumed_tail for d in self._decoders)
+
     def flush(self) -> bytes:
         return self._decoders[0].flush()
 
-    def decompress(self, data: bytes) -> bytes:
+    def decompress(self, data: bytes, max_length: int = -1) -> bytes:
+        # Each stage is bounded, what a stage can't take yet stays in
+        # its own unconsumed tail.
         for d in reversed(self._decoders):
-            data = d.decompress(data)
+            data = d.decompress(data, max_length)
         return data
 
 
@@ -238,12 +306,13 @@ class BytesQueueBuffer:
      * self.buffer, which contains the full data
      * the largest chunk that we will copy in get()
 
-    The worst case scenario is a single chunk, in which case we'll make a full copy of
-    the data inside get().
+    A chunk that answers a get() on its own is handed out as is, without a copy, and
+    what is left of a chunk after a partial get() stays a memoryview of it. Use
+    get_into() to copy the data straight into a buffer of your own.
     """
 
     def __init__(self) -> None:
-        self.buffer: typing.Deque[bytes] = collections.deque()
+        self.buffer: typing.Deque[bytes | memoryview] = collections.deque()
         self._size: int = 0
 
     def __len__(self) -> int:
@@ -261,6 +330,12 @@ class BytesQueueBuffer:
         elif n < 0:
             raise ValueError("n should be > 0")
 
+        chunk = self.buffer[0]
+        if len(chunk) == n or (len(chunk) < n and len(self.buffer) == 1):
+            self.buffer.popleft()
+            self._size -= len(chunk)
+            return chunk if isinstance(chunk, bytes) else chunk.tobytes()
+
         fetched = 0
         ret = io.BytesIO()
         while fetched < n:
@@ -268,7 +343,8 @@ class BytesQueueBuffer:
             chunk = self.buffer.popleft()
             chunk_length = len(chunk)
             if remaining < chunk_length:
-                left_chunk, right_chunk = chunk[:remaining], chunk[remaining:]
+                view = memoryview(chunk)
+                left_chunk, right_chunk = view[:remaining], view[remaining:]
                 ret.write(left_chunk)
                 self.buffer.appendleft(right_chunk)
                 self._size -= remaining
@@ -289,7 +365,8 @@ class BytesQueueBuffer:
             assert self._size == 0
             return b""
         if len(buffer) == 1:
-            result = buffer.pop()
+            chunk = buffer.pop()
+            result = chunk if isinstance(chunk, bytes) else chunk.tobytes()
         else:
             ret = io.BytesIO()
             ret.writelines(buffer.popleft() for _ in range(len(buffer)))
@@ -297,6 +374,27 @@ class BytesQueueBuffer:
         self._size = 0
         return result
 
+    def get_into(self, b: memoryview) -> int:
+        """
+        Move up to ``len(b)`` bytes into ``b`` and return how many were moved.
+        """
+        filled = 0
+        wanted = len(b)
+        while filled < wanted and self.buffer:
+            chunk = self.buffer.popleft()
+            chunk_length = len(chunk)
+            remaining = wanted - filled
+            if remaining < chunk_length:
+                view = memoryview(chunk)
+                b[filled:wanted] = view[:remaining]
+                self.buffer.appendleft(view[remaining:])
+                filled = wanted
+            else:
+                b[filled : filled + chunk_length] = chunk
+                filled += chunk_length
+        self._size -= filled
+        return filled
+
 
 class BaseHTTPResponse(io.IOBase):
     CONTENT_DECODERS = ["gzip", "x-gzip", "deflate"]
@@ -467,10 +565,17 @@ class BaseHTTPResponse(io.IOBase):
                     self._decoder = _get_decoder(content_encoding)
 
     def _decode(
-        self, data: bytes, decode_content: bool | None, flush_decoder: bool
+        self,
+        data: bytes,
+        decode_content: bool | None,
+        flush_decoder: bool,
+        max_length: int = -1,
     ) -> bytes:
         """
         Decode the data passed in and potentially flush the decoder.
+
+        If ``max_length`` is positive, at most that many bytes come out of the
+        decoder, and it is not flushed while it still holds input.
         """
         if not decode_content:
             if self._has_decoded_content:
@@ -482,7 +587,7 @@ class BaseHTTPResponse(io.IOBase):
 
         try:
             if self._decoder:
-                data = self._decoder.decompress(data)
+                data = self._decoder.decompress(data, max_length)
                 self._has_decoded_content = True
         except self.DECODER_ERROR_CLASSES as e:
             content_encoding = self.headers.get("content-encoding", "").lower()
@@ -491,11 +596,17 @@ class BaseHTTPResponse(io.IOBase):
                 "failed to decode it." % content_encoding,
                 e,
             ) from e
-        if flush_decoder:
+        if flush_decoder and not self._has_unconsumed_tail():
             data += self._flush_decoder()
 
         return data
 
+    def _has_unconsumed_tail(self) -> bool:
+        """
+        Whether the decoder stopped short of its input at a ``max_length``.
+        """
+        return self._decoder is not None and self._decoder.has_unconsumed_tail
+
     def _flush_decoder(self) -> bytes:
         """
         Flushes the decoder. Should only be called if the decoder is actually
@@ -913,6 +1024,39 @@ class HTTPResponse(BaseHTTPResponse):
                 self.length_remaining -= len(data)
         return data
 
+    def _raw_readinto(self, b: memoryview) -> int:
+        """
+        Reads up to ``len(b)`` bytes from the socket straight into ``b``.
+        """
+        if self._fp is None:
+            return 0
+
+        fp_closed = getattr(self._fp, "closed", False)
+
+        # Same overflow concern as in _fp_read(), but here a short read
+        # is fine: readinto() asks again for the rest.
+        c_int_max = 2**31 - 1
+        if len(b) > c_int_max and (util.IS_PYOPENSSL or sys.version_info < (3, 10)):
+            b = b[: 2**28]
+
+        with self._error_catcher():
+            n = self._fp.readinto(b) if not fp_closed else 0
+            if len(b) != 0 and not n:
+                # See _raw_read() for why the connection is closed here.
+                self._fp.close()
+                if (
+                    self.enforce_content_length
+                    and self.length_remaining is not None
+                    and self.length_remaining != 0
+                ):
+                    raise IncompleteRead(self._fp_bytes_read, self.length_remaining)
+
+        if n:
+            self._fp_bytes_read += n
+            if self.length_remaining is not None:
+                self.length_remaining -= n
+        return n or 0
+
     def read(
         self,
         amt: int | None = None,
@@ -956,7 +1100,11 @@ class HTTPResponse(BaseHTTPResponse):
 
         flush_decoder = amt is None or (amt != 0 and not data)
 
-        if not data and len(self._decoded_buffer) == 0:
+        if (
+            not data
+            and len(self._decoded_buffer) == 0
+            and not self._has_unconsumed_tail()
+        ):
             return data
 
         if amt is None:
@@ -973,16 +1121,30 @@ class HTTPResponse(BaseHTTPResponse):
                     )
                 return data
 
-            decoded_data = self._decode(data, decode_content, flush_decoder)
-            self._decoded_buffer.put(decoded_data)
-
-            while len(self._decoded_buffer) < amt and data:
+            # Decode no more than asked for, so a small and highly compressed
+            # chunk doesn't end up in the buffer as a large decoded one.
+            while True:
+                decoded_data = self._decode(
+                    data,
+                    decode_content,
+                    flush_decoder,
+                    max_length=amt - len(self._decoded_buffer),
+                )
+                self._decoded_buffer.put(decoded_data)
+                if len(self._decoded_buffer) >= amt:
+                    break
+                if self._has_unconsumed_tail():
+                    # Get the rest out of the decoder before reading more.
+                    data = b""
+                    continue
+                if flush_decoder:
+                    # The body is all read and the decoder flushed.
+                    break
                 # TODO make sure to initially read enough data to get past the headers
                 # For example, the GZ file header takes 10 bytes, we don't want to read
                 # it one byte at a time
                 data = self._raw_read(amt)
-                decoded_data = self._decode(data, decode_content, flush_decoder)
-                self._decoded_buffer.put(decoded_data)
+                flush_decoder = not data
             data = self._decoded_buffer.get(amt)
 
         return data
@@ -1023,24 +1185,66 @@ class HTTPResponse(BaseHTTPResponse):
         if amt == 0:
             return b""
 
-        # FIXME, this method's type doesn't say returning None is possible
-        data = self._raw_read(amt, read1=True)
-        if not decode_content or data is None:
-            return data
+        max_length = amt if amt is not None else -1
+        if self._has_decoded_content and self._has_unconsumed_tail():
+            # Get the rest out of the decoder before reading more.
+            data = b""
+            flush_decoder = False
+        else:
+            # FIXME, this method's type doesn't say returning None is possible
+            data = self._raw_read(amt, read1=True)
+            if not decode_content or data is None:
+                return data
+            flush_decoder = not data
 
         self._init_decoder()
         while True:
-            flush_decoder = not data
-            decoded_data = self._decode(data, decode_content, flush_decoder)
+            decoded_data = self._decode(
+                data, decode_content, flush_decoder, max_length
+            )
             self._decoded_buffer.put(decoded_data)
-            if decoded_data or flush_decoder:
+            if decoded_data:
+                break
+            if self._has_unconsumed_tail():
+                data = b""
+                continue
+            if flush_decoder:
                 break
             data = self._raw_read(8192, read1=True)
+            flush_decoder = not data
 
         if amt is None:
             return self._decoded_buffer.get_all()
         return self._decoded_buffer.get(amt)
 
+    def readinto(self, b: bytearray) -> int:
+        """
+        Read up to ``len(b)`` bytes of the body into ``b`` and return how many
+        were read, like :meth:`io.BufferedIOBase.readinto`.
+
+        When the body is not encoded, or ``decode_content`` is off, the bytes
+        go from the socket straight into ``b`` without an intermediate copy.
+        """
+        self._init_decoder()
+        if (self._decoder is not None and self.decode_content) or not hasattr(
+            self._fp, "readinto"
+        ):
+            return super().readinto(b)
+        if not self.decode_content and self._has_decoded_content:
+            raise RuntimeError(
+                "Calling read(decode_content=False) is not supported after "
+                "read(decode_content=True) was called."
+            )
+
+        view = memoryview(b).cast("B")
+        filled = self._decoded_buffer.get_into(view)
+        while filled < len(view):
+            n = self._raw_readinto(view[filled:])
+            if not n:
+                break
+            filled += n
+        return filled
+
     def stream(
         self, amt: int | None = 2**16, decode_content: bool | None = None
     ) -> typing.Generator[bytes]:
@@ -1062,7 +1266,11 @@ class HTTPResponse(BaseHTTPResponse):
         if self.chunked and self.supports_chunked_reads():
             yield from self.read_chunked(amt, decode_content=decode_content)
         else:
-            while not is_fp_closed(self._fp) or len(self._decoded_buffer) > 0:
+            while (
+                not is_fp_closed(self._fp)
+                or len(self._decoded_buffer) > 0
+                or self._has_unconsumed_tail()
+            ):
                 data = self.read(amt=amt, decode_content=decode_content)
 
                 if data:
@@ -1180,7 +1388,7 @@ class HTTPResponse(BaseHTTPResponse):
         :param amt:
             How much of the content to read. If specified, caching is skipped
             because it doesn't make sense to cache partial content as the full
-            response.
+            response. Decoded chunks are no longer than ``amt`` either.
 
         :param decode_content:
             If True, will attempt to decode the body based on the
@@ -1221,10 +1429,24 @@ class HTTPResponse(BaseHTTPResponse):
                     break
                 chunk = self._handle_chunk(amt)
                 decoded = self._decode(
-                    chunk, decode_content=decode_content, flush_decoder=False
+                    chunk,
+                    decode_content=decode_content,
+                    flush_decoder=False,
+                    max_length=amt or -1,
                 )
                 if decoded:
                     yield decoded
+                # A small compressed chunk can inflate to much more than amt
+                # bytes, hand them out amt at a time.
+                while decode_content and self._has_unconsumed_tail():
+                    decoded = self._decode(
+                        b"",
+                        decode_content=decode_content,
+                        flush_decoder=False,
+                        max_length=amt or -1,
+                    )
+                    if decoded:
+                        yield decoded
 
             if decode_content:
                 # On CPython and PyPy, we should never need to flush the
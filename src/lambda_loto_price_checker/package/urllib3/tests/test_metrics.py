@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from urllib3 import PoolManager, PoolMetrics
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import EmptyPoolError
+from urllib3.metrics import PoolEvent
+
+
+class _Connection(HTTPConnection):
+    # Never connects, but passes for an open connection until dropped.
+    dropped = False
+
+    @property
+    def is_connected(self) -> bool:
+        return not self.dropped
+
+
+def _pool(metrics: PoolMetrics, block: bool = False) -> HTTPConnectionPool:
+    pool = HTTPConnectionPool("localhost", 80, maxsize=1, block=block, metrics=metrics)
+    pool.ConnectionCls = _Connection
+    return pool
+
+
+class TestPoolMetrics:
+    def test_counters(self) -> None:
+        metrics = PoolMetrics()
+        pool = _pool(metrics)
+
+        # None idle yet, then the same one twice.
+        conn = pool._get_conn()
+        pool._put_conn(conn)
+        assert pool._get_conn() is conn
+        conn.dropped = True  # type: ignore[attr-defined]
+        pool._put_conn(conn)
+        assert pool._get_conn() is conn
+
+        # A second one at the same time doesn't fit back in the pool.
+        other = pool._get_conn()
+        pool._put_conn(conn)
+        pool._put_conn(other)
+
+        assert pool.metrics is metrics
+        assert metrics.counters(pool) == {
+            "requests": 0,
+            "connections_new": 2,
+            "connections_reset": 1,
+            "connections_reused": 1,
+            "connections_discarded": 1,
+            "pool_empty": 1,
+        }
+
+    def test_block(self) -> None:
+        metrics = PoolMetrics()
+        pool = _pool(metrics, block=True)
+
+        conn = pool._get_conn()
+        with pytest.raises(EmptyPoolError):
+            pool._get_conn(timeout=0.03)
+        pool._put_conn(conn)
+
+        assert metrics.counters(pool)["pool_empty"] == 1
+        queue_wait = metrics.histogram(pool, "queue_wait")
+        assert queue_wait is not None
+        assert queue_wait["count"] == 2
+        assert queue_wait["sum"] >= 0.03
+        # The wait that ended empty-handed is counted past the 25ms bucket.
+        buckets = queue_wait["buckets"]
+        assert sum(count for bound, count in buckets if bound > 0.025) == 1
+
+    def test_connection_age(self) -> None:
+        metrics = PoolMetrics()
+        pool = _pool(metrics)
+        assert metrics.histogram(pool, "connection_age") is None
+
+        pool._put_conn(pool._get_conn())
+        time.sleep(0.03)
+        pool._put_conn(pool._get_conn())
+
+        connection_age = metrics.histogram(pool, "connection_age")
+        assert connection_age is not None
+        assert connection_age["count"] == 1
+        assert connection_age["sum"] >= 0.03
+
+    def test_snapshot(self) -> None:
+        metrics = PoolMetrics(buckets=(1.0, 0.5))
+        http = PoolManager(metrics=metrics)
+        pool = http.connection_from_host("localhost", 80)
+        assert pool.metrics is metrics
+        pool.ConnectionCls = _Connection
+
+        for _ in range(4):
+            pool._put_conn(pool._get_conn())
+
+        snapshot = metrics.snapshot()
+        assert list(snapshot) == ["http://localhost:80"]
+        host = snapshot["http://localhost:80"]
+        assert host["counters"]["connections_new"] == 1
+        assert host["counters"]["connections_reused"] == 3
+        assert host["reuse_ratio"] == 0.75
+        assert set(host["histograms"]) == {"queue_wait", "connection_age"}
+        assert host["histograms"]["queue_wait"]["count"] == 4
+        assert [bound for bound, _ in host["histograms"]["queue_wait"]["buckets"]] == [
+            0.5,
+            1.0,
+            float("inf"),
+        ]
+
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_hooks(self) -> None:
+        metrics = PoolMetrics()
+        pool = _pool(metrics)
+        events: list[PoolEvent] = []
+        metrics.add_hook(events.append)
+
+        pool._put_conn(pool._get_conn())
+        pool._put_conn(pool._get_conn())
+        assert [event.name for event in events] == [
+            "queue_wait",
+            "connections_new",
+            "queue_wait",
+            "connections_reused",
+            "connection_age",
+        ]
+        assert {(event.scheme, event.host, event.port) for event in events} == {
+            ("http", "localhost", 80)
+        }
+        assert events[1].value == 1
+
+        metrics.remove_hook(events.append)
+        pool._put_conn(pool._get_conn())
+        assert len(events) == 5
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from urllib3 import PoolManager
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.util import PoolSizing
+
+
+def _contend(pool: HTTPConnectionPool, threads: int, hold: float) -> None:
+    # Check connections out at the same time and hold on to them for a
+    # while, without ever connecting.
+    barrier = threading.Barrier(threads)
+
+    def use() -> None:
+        barrier.wait()
+        conn = pool._get_conn(timeout=5)
+        time.sleep(hold)
+        pool._put_conn(conn)
+
+    workers = [threading.Thread(target=use) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+class TestPoolSizing:
+    @pytest.mark.parametrize("block", [False, True])
+    def test_contended_pools_grow(self, block: bool) -> None:
+        sizing = PoolSizing(max_size=8, interval=0)
+        http = PoolManager(maxsize=1, block=block, pool_sizing=sizing)
+        pool = http.connection_from_host("localhost", 80)
+        assert pool.pool is not None
+        assert pool.pool.maxsize == 1
+
+        sizes = []
+        for _ in range(4):
+            _contend(pool, threads=4, hold=0.02)
+            sizing.adjust(http)
+            sizes.append(pool.pool.maxsize)
+
+        # At most doubling each time, up to the number of threads that
+        # wanted a connection at once.
+        assert sizes[0] == 2
+        assert sizes == sorted(sizes)
+        assert 4 <= sizes[-1] <= 8
+
+    def test_quiet_pools_stay(self) -> None:
+        sizing = PoolSizing(max_size=8, interval=0)
+        http = PoolManager(maxsize=2, block=True, pool_sizing=sizing)
+        pool = http.connection_from_host("localhost", 80)
+        assert pool.pool is not None
+
+        # One request at a time never waits for a connection.
+        for _ in range(3):
+            _contend(pool, threads=1, hold=0.02)
+            sizing.adjust(http)
+        assert pool.pool.maxsize == 2
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import gzip
+import http.client
+import io
+import zlib
+
+import pytest
+
+from urllib3.exceptions import IncompleteRead, ProtocolError
+from urllib3.response import HTTPResponse
+
+BODY = bytes(range(256)) * 40 + b"hello world" * 300
+CHAINED = {
+    "gzip, deflate": zlib.compress(gzip.compress(BODY)),
+    "deflate, gzip": gzip.compress(zlib.compress(BODY)),
+}
+LARGE_BODY = b"hello world" * 20000
+LARGE = {
+    "gzip": gzip.compress(LARGE_BODY),
+    "deflate": zlib.compress(LARGE_BODY),
+    "gzip, deflate": zlib.compress(gzip.compress(LARGE_BODY)),
+}
+
+
+def _chunks(response: HTTPResponse, method: str, amt: int) -> list[bytes]:
+    chunks = []
+    while True:
+        if method == "readinto":
+            buffer = bytearray(amt)
+            chunk = bytes(buffer[: response.readinto(buffer)])
+        else:
+            chunk = getattr(response, method)(amt)
+        if not chunk:
+            return chunks
+        chunks.append(chunk)
+
+
+class TestChainedEncodings:
+    @pytest.mark.parametrize("content_encoding", list(CHAINED))
+    @pytest.mark.parametrize("method", ["read", "read1", "readinto"])
+    def test_small_reads(self, content_encoding: str, method: str) -> None:
+        # A decoder stage can produce nothing for a while before the
+        # body is all read. That mustn't end the body early.
+        for amt in (1, 2, 3, 7, 10, 16, 45, 1000):
+            response = HTTPResponse(
+                io.BytesIO(CHAINED[content_encoding]),
+                headers={"content-encoding": content_encoding},
+                preload_content=False,
+            )
+            chunks = _chunks(response, method, amt)
+            assert b"".join(chunks) == BODY
+            assert max(len(chunk) for chunk in chunks) <= amt
+
+    def test_stream(self) -> None:
+        response = HTTPResponse(
+            io.BytesIO(CHAINED["gzip, deflate"]),
+            headers={"content-encoding": "gzip, deflate"},
+            preload_content=False,
+        )
+        assert b"".join(response.stream(3)) == BODY
+
+
+class _Socket:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    def makefile(self, mode: str) -> io.BytesIO:
+        return io.BytesIO(self._data)
+
+
+def _chunked(body: bytes, content_encoding: str) -> HTTPResponse:
+    # The compressed body in chunks of 100 bytes, behind the headers.
+    chunks = [body[start : start + 100] for start in range(0, len(body), 100)]
+    message = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Transfer-Encoding: chunked\r\n"
+        b"Content-Encoding: " + content_encoding.encode() + b"\r\n\r\n"
+        + b"".join(b"%x\r\n%s\r\n" % (len(chunk), chunk) for chunk in chunks)
+        + b"0\r\n\r\n"
+    )
+    original = http.client.HTTPResponse(
+        _Socket(message), method="GET"  # type: ignore[arg-type]
+    )
+    original.begin()
+    return HTTPResponse(
+        original,
+        headers={
+            "transfer-encoding": "chunked",
+            "content-encoding": content_encoding,
+        },
+        preload_content=False,
+        original_response=original,
+    )
+
+
+class TestChunkedDecoding:
+    @pytest.mark.parametrize("content_encoding", list(LARGE))
+    @pytest.mark.parametrize("amt", [7, 1000, 65536])
+    def test_stream_bounded(self, content_encoding: str, amt: int) -> None:
+        # Each chunk of 100 compressed bytes inflates to far more than amt.
+        response = _chunked(LARGE[content_encoding], content_encoding)
+        chunks = list(response.stream(amt, decode_content=True))
+        assert b"".join(chunks) == LARGE_BODY
+        assert max(len(chunk) for chunk in chunks) <= amt
+
+    def test_read_chunked_whole(self) -> None:
+        response = _chunked(LARGE["gzip"], "gzip")
+        assert b"".join(response.read_chunked(decode_content=True)) == LARGE_BODY
+
+
+def _identity(body: bytes = BODY, length: int | None = None) -> HTTPResponse:
+    return HTTPResponse(
+        io.BytesIO(body),
+        headers={"content-length": str(len(body) if length is None else length)},
+        preload_content=False,
+    )
+
+
+class TestIdentityReadinto:
+    @pytest.mark.parametrize("size", [1, 7, 1000, len(BODY), len(BODY) + 100])
+    def test_buffer_sizes(self, size: int) -> None:
+        response = _identity()
+        chunks = _chunks(response, "readinto", size)
+        assert b"".join(chunks) == BODY
+        assert max(len(chunk) for chunk in chunks) == min(size, len(BODY))
+        assert response.length_remaining == 0
+
+        buffer = bytearray(10)
+        assert response.readinto(buffer) == 0
+
+    def test_mixed_with_read(self) -> None:
+        response = _identity()
+        buffer = bytearray(100)
+        parts = [response.read(5)]
+        parts.append(bytes(buffer[: response.readinto(buffer)]))
+        parts.append(response.read(1))
+        parts.append(bytes(buffer[: response.readinto(buffer)]))
+        parts.append(response.read())
+        assert [len(part) for part in parts[:4]] == [5, 100, 1, 100]
+        assert b"".join(parts) == BODY
+
+        assert response.readinto(buffer) == 0
+        assert response.read() == b""
+
+    def test_after_read1(self) -> None:
+        # read1() may leave bytes in the decoded buffer, readinto() hands
+        # them out before reading from the body again.
+        response = _identity()
+        first = response.read1(3)
+        buffer = bytearray(len(BODY))
+        size = response.readinto(buffer)
+        assert first + bytes(buffer[:size]) + response.read() == BODY
+
+    def test_truncated_body(self) -> None:
+        response = _identity(BODY[:100], length=len(BODY))
+        buffer = bytearray(64)
+        assert response.readinto(buffer) == 64
+        with pytest.raises(ProtocolError) as exc_info:
+            while response.readinto(buffer):
+                pass
+        assert isinstance(exc_info.value.args[1], IncompleteRead)
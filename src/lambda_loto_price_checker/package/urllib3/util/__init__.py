@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from .connection import is_connection_dropped
+from .pool_sizing import PoolSizing
 from .request import SKIP_HEADER, SKIPPABLE_HEADERS, make_headers
 from .response import is_fp_closed
 from .retry import Retry
@@ -23,6 +24,7 @@ __all__ = (
     "IS_PYOPENSSL",
     "SSLContext",
     "ALPN_PROTOCOLS",
+    "PoolSizing",
     "Retry",
     "Timeout",
     "Url",
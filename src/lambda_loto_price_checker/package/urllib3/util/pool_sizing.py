@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing
+import weakref
+
+from ..exceptions import ClosedPoolError
+
+if typing.TYPE_CHECKING:
+    from ..connectionpool import HTTPConnectionPool
+    from ..metrics import PoolMetrics
+    from ..poolmanager import PoolManager
+
+log = logging.getLogger(__name__)
+
+
+class PoolSizing:
+    """Adaptive sizing of the pools of a :class:`~urllib3.PoolManager`.
+
+    Every ``interval`` seconds, on the way to a request, the manager's
+    pools are looked at through its :class:`~urllib3.PoolMetrics`:
+
+    * A pool that ran out of connections (``pool_empty``), had to
+      discard some because it was full (``connections_discarded``), or
+      kept requests waiting for a connection longer than
+      ``wait_threshold`` seconds (``queue_wait``) grows by that many
+      connections, at most doubling at once, up to ``max_size``.
+    * A pool that handed out no connection for ``idle_timeout`` seconds
+      is halved, down to ``min_size``, and again after each further
+      ``idle_timeout``.
+    * All pools together keep at most ``max_total`` connections. When a
+      pool needs to grow past that, pools that were not used since the
+      last look are cut to ``min_size`` first.
+
+    With ``block=True`` pools these sizes are a hard limit on open
+    connections, and requests waiting for one is what makes the pools
+    grow. Otherwise they are what the pools keep: connections opened
+    beyond them still get discarded after use, which is what makes the
+    pools grow. A new pool gets at least ``min_size``, even when the
+    other pools already use up ``max_total``.
+
+    One instance is meant for one manager:
+
+    .. code-block:: python
+
+        sizing = urllib3.util.PoolSizing(max_size=50, max_total=200)
+        http = urllib3.PoolManager(maxsize=4, pool_sizing=sizing)
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 32,
+        max_total: int | None = None,
+        interval: float = 1.0,
+        idle_timeout: float = 60.0,
+        wait_threshold: float = 0.005,
+    ) -> None:
+        if min_size < 1:
+            raise ValueError("min_size must be at least 1")
+        if max_size < min_size:
+            raise ValueError("max_size can't be less than min_size")
+        if max_total is not None and max_total < min_size:
+            raise ValueError("max_total can't be less than min_size")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_total = max_total
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self.wait_threshold = wait_threshold
+
+        self._next_adjust = 0.0
+        self._lock = threading.Lock()
+        # Checkouts and pressure last seen, and when a pool was last busy.
+        self._seen: weakref.WeakKeyDictionary[
+            HTTPConnectionPool, tuple[int, int]
+        ] = weakref.WeakKeyDictionary()
+        self._busy_at: weakref.WeakKeyDictionary[HTTPConnectionPool, float] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(min_size={self.min_size}, "
+            f"max_size={self.max_size}, max_total={self.max_total})"
+        )
+
+    def new_pool(self, manager: PoolManager, pool: HTTPConnectionPool) -> None:
+        """
+        Fit a pool the manager just made within ``max_size`` and
+        ``max_total``.
+        """
+        size = _size(pool)
+        limit = self.max_size
+        if self.max_total is not None:
+            others = sum(_size(p) for p in manager.pools.values() if p is not pool)
+            limit = min(limit, self.max_total - others)
+        target = min(max(size, self.min_size), max(limit, self.min_size))
+        if target != size:
+            pool.resize(target)
+
+    def adjust(self, manager: PoolManager) -> None:
+        """
+        Resize the manager's pools, if ``interval`` has passed since the
+        last time.
+        """
+        now = time.monotonic()
+        if now < self._next_adjust or manager.metrics is None:
+            return
+        # Another thread is at it already.
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._next_adjust = now + self.interval
+            self._adjust(manager.pools.values(), manager.metrics, now)
+        finally:
+            self._lock.release()
+
+    def _adjust(
+        self,
+        pools: list[HTTPConnectionPool],
+        metrics: PoolMetrics,
+        now: float,
+    ) -> None:
+        pressured: list[tuple[int, HTTPConnectionPool]] = []
+        quiet: list[HTTPConnectionPool] = []
+        total = 0
+
+        for pool in pools:
+            if pool.pool is None:
+                continue
+            counters = metrics.counters(pool)
+            checkouts = (
+                counters["connections_new"]
+                + counters["connections_reset"]
+                + counters["connections_reused"]
+            )
+            pressure = (
+                counters["pool_empty"]
+                + counters["connections_discarded"]
+                + self._slow_waits(metrics, pool)
+            )
+            last_checkouts, last_pressure = self._seen.get(pool, (0, 0))
+            self._seen[pool] = (checkouts, pressure)
+
+            if checkouts != last_checkouts:
+                self._busy_at[pool] = now
+            size = _size(pool)
+
+            if pressure > last_pressure:
+                pressured.append((pressure - last_pressure, pool))
+            elif checkouts == last_checkouts and size > self.min_size:
+                if now - self._busy_at.setdefault(pool, now) >= self.idle_timeout:
+                    size = self._resize(pool, max(self.min_size, size // 2))
+                    self._busy_at[pool] = now
+                quiet.append(pool)
+            total += size
+
+        # Most pressed first, they get the budget if it runs short.
+        pressured.sort(key=lambda item: item[0], reverse=True)
+        for wanted, pool in pressured:
+            size = _size(pool)
+            target = min(self.max_size, size + min(wanted, size))
+            if self.max_total is not None:
+                while quiet and total + target - size > self.max_total:
+                    quiet_pool = quiet.pop()
+                    total -= _size(quiet_pool) - self._resize(
+                        quiet_pool, self.min_size
+                    )
+                target = min(target, size + max(self.max_total - total, 0))
+            if target > size:
+                total += self._resize(pool, target) - size
+
+    def _slow_waits(self, metrics: PoolMetrics, pool: HTTPConnectionPool) -> int:
+        """
+        How many times ``pool`` kept a request waiting for a connection
+        longer than ``wait_threshold``, as far as the buckets of the
+        ``queue_wait`` histogram tell.
+        """
+        histogram = metrics.histogram(pool, "queue_wait")
+        if histogram is None:
+            return 0
+        waits = 0
+        lower = 0.0
+        for upper, count in histogram["buckets"]:
+            if lower >= self.wait_threshold:
+                waits += count
+            lower = upper
+        return waits
+
+    def _resize(self, pool: HTTPConnectionPool, maxsize: int) -> int:
+        size = _size(pool)
+        if pool.pool is None or maxsize == size:
+            return size
+        try:
+            new_size = pool.resize(maxsize)
+        except ClosedPoolError:
+            # Evicted from the manager meanwhile.
+            return 0
+        log.debug(
+            "Resized connection pool for %s:%s from %d to %d",
+            pool.host,
+            pool.port,
+            size,
+            new_size,
+        )
+        return new_size
+
+
+def _size(pool: HTTPConnectionPool) -> int:
+    queue = pool.pool
+    return queue.maxsize if queue is not None else 0
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import codecs
 import logging
+from concurrent.futures import Executor, Future
 from os import PathLike
-from typing import BinaryIO
+from time import monotonic
+from typing import BinaryIO, List, Optional, Tuple
 
+from .cache import DetectionCache, get_detection_cache
 from .cd import (
     coherence_ratio,
     encoding_languages,
@@ -21,6 +25,7 @@ from .utils import (
     is_cp_similar,
     is_multi_byte_encoding,
     should_strip_sig_or_bom,
+    undecodable_bytes,
 )
 
 logger = logging.getLogger("charset_normalizer")
@@ -29,6 +34,9 @@ explain_handler.setFormatter(
     logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
 )
 
+#: Mess ratios, early stop count and merged coherence (None if the probing gave up) of a code page.
+_ProbeResult = Tuple[List[float], int, Optional[List[Tuple[str, float]]]]
+
 
 def from_bytes(
     sequences: bytes | bytearray,
@@ -41,6 +49,10 @@ def from_bytes(
     explain: bool = False,
     language_threshold: float = 0.1,
     enable_fallback: bool = True,
+    executor: Executor | None = None,
+    deadline: float | None = None,
+    max_candidates: int | None = None,
+    cache: DetectionCache | None = None,
 ) -> CharsetMatches:
     """
     Given a raw bytes sequence, return the best possibles charset usable to render str objects.
@@ -58,6 +70,98 @@ def from_bytes(
     By default the library does not setup any handler other than the NullHandler, if you choose to set the 'explain'
     toggle to True it will alter the logger configuration to add a StreamHandler that is suitable for debugging.
     Custom logging format and handler can be set manually.
+
+    Single byte code pages that cannot decode one of the bytes present in the sequence are discarded without
+    decoding the payload. Give an executor (eg. a ProcessPoolExecutor) to probe the remaining single byte code pages
+    concurrently, the result stays the same as the serial path. Set deadline (in seconds) or max_candidates to bound
+    the number of code pages tested, the best match found so far is then returned.
+
+    The results are looked up in and stored to the given DetectionCache, or the one set with set_detection_cache().
+    Detections that are explained or given a deadline/max_candidates budget bypass the cache.
+    """
+    if cache is None:
+        cache = get_detection_cache()
+
+    if cache is None or explain or deadline is not None or max_candidates is not None:
+        return _from_bytes(
+            sequences,
+            steps,
+            chunk_size,
+            threshold,
+            cp_isolation,
+            cp_exclusion,
+            preemptive_behaviour,
+            explain,
+            language_threshold,
+            enable_fallback,
+            executor,
+            deadline,
+            max_candidates,
+        )
+
+    if not isinstance(sequences, (bytearray, bytes)):
+        raise TypeError(
+            "Expected object of type bytes or bytearray, got: {}".format(
+                type(sequences)
+            )
+        )
+
+    cache_key: str = cache.key(
+        sequences,
+        steps,
+        chunk_size,
+        threshold,
+        cp_isolation,
+        cp_exclusion,
+        preemptive_behaviour,
+        language_threshold,
+        enable_fallback,
+    )
+
+    cached_results: CharsetMatches | None = cache.get(cache_key, sequences)
+
+    if cached_results is not None:
+        logger.debug("Encoding detection: reusing the cached results.")
+        return cached_results
+
+    started_at: float = monotonic()
+
+    results: CharsetMatches = _from_bytes(
+        sequences,
+        steps,
+        chunk_size,
+        threshold,
+        cp_isolation,
+        cp_exclusion,
+        preemptive_behaviour,
+        explain,
+        language_threshold,
+        enable_fallback,
+        executor,
+    )
+
+    cache.put(cache_key, results, monotonic() - started_at)
+
+    return results
+
+
+def _from_bytes(
+    sequences: bytes | bytearray,
+    steps: int = 5,
+    chunk_size: int = 512,
+    threshold: float = 0.2,
+    cp_isolation: list[str] | None = None,
+    cp_exclusion: list[str] | None = None,
+    preemptive_behaviour: bool = True,
+    explain: bool = False,
+    language_threshold: float = 0.1,
+    enable_fallback: bool = True,
+    executor: Executor | None = None,
+    deadline: float | None = None,
+    max_candidates: int | None = None,
+) -> CharsetMatches:
+    """
+    The detection itself, see from_bytes.
     """
 
     if not isinstance(sequences, (bytearray, bytes)):
@@ -159,6 +263,12 @@ def from_bytes(
 
     results: CharsetMatches = CharsetMatches()
 
+    give_up_at: float | None = monotonic() + deadline if deadline is not None else None
+    candidates_count: int = 0
+
+    present_bytes: frozenset[int] | None = None
+    pending_probes: dict[str, Future[_ProbeResult | None]] | None = None
+
     early_stop_results: CharsetMatches = CharsetMatches()
 
     sig_encoding, sig_payload = identify_sig_or_bom(sequences)
@@ -177,7 +287,9 @@ def from_bytes(
     if "utf_8" not in prioritized_encodings:
         prioritized_encodings.append("utf_8")
 
-    for encoding_iana in prioritized_encodings + IANA_SUPPORTED:
+    candidates: list[str] = prioritized_encodings + IANA_SUPPORTED
+
+    for position, encoding_iana in enumerate(candidates):
         if cp_isolation and encoding_iana not in cp_isolation:
             continue
 
@@ -187,6 +299,43 @@ def from_bytes(
         if encoding_iana in tested:
             continue
 
+        if (max_candidates is not None and candidates_count >= max_candidates) or (
+            give_up_at is not None and monotonic() >= give_up_at
+        ):
+            logger.log(
+                TRACE,
+                "Detection budget exhausted after %i code page(s). Stopping before %s.",
+                candidates_count,
+                encoding_iana,
+            )
+            break
+
+        if (
+            executor is not None
+            and pending_probes is None
+            and position >= len(prioritized_encodings)
+            and not explain
+            and not is_too_large_sequence
+        ):
+            pending_probes = _submit_probes(
+                executor,
+                sequences,
+                [
+                    cp
+                    for cp in candidates[position:]
+                    if cp not in tested
+                    and (not cp_isolation or cp in cp_isolation)
+                    and (not cp_exclusion or cp not in cp_exclusion)
+                ],
+                steps,
+                chunk_size,
+                threshold,
+                language_threshold,
+                max_candidates - candidates_count
+                if max_candidates is not None
+                else None,
+            )
+
         tested.add(encoding_iana)
 
         decoded_payload: str | None = None
@@ -220,6 +369,26 @@ def from_bytes(
             )
             continue
 
+        if (
+            not is_multi_byte_decoder
+            and not is_too_large_sequence
+            and not bom_or_sig_available
+        ):
+            if present_bytes is None:
+                present_bytes = frozenset(sequences)
+
+            if not present_bytes.isdisjoint(undecodable_bytes(encoding_iana)):
+                logger.log(
+                    TRACE,
+                    "Code page %s does not fit given bytes sequence at ALL. "
+                    "At least one byte of the sequence is undefined in it.",
+                    encoding_iana,
+                )
+                tested_but_hard_failure.append(encoding_iana)
+                continue
+
+        candidates_count += 1
+
         try:
             if is_too_large_sequence and is_multi_byte_decoder is False:
                 str(
@@ -266,6 +435,15 @@ def from_bytes(
             )
             continue
 
+        probe: _ProbeResult | None = None
+
+        if pending_probes is not None and encoding_iana in pending_probes:
+            probe = pending_probes.pop(encoding_iana).result()
+
+            # The probe worked on the raw bytes, it only holds if each byte gave a single character.
+            if decoded_payload is None or len(decoded_payload) != length:
+                probe = None
+
         r_ = range(
             0 if not bom_or_sig_available else len(sig_payload),
             length,
@@ -295,17 +473,24 @@ def from_bytes(
         md_chunks: list[str] = []
         md_ratios = []
 
+        if probe is not None:
+            md_ratios, early_stop_count = probe[0], probe[1]
+
         try:
-            for chunk in cut_sequence_chunks(
-                sequences,
-                encoding_iana,
-                r_,
-                chunk_size,
-                bom_or_sig_available,
-                strip_sig_or_bom,
-                sig_payload,
-                is_multi_byte_decoder,
-                decoded_payload,
+            for chunk in (
+                cut_sequence_chunks(
+                    sequences,
+                    encoding_iana,
+                    r_,
+                    chunk_size,
+                    bom_or_sig_available,
+                    strip_sig_or_bom,
+                    sig_payload,
+                    is_multi_byte_decoder,
+                    decoded_payload,
+                )
+                if probe is None
+                else ()
             ):
                 md_chunks.append(chunk)
 
@@ -413,7 +598,7 @@ def from_bytes(
 
         # We shall skip the CD when its about ASCII
         # Most of the time its not relevant to run "language-detection" on it.
-        if encoding_iana != "ascii":
+        if encoding_iana != "ascii" and probe is None:
             for chunk in md_chunks:
                 chunk_languages = coherence_ratio(
                     chunk,
@@ -423,7 +608,11 @@ def from_bytes(
 
                 cd_ratios.append(chunk_languages)
 
-        cd_ratios_merged = merge_coherence_ratios(cd_ratios)
+        cd_ratios_merged = (
+            merge_coherence_ratios(cd_ratios)
+            if probe is None or probe[2] is None
+            else probe[2]
+        )
 
         if cd_ratios_merged:
             logger.log(
@@ -465,6 +654,7 @@ def from_bytes(
                 if explain:  # Defensive: ensure exit path clean handler
                     logger.removeHandler(explain_handler)
                     logger.setLevel(previous_logger_level)
+                _cancel_probes(pending_probes)
                 return CharsetMatches([current_match])
 
             early_stop_results.append(current_match)
@@ -483,6 +673,7 @@ def from_bytes(
             if explain:  # Defensive: ensure exit path clean handler
                 logger.removeHandler(explain_handler)
                 logger.setLevel(previous_logger_level)
+            _cancel_probes(pending_probes)
 
             return CharsetMatches([probable_result])
 
@@ -495,8 +686,11 @@ def from_bytes(
             if explain:  # Defensive: ensure exit path clean handler
                 logger.removeHandler(explain_handler)
                 logger.setLevel(previous_logger_level)
+            _cancel_probes(pending_probes)
             return CharsetMatches([results[encoding_iana]])
 
+    _cancel_probes(pending_probes)
+
     if len(results) == 0:
         if fallback_u8 or fallback_ascii or fallback_specified:
             logger.log(
@@ -541,6 +735,118 @@ def from_bytes(
     return results
 
 
+def _probe_code_page(
+    encoding_iana: str,
+    chunks: list[bytes],
+    threshold: float,
+    max_chunk_gave_up: int,
+    language_threshold: float,
+) -> _ProbeResult | None:
+    """
+    Run the chaos and coherence probing of from_bytes on the raw chunks of a single byte code page.
+    Meant to be executed by a worker, thus it only takes and returns picklable objects.
+    """
+    md_chunks: list[str] = []
+    md_ratios: list[float] = []
+    early_stop_count: int = 0
+
+    try:
+        for cut_sequence in chunks:
+            md_chunks.append(cut_sequence.decode(encoding_iana))
+            md_ratios.append(mess_ratio(md_chunks[-1], threshold))
+
+            if md_ratios[-1] >= threshold:
+                early_stop_count += 1
+
+            if early_stop_count >= max_chunk_gave_up:
+                break
+    except UnicodeDecodeError:
+        return None
+
+    mean_mess_ratio: float = sum(md_ratios) / len(md_ratios) if md_ratios else 0.0
+
+    if mean_mess_ratio >= threshold or early_stop_count >= max_chunk_gave_up:
+        return md_ratios, early_stop_count, None
+
+    target_languages: list[str] = encoding_languages(encoding_iana)
+
+    return (
+        md_ratios,
+        early_stop_count,
+        merge_coherence_ratios(
+            [
+                coherence_ratio(
+                    chunk,
+                    language_threshold,
+                    ",".join(target_languages) if target_languages else None,
+                )
+                for chunk in md_chunks
+            ]
+        ),
+    )
+
+
+def _submit_probes(
+    executor: Executor,
+    sequences: bytes | bytearray,
+    encodings: list[str],
+    steps: int,
+    chunk_size: int,
+    threshold: float,
+    language_threshold: float,
+    limit: int | None,
+) -> dict[str, Future[_ProbeResult | None]]:
+    """
+    Schedule the probing of every single byte code page that can decode the whole sequence.
+    from_bytes still walks through the candidates in order, it only picks up the results.
+    """
+    present_bytes: frozenset[int] = frozenset(sequences)
+    offsets = range(0, len(sequences), int(len(sequences) / steps))
+    max_chunk_gave_up: int = max(int(len(offsets) / 4), 2)
+
+    chunks: list[bytes] = []
+
+    for i in offsets:
+        cut_sequence = bytes(sequences[i : i + chunk_size])
+        if not cut_sequence:
+            break
+        chunks.append(cut_sequence)
+
+    pending_probes: dict[str, Future[_ProbeResult | None]] = {}
+
+    for encoding_iana in encodings:
+        if limit is not None and len(pending_probes) >= limit:
+            break
+
+        try:
+            if is_multi_byte_encoding(encoding_iana):
+                continue
+        except (ModuleNotFoundError, ImportError):
+            continue
+
+        if not present_bytes.isdisjoint(undecodable_bytes(encoding_iana)):
+            continue
+
+        pending_probes[encoding_iana] = executor.submit(
+            _probe_code_page,
+            encoding_iana,
+            chunks,
+            threshold,
+            max_chunk_gave_up,
+            language_threshold,
+        )
+
+    return pending_probes
+
+
+def _cancel_probes(
+    pending_probes: dict[str, Future[_ProbeResult | None]] | None,
+) -> None:
+    if pending_probes:
+        for future in pending_probes.values():
+            future.cancel()
+
+
 def from_fp(
     fp: BinaryIO,
     steps: int = 5,
@@ -666,3 +972,552 @@ def is_binary(
         )
 
     return not guesses
+
+
+class _StreamCandidate:
+    """
+    Running state of a code page under test in a StreamingDetector.
+    """
+
+    def __init__(self, encoding: str, is_multi_byte: bool, skip: int = 0) -> None:
+        self.encoding: str = encoding
+        self.is_multi_byte: bool = is_multi_byte
+        # Single byte code pages are checked against the set of bytes seen so far, no decoder needed.
+        self.decoder: codecs.IncrementalDecoder | None = (
+            codecs.getincrementaldecoder(encoding)(errors="strict")
+            if is_multi_byte
+            else None
+        )
+        # Amount of leading bytes (the SIG/BOM) not to give to the decoder.
+        self.skip: int = skip
+
+        self.pending: list[str] = []
+        # Characters given by the decoder for how many bytes, to tell how much multi byte characters are used.
+        self.decoded_chars: int = 0
+        self.decoded_bytes: int = 0
+        # Mess ratio and decoded text of the windows kept so far, by offset.
+        self.samples: dict[int, tuple[float, str]] = {}
+
+        self.alive: bool = True
+        self.hard_failure: bool = False
+
+    @property
+    def mean_mess_ratio(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(ratio for ratio, _ in self.samples.values()) / len(self.samples)
+
+    @property
+    def multi_byte_usage(self) -> float:
+        if not self.decoded_bytes:
+            return 0.0
+        return 1.0 - self.decoded_chars / self.decoded_bytes
+
+    def early_stop_count(self, threshold: float) -> int:
+        return sum(1 for ratio, _ in self.samples.values() if ratio >= threshold)
+
+
+class StreamingDetector:
+    """
+    Push-style counterpart of from_bytes, for payloads that should not be held in memory (large files, sockets, logs).
+    Feed it the bytes as they arrive, stop reading as soon as `done` is True if you like, then call result().
+
+        >>> detector = StreamingDetector()
+        >>> for block in iter(lambda: fp.read(65536), b""):
+        ...     detector.feed(block)
+        ...     if detector.done:
+        ...         break
+        >>> detector.result().best()
+
+    Every byte goes through the surviving candidates, so a code page that cannot decode it is dropped at once.
+    Like from_bytes, chaos is measured on chunk_size windows spread evenly from the head to the tail of the bytes
+    given so far: once more than 2*steps windows are kept, every other one is forgotten and the spacing doubles. The
+    work and the memory stay bounded whatever the size of the stream. The matches hold the first HEAD_SIZE bytes only.
+    A stream that ends within HEAD_SIZE bytes gets the very same result as from_bytes. A character cut short by the
+    end of the bytes given is not held against a code page, since the caller may stop reading anywhere.
+    """
+
+    #: Bytes buffered before the candidates are set up, then kept from the beginning of the stream.
+    HEAD_SIZE: int = 65536
+
+    def __init__(
+        self,
+        steps: int = 5,
+        chunk_size: int = 512,
+        threshold: float = 0.2,
+        cp_isolation: list[str] | None = None,
+        cp_exclusion: list[str] | None = None,
+        preemptive_behaviour: bool = True,
+        language_threshold: float = 0.1,
+        enable_fallback: bool = True,
+    ) -> None:
+        self.steps: int = steps
+        self.chunk_size: int = chunk_size
+        self.threshold: float = threshold
+        self.cp_isolation: list[str] = (
+            [iana_name(cp, False) for cp in cp_isolation] if cp_isolation else []
+        )
+        self.cp_exclusion: list[str] = (
+            [iana_name(cp, False) for cp in cp_exclusion] if cp_exclusion else []
+        )
+        self.preemptive_behaviour: bool = preemptive_behaviour
+        self.language_threshold: float = language_threshold
+        self.enable_fallback: bool = enable_fallback
+
+        self.specified_encoding: str | None = None
+        self.sig_encoding: str | None = None
+        self._sig_payload: bytes = b""
+
+        self._head: bytes = b""
+        self._buffer: bytearray = bytearray()
+        self._candidates: list[_StreamCandidate] | None = None
+
+        self._position: int = 0
+        self._seen: bytes = b""
+        self._window: bytearray = bytearray()
+        self._window_start: int = 0
+        self._window_stride: int = 0
+        self._window_offsets: list[int] = []
+
+        self._sample_count: int = 0
+        self._last_elimination: int = 0
+        self._closed: bool = False
+
+    @property
+    def prioritized_encodings(self) -> list[str]:
+        return [
+            cp
+            for cp in (self.specified_encoding, self.sig_encoding, "ascii", "utf_8")
+            if cp is not None
+        ]
+
+    def feed(self, data: bytes | bytearray) -> None:
+        """
+        Give the next bytes of the stream to the detector.
+        """
+        if not isinstance(data, (bytearray, bytes)):
+            raise TypeError(
+                "Expected object of type bytes or bytearray, got: {}".format(
+                    type(data)
+                )
+            )
+
+        if self._closed:
+            raise ValueError("Unable to feed a StreamingDetector once result() was called.")
+
+        if not data:
+            return
+
+        if self._candidates is None:
+            self._buffer += data
+
+            if len(self._buffer) < self.HEAD_SIZE:
+                return
+
+            data = bytes(self._buffer)
+            self._buffer = bytearray()
+            self._setup(data[: self.HEAD_SIZE])
+
+        self._consume(bytes(data))
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether feeding more bytes is unlikely to change the result. Always True once every candidate is eliminated.
+        """
+        if self._candidates is None:
+            return False
+
+        alive: list[_StreamCandidate] = [c for c in self._candidates if c.alive]
+
+        if not alive:
+            return True
+
+        if self._sample_count < self.steps:
+            return False
+
+        if len(alive) == 1:
+            return True
+
+        # Only ASCII so far, most code pages decode it alike and any byte to come may tell them apart.
+        if not self._seen or self._seen[-1] < 0x80:
+            return False
+
+        # Nothing got eliminated while taking the last samples, the survivors are settled.
+        return self._sample_count - self._last_elimination >= self.steps
+
+    def result(self) -> CharsetMatches:
+        """
+        Close the detector and return the plausible matches for the bytes given so far, best first.
+        """
+        if self._candidates is None:
+            # The whole stream fits in the head, nothing to gain over from_bytes.
+            self._head = bytes(self._buffer)
+            self._buffer = bytearray()
+            self._closed = True
+
+            return from_bytes(
+                self._head,
+                self.steps,
+                self.chunk_size,
+                self.threshold,
+                self.cp_isolation or None,
+                self.cp_exclusion or None,
+                self.preemptive_behaviour,
+                language_threshold=self.language_threshold,
+                enable_fallback=self.enable_fallback,
+            )
+
+        if not self._closed:
+            self._close()
+
+        assert self._candidates is not None
+
+        matches: list[CharsetMatch] = []
+        early_stop_results: CharsetMatches = CharsetMatches()
+        fallbacks: dict[str, CharsetMatch] = {}
+        soft_failures: list[str] = []
+
+        for candidate in self._candidates:
+            if candidate.hard_failure:
+                continue
+
+            if not candidate.alive:
+                soft_failures.append(candidate.encoding)
+                if self.enable_fallback and candidate.encoding in (
+                    self.specified_encoding,
+                    "ascii",
+                    "utf_8",
+                ):
+                    fallbacks[candidate.encoding] = self._match(
+                        candidate, self.threshold, []
+                    )
+                continue
+
+            if any(
+                is_cp_similar(candidate.encoding, encoding_soft_failed)
+                for encoding_soft_failed in soft_failures
+            ):
+                logger.log(
+                    TRACE,
+                    "%s is deemed too similar to a code page that was consider unsuited already.",
+                    candidate.encoding,
+                )
+                continue
+
+            languages: list[tuple[str, float]] = []
+
+            # We shall skip the CD when its about ASCII
+            if candidate.encoding != "ascii":
+                target_languages: list[str] = (
+                    mb_encoding_languages(candidate.encoding)
+                    if candidate.is_multi_byte
+                    else encoding_languages(candidate.encoding)
+                )
+                languages = merge_coherence_ratios(
+                    [
+                        coherence_ratio(
+                            chunk,
+                            self.language_threshold,
+                            ",".join(target_languages) if target_languages else None,
+                        )
+                        for _, chunk in (
+                            candidate.samples[offset]
+                            for offset in sorted(candidate.samples)
+                        )
+                    ]
+                )
+
+            current_match = self._match(
+                candidate, candidate.mean_mess_ratio, languages
+            )
+
+            if candidate.encoding == self.sig_encoding:
+                logger.debug(
+                    "Encoding detection: %s is most likely the one as we detected a BOM or SIG within "
+                    "the beginning of the stream.",
+                    candidate.encoding,
+                )
+                return CharsetMatches([current_match])
+
+            if (
+                candidate.encoding in (self.specified_encoding, "ascii", "utf_8")
+                and candidate.mean_mess_ratio < 0.1
+            ):
+                # If md says nothing to worry about, then... stop immediately!
+                if candidate.mean_mess_ratio == 0.0:
+                    logger.debug(
+                        "Encoding detection: %s is most likely the one.",
+                        candidate.encoding,
+                    )
+                    return CharsetMatches([current_match])
+
+                early_stop_results.append(current_match)
+
+            matches.append(current_match)
+
+        if len(early_stop_results):
+            return CharsetMatches([early_stop_results.best()])  # type: ignore[list-item]
+
+        # Code pages that only differ past the head decode it alike, the best ranked one has to come first so that
+        # the others become its submatches rather than the other way round.
+        results: CharsetMatches = CharsetMatches()
+
+        for current_match in sorted(matches):
+            results.append(current_match)
+
+        if len(results) == 0:
+            for encoding in (self.specified_encoding, "utf_8", "ascii"):
+                if encoding in fallbacks:
+                    logger.debug(
+                        "Encoding detection: %s will be used as a fallback match",
+                        encoding,
+                    )
+                    results.append(fallbacks[encoding])
+                    break
+
+        return results
+
+    def _match(
+        self, candidate: _StreamCandidate, mean_mess_ratio: float, languages: list[tuple[str, float]]
+    ) -> CharsetMatch:
+        head: bytes = self._head[candidate.skip :]
+
+        match = CharsetMatch(
+            self._head,
+            candidate.encoding,
+            mean_mess_ratio,
+            candidate.encoding == self.sig_encoding,
+            languages,
+            (
+                codecs.getincrementaldecoder(candidate.encoding)().decode(head)
+                if candidate.is_multi_byte
+                else head.decode(candidate.encoding)
+            ),
+            preemptive_declaration=self.specified_encoding,
+        )
+        # Rank on the whole stream rather than on the head the match holds.
+        match._multi_byte_usage = candidate.multi_byte_usage
+
+        return match
+
+    def _setup(self, head: bytes) -> None:
+        self._head = head
+        self._window_stride = max(self.chunk_size, len(head) // (2 * self.steps))
+
+        if self.preemptive_behaviour:
+            self.specified_encoding = any_specified_encoding(head)
+
+        self.sig_encoding, self._sig_payload = identify_sig_or_bom(head)
+
+        self._candidates = []
+        tested: set[str] = set()
+
+        for encoding_iana in self.prioritized_encodings + IANA_SUPPORTED:
+            if self.cp_isolation and encoding_iana not in self.cp_isolation:
+                continue
+
+            if self.cp_exclusion and encoding_iana in self.cp_exclusion:
+                continue
+
+            if encoding_iana in tested:
+                continue
+
+            tested.add(encoding_iana)
+
+            bom_or_sig_available: bool = self.sig_encoding == encoding_iana
+
+            if (
+                encoding_iana in {"utf_16", "utf_32", "utf_7"}
+                and not bom_or_sig_available
+            ):
+                continue
+
+            try:
+                self._candidates.append(
+                    _StreamCandidate(
+                        encoding_iana,
+                        is_multi_byte_encoding(encoding_iana),
+                        (
+                            len(self._sig_payload)
+                            if bom_or_sig_available
+                            and should_strip_sig_or_bom(encoding_iana)
+                            else 0
+                        ),
+                    )
+                )
+            except (ModuleNotFoundError, ImportError, LookupError):
+                logger.log(
+                    TRACE,
+                    "Encoding %s does not provide an IncrementalDecoder",
+                    encoding_iana,
+                )
+
+    def _eliminate(self, candidate: _StreamCandidate, hard_failure: bool) -> None:
+        candidate.alive = False
+        candidate.hard_failure = hard_failure
+        candidate.decoder = None
+        candidate.pending = []
+        self._last_elimination = self._sample_count
+
+        if hard_failure:
+            logger.log(
+                TRACE,
+                "Code page %s does not fit given bytes stream at ALL (byte %i).",
+                candidate.encoding,
+                self._position,
+            )
+        else:
+            logger.log(
+                TRACE,
+                "%s was excluded because of chaos probing. Gave up %i time(s). "
+                "Computed mean chaos is %f %%.",
+                candidate.encoding,
+                candidate.early_stop_count(self.threshold),
+                round(candidate.mean_mess_ratio * 100, ndigits=3),
+            )
+
+    def _consume(self, data: bytes) -> None:
+        assert self._candidates is not None
+
+        unseen: bytes = data.translate(None, self._seen)
+
+        if unseen:
+            self._seen = bytes(sorted(set(self._seen).union(unseen)))
+
+            for candidate in self._candidates:
+                if (
+                    candidate.alive
+                    and not candidate.is_multi_byte
+                    and not frozenset(unseen).isdisjoint(
+                        undecodable_bytes(candidate.encoding)
+                    )
+                ):
+                    self._eliminate(candidate, True)
+
+        offset: int = 0
+
+        while offset < len(data):
+            position: int = self._position + offset
+            in_window: bool = position >= self._window_start
+            end: int = min(
+                len(data),
+                offset
+                + self._window_start
+                + (self.chunk_size if in_window else 0)
+                - position,
+            )
+            segment: bytes = data[offset:end]
+
+            for candidate in self._candidates:
+                if not candidate.alive or candidate.decoder is None:
+                    continue
+
+                if candidate.skip > position:
+                    chunk_segment = segment[candidate.skip - position :]
+                else:
+                    chunk_segment = segment
+
+                try:
+                    text: str = candidate.decoder.decode(chunk_segment)
+                except UnicodeDecodeError:
+                    self._eliminate(candidate, True)
+                    continue
+
+                candidate.decoded_chars += len(text)
+                candidate.decoded_bytes += len(chunk_segment)
+
+                if in_window:
+                    candidate.pending.append(text)
+
+            offset = end
+
+            if in_window:
+                self._window += segment
+
+                if self._position + offset == self._window_start + self.chunk_size:
+                    self._sample()
+
+        self._position += len(data)
+
+    def _sample(self) -> None:
+        assert self._candidates is not None
+
+        window: bytes = bytes(self._window)
+        offset: int = self._window_start
+
+        for candidate in self._candidates:
+            if not candidate.alive:
+                continue
+
+            if candidate.is_multi_byte:
+                chunk: str = "".join(candidate.pending)
+                candidate.pending = []
+            else:
+                chunk = window.decode(candidate.encoding)
+
+            if chunk:
+                candidate.samples[offset] = (mess_ratio(chunk, self.threshold), chunk)
+
+        self._sample_count += 1
+        self._window = bytearray()
+        self._window_offsets.append(offset)
+
+        # Too many windows kept, forget every other one so that they still cover the whole stream evenly.
+        if len(self._window_offsets) > 2 * self.steps:
+            self._window_stride *= 2
+            self._window_offsets = [
+                kept for kept in self._window_offsets if kept % self._window_stride == 0
+            ]
+
+            for candidate in self._candidates:
+                candidate.samples = {
+                    kept: candidate.samples[kept]
+                    for kept in self._window_offsets
+                    if kept in candidate.samples
+                }
+
+        self._window_start = (offset // self._window_stride + 1) * self._window_stride
+
+        max_chunk_gave_up: int = max(int(len(self._window_offsets) / 4), 2)
+
+        for candidate in self._candidates:
+            if candidate.alive and (
+                candidate.early_stop_count(self.threshold) >= max_chunk_gave_up
+                or (
+                    len(candidate.samples) >= self.steps
+                    and candidate.mean_mess_ratio >= self.threshold
+                )
+            ):
+                self._eliminate(candidate, False)
+
+    def _close(self) -> None:
+        assert self._candidates is not None
+
+        # Now that the length is known, keep the windows nearest to the chunks from_bytes would take.
+        offsets: range = range(
+            0, self._position, max(int(self._position / self.steps), 1)
+        )
+        nearest: set[int] = {
+            min(self._window_offsets, key=lambda kept: abs(kept - offset))
+            for offset in offsets
+        }
+        max_chunk_gave_up: int = max(int(len(offsets) / 4), 2)
+
+        for candidate in self._candidates:
+            if not candidate.alive:
+                continue
+
+            candidate.samples = {
+                kept: sample
+                for kept, sample in candidate.samples.items()
+                if kept in nearest
+            }
+
+            if (
+                candidate.early_stop_count(self.threshold) >= max_chunk_gave_up
+                or candidate.mean_mess_ratio >= self.threshold
+            ):
+                self._eliminate(candidate, False)
+
+        self._closed = True
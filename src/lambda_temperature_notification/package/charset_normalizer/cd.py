@@ -134,6 +134,22 @@ def get_target_features(language: str) -> tuple[bool, bool]:
     return target_have_accents, target_pure_latin
 
 
+@lru_cache(maxsize=LANGUAGE_SUPPORTED_COUNT)
+def get_language_ranks(language: str) -> dict[str, int]:
+    """
+    Map each character of a supported language to its rank in FREQUENCIES, computed on first use.
+    """
+    if language not in FREQUENCIES:
+        raise ValueError(f"{language} not available")
+
+    ranks: dict[str, int] = {}
+
+    for rank, character in enumerate(FREQUENCIES[language]):
+        ranks.setdefault(character, rank)
+
+    return ranks
+
+
 def alphabet_languages(
     characters: list[str], ignore_non_latin: bool = False
 ) -> list[str]:
@@ -143,6 +159,7 @@ def alphabet_languages(
     languages: list[tuple[str, float]] = []
 
     source_have_accents = any(is_accentuated(character) for character in characters)
+    characters_set: set[str] = set(characters)
 
     for language, language_characters in FREQUENCIES.items():
         target_have_accents, target_pure_latin = get_target_features(language)
@@ -156,7 +173,7 @@ def alphabet_languages(
         character_count: int = len(language_characters)
 
         character_match_count: int = len(
-            [c for c in language_characters if c in characters]
+            [c for c in language_characters if c in characters_set]
         )
 
         ratio: float = character_match_count / character_count
@@ -177,27 +194,31 @@ def characters_popularity_compare(
     The result is a ratio between 0. (absolutely no correspondence) and 1. (near perfect fit).
     Beware that is function is not strict on the match in order to ease the detection. (Meaning close match is 1.)
     """
-    if language not in FREQUENCIES:
-        raise ValueError(f"{language} not available")
+    language_ranks: dict[str, int] = get_language_ranks(language)
 
     character_approved_count: int = 0
-    FREQUENCIES_language_set = set(FREQUENCIES[language])
 
     ordered_characters_count: int = len(ordered_characters)
     target_language_characters_count: int = len(FREQUENCIES[language])
 
     large_alphabet: bool = target_language_characters_count > 26
 
-    for character, character_rank in zip(
-        ordered_characters, range(0, ordered_characters_count)
+    expected_projection_ratio: float = (
+        target_language_characters_count / ordered_characters_count
+    )
+
+    # Rank in the language of each ordered character, or the alphabet size when absent.
+    ordered_ranks_in_language: list[int] = [
+        language_ranks.get(character, target_language_characters_count)
+        for character in ordered_characters
+    ]
+
+    for character_rank, character_rank_in_language in enumerate(
+        ordered_ranks_in_language
     ):
-        if character not in FREQUENCIES_language_set:
+        if character_rank_in_language == target_language_characters_count:
             continue
 
-        character_rank_in_language: int = FREQUENCIES[language].index(character)
-        expected_projection_ratio: float = (
-            target_language_characters_count / ordered_characters_count
-        )
         character_rank_projection: int = int(character_rank * expected_projection_ratio)
 
         if (
@@ -214,34 +235,39 @@ def characters_popularity_compare(
             character_approved_count += 1
             continue
 
-        characters_before_source: list[str] = FREQUENCIES[language][
-            0:character_rank_in_language
-        ]
-        characters_after_source: list[str] = FREQUENCIES[language][
-            character_rank_in_language:
-        ]
-        characters_before: list[str] = ordered_characters[0:character_rank]
-        characters_after: list[str] = ordered_characters[character_rank:]
-
+        # Count the characters seen before (or after) this one that the language also ranks before (or after) it.
         before_match_count: int = len(
-            set(characters_before) & set(characters_before_source)
+            {
+                rank
+                for rank in ordered_ranks_in_language[0:character_rank]
+                if rank < character_rank_in_language
+            }
         )
 
         after_match_count: int = len(
-            set(characters_after) & set(characters_after_source)
+            {
+                rank
+                for rank in ordered_ranks_in_language[character_rank:]
+                if character_rank_in_language <= rank < target_language_characters_count
+            }
+        )
+
+        characters_before_source_count: int = character_rank_in_language
+        characters_after_source_count: int = (
+            target_language_characters_count - character_rank_in_language
         )
 
-        if len(characters_before_source) == 0 and before_match_count <= 4:
+        if characters_before_source_count == 0 and before_match_count <= 4:
             character_approved_count += 1
             continue
 
-        if len(characters_after_source) == 0 and after_match_count <= 4:
+        if characters_after_source_count == 0 and after_match_count <= 4:
             character_approved_count += 1
             continue
 
         if (
-            before_match_count / len(characters_before_source) >= 0.4
-            or after_match_count / len(characters_after_source) >= 0.4
+            before_match_count / characters_before_source_count >= 0.4
+            or after_match_count / characters_after_source_count >= 0.4
         ):
             character_approved_count += 1
             continue
@@ -257,27 +283,39 @@ def alpha_unicode_split(decoded_sequence: str) -> list[str]:
     """
     layers: dict[str, str] = {}
 
+    # Look up each distinct character once, then each distinct range once.
+    # Layers are only ever added, so the first one a range fits in stays the same.
+    character_ranges: dict[str, str | None] = {
+        character: unicode_range(character)
+        for character in set(decoded_sequence)
+        if character.isalpha()
+    }
+    range_layers: dict[str, str] = {}
+
     for character in decoded_sequence:
-        if character.isalpha() is False:
+        if character not in character_ranges:
             continue
 
-        character_range: str | None = unicode_range(character)
+        character_range: str | None = character_ranges[character]
 
         if character_range is None:
             continue
 
-        layer_target_range: str | None = None
-
-        for discovered_range in layers:
-            if (
-                is_suspiciously_successive_range(discovered_range, character_range)
-                is False
-            ):
-                layer_target_range = discovered_range
-                break
+        layer_target_range: str | None = range_layers.get(character_range)
 
         if layer_target_range is None:
-            layer_target_range = character_range
+            for discovered_range in layers:
+                if (
+                    is_suspiciously_successive_range(discovered_range, character_range)
+                    is False
+                ):
+                    layer_target_range = discovered_range
+                    break
+
+            if layer_target_range is None:
+                layer_target_range = character_range
+
+            range_layers[character_range] = layer_target_range
 
         if layer_target_range not in layers:
             layers[layer_target_range] = character.lower()
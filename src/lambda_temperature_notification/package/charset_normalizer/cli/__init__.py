@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from .__main__ import cli_detect, query_yes_no
+from .__main__ import cli_batch, cli_detect, query_yes_no
 
 __all__ = (
+    "cli_batch",
     "cli_detect",
     "query_yes_no",
 )
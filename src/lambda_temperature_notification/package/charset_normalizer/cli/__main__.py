@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import nullcontext
+from glob import iglob
+from itertools import islice
 from json import dumps
-from os.path import abspath, basename, dirname, join, realpath
+from os.path import abspath, basename, dirname, isfile, join, realpath
 from platform import python_version
+from time import perf_counter
+from typing import Any, Iterator
 from unicodedata import unidata_version
 
 import charset_normalizer.md as md_module
-from charset_normalizer import from_fp
-from charset_normalizer.models import CliDetectionResult
+from charset_normalizer import from_bytes, from_fp
+from charset_normalizer.models import CharsetMatches, CliDetectionResult
 from charset_normalizer.version import __version__
 
 
@@ -46,12 +59,340 @@ def query_yes_no(question: str, default: str = "yes") -> bool:
             sys.stdout.write("Please respond with 'yes' or 'no' " "(or 'y' or 'n').\n")
 
 
+def detection_results(
+    path: str, matches: CharsetMatches, alternatives: bool = False
+) -> list[CliDetectionResult]:
+    """
+    Describe the best match (and the other ones if alternatives is set) of a file, as printed by the CLI.
+    """
+    best_guess = matches.best()
+
+    if best_guess is None:
+        return [
+            CliDetectionResult(
+                path,
+                None,
+                [],
+                [],
+                "Unknown",
+                [],
+                False,
+                1.0,
+                0.0,
+                None,
+                True,
+            )
+        ]
+
+    x_ = [
+        CliDetectionResult(
+            path,
+            best_guess.encoding,
+            best_guess.encoding_aliases,
+            [cp for cp in best_guess.could_be_from_charset if cp != best_guess.encoding],
+            best_guess.language,
+            best_guess.alphabets,
+            best_guess.bom,
+            best_guess.percent_chaos,
+            best_guess.percent_coherence,
+            None,
+            True,
+        )
+    ]
+
+    if len(matches) > 1 and alternatives:
+        for el in matches:
+            if el != best_guess:
+                x_.append(
+                    CliDetectionResult(
+                        path,
+                        el.encoding,
+                        el.encoding_aliases,
+                        [cp for cp in el.could_be_from_charset if cp != el.encoding],
+                        el.language,
+                        el.alphabets,
+                        el.bom,
+                        el.percent_chaos,
+                        el.percent_coherence,
+                        None,
+                        False,
+                    )
+                )
+
+    return x_
+
+
+def normalized_path(path: str, encoding: str) -> str:
+    """
+    Where the CLI writes the unicode version of a file, eg. "sample.txt" -> "sample.cp1252.txt".
+    """
+    o_: list[str] = basename(realpath(path)).split(".")
+    o_.insert(-1, encoding)
+
+    return join(dirname(realpath(path)), ".".join(o_))
+
+
+def _batch_detect(
+    paths: list[str],
+    threshold: float,
+    preemptive_behaviour: bool,
+    alternatives: bool,
+    normalize: bool,
+) -> list[tuple[list[dict[str, Any]], int, str | None]]:
+    """
+    Detect (and normalize) a few files, in a worker process of cli_batch.
+    Return for each one its results as dicts, its size and the error met if any.
+    """
+    outcomes: list[tuple[list[dict[str, Any]], int, str | None]] = []
+
+    for path in paths:
+        try:
+            with open(path, "rb") as fp:
+                payload: bytes = fp.read()
+
+            matches = from_bytes(
+                payload,
+                threshold=threshold,
+                preemptive_behaviour=preemptive_behaviour,
+            )
+            x_ = detection_results(abspath(path), matches, alternatives)
+            best_guess = matches.best()
+
+            if (
+                normalize
+                and best_guess is not None
+                and not best_guess.encoding.startswith("utf")
+            ):
+                x_[0].unicode_path = normalized_path(path, best_guess.encoding)
+
+                with open(x_[0].unicode_path, "wb") as fp:
+                    fp.write(best_guess.output())
+        except OSError as e:
+            outcomes.append(([], 0, str(e)))
+            continue
+
+        outcomes.append(([el.__dict__ for el in x_], len(payload), None))
+
+    return outcomes
+
+
+def _batch_paths(patterns: list[str], files_from: list[str]) -> Iterator[str]:
+    """
+    Lazily expand the file names, glob patterns and file lists given to cli_batch.
+    """
+    for pattern in patterns:
+        if any(magic in pattern for magic in "*?["):
+            yield from (path for path in iglob(pattern, recursive=True) if isfile(path))
+        else:
+            yield pattern
+
+    for list_path in files_from:
+        list_fp = (
+            open(list_path, encoding="utf_8")
+            if list_path != "-"
+            else nullcontext(sys.stdin)
+        )
+
+        with list_fp as fp:
+            for line in fp:
+                line = line.rstrip("\r\n")
+                if line:
+                    yield line
+
+
+def _batch_chunks(paths: Iterator[str], chunk_size: int) -> Iterator[list[str]]:
+    while True:
+        chunk: list[str] = list(islice(paths, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def cli_batch(argv: list[str] | None = None) -> int:
+    """
+    CLI assistant for large amount of files. The detection runs in a pool of processes and each result is
+    printed as a JSON line as soon as it is known (in completion order), followed by throughput figures on stderr.
+    :param argv:
+    :return: 0 if every file could be read (and normalized), 2 otherwise
+    """
+    parser = argparse.ArgumentParser(
+        prog="normalizer --batch",
+        description="Discover the originating encoding of many files in parallel. "
+        "Print one JSON document per line and file.",
+    )
+
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="File(s) or glob pattern(s) to be analysed, eg. 'pages/**/*.html'",
+    )
+    parser.add_argument(
+        "--files-from",
+        action="append",
+        default=[],
+        dest="files_from",
+        help="Read file names from this file, one per line. Use - for STDIN.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        action="store",
+        default=None,
+        type=int,
+        dest="jobs",
+        help="Number of worker processes, default to the number of CPUs. 0 to work in this process.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        action="store",
+        default=16,
+        type=int,
+        dest="chunk_size",
+        help="Number of files given to a worker at once.",
+    )
+    parser.add_argument(
+        "--max-pending",
+        action="store",
+        default=None,
+        type=int,
+        dest="max_pending",
+        help="Maximum number of chunks in flight, bounds the memory used. Default to twice the number of workers.",
+    )
+    parser.add_argument(
+        "-a",
+        "--with-alternative",
+        action="store_true",
+        default=False,
+        dest="alternatives",
+        help="Output complementary possibilities if any, one JSON line each.",
+    )
+    parser.add_argument(
+        "-n",
+        "--normalize",
+        action="store_true",
+        default=False,
+        dest="normalize",
+        help="Write a unicode copy next to each file that did not come from unicode.",
+    )
+    parser.add_argument(
+        "-i",
+        "--no-preemptive",
+        action="store_true",
+        default=False,
+        dest="no_preemptive",
+        help="Disable looking at a charset declaration to hint the detector.",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        action="store",
+        default=0.2,
+        type=float,
+        dest="threshold",
+        help="Define a custom maximum amount of noise allowed in decoded content. 0. <= noise <= 1.",
+    )
+
+    args = parser.parse_args(argv)
+
+    if not args.files and not args.files_from:
+        print("Give at least one file, glob pattern or --files-from.", file=sys.stderr)
+        return 1
+
+    if args.threshold < 0.0 or args.threshold > 1.0:
+        print("--threshold VALUE should be between 0. AND 1.", file=sys.stderr)
+        return 1
+
+    if args.chunk_size < 1:
+        print("--chunk-size VALUE should be at least 1.", file=sys.stderr)
+        return 1
+
+    jobs: int = args.jobs if args.jobs is not None else (os.cpu_count() or 1)
+    max_pending: int = max(
+        args.max_pending if args.max_pending is not None else jobs * 2, 1
+    )
+    options = (
+        args.threshold,
+        args.no_preemptive is False,
+        args.alternatives,
+        args.normalize,
+    )
+
+    file_count: int = 0
+    byte_count: int = 0
+    error_count: int = 0
+
+    def report(outcomes: list[tuple[list[dict[str, Any]], int, str | None]]) -> None:
+        nonlocal file_count, byte_count, error_count
+
+        for results, size, error in outcomes:
+            file_count += 1
+            byte_count += size
+
+            if error is not None:
+                error_count += 1
+                print(error, file=sys.stderr)
+                continue
+
+            for result in results:
+                sys.stdout.write(dumps(result, ensure_ascii=True) + "\n")
+
+        sys.stdout.flush()
+
+    chunks = _batch_chunks(_batch_paths(args.files, args.files_from), args.chunk_size)
+    started_at: float = perf_counter()
+
+    if jobs == 0:
+        for chunk in chunks:
+            report(_batch_detect(chunk, *options))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pending: set[Future[list[tuple[list[dict[str, Any]], int, str | None]]]] = set()
+
+            try:
+                for chunk in chunks:
+                    if len(pending) >= max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            report(future.result())
+
+                    pending.add(executor.submit(_batch_detect, chunk, *options))
+
+                for future in as_completed(pending):
+                    report(future.result())
+                pending = set()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    elapsed: float = max(perf_counter() - started_at, 1e-9)
+
+    print(
+        "{} file(s), {:.1f} MB in {:.2f}s: {:.1f} files/s, {:.2f} MB/s. {} error(s).".format(
+            file_count,
+            byte_count / 1e6,
+            elapsed,
+            file_count / elapsed,
+            byte_count / 1e6 / elapsed,
+            error_count,
+        ),
+        file=sys.stderr,
+    )
+
+    return 2 if error_count else 0
+
+
 def cli_detect(argv: list[str] | None = None) -> int:
     """
     CLI assistant using ARGV and ArgumentParser
     :param argv:
     :return: 0 if everything is fine, anything else equal trouble
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if "--batch" in argv:
+        return cli_batch([arg for arg in argv if arg != "--batch"])
+
     parser = argparse.ArgumentParser(
         description="The Real First Universal Charset Detector. "
         "Discover originating encoding used on text file. "
@@ -61,6 +402,15 @@ def cli_detect(argv: list[str] | None = None) -> int:
     parser.add_argument(
         "files", type=argparse.FileType("rb"), nargs="+", help="File(s) to be analysed"
     )
+    # Handled before parsing, given here so that --help tells about it.
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        default=False,
+        dest="batch",
+        help="Analyse many files or glob patterns in parallel, one JSON line per file. "
+        "See normalizer --batch --help.",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -174,6 +524,10 @@ def cli_detect(argv: list[str] | None = None) -> int:
 
         best_guess = matches.best()
 
+        x_.extend(
+            detection_results(abspath(my_file.name), matches, args.alternatives)
+        )
+
         if best_guess is None:
             print(
                 'Unable to identify originating encoding for "{}". {}'.format(
@@ -186,65 +540,7 @@ def cli_detect(argv: list[str] | None = None) -> int:
                 ),
                 file=sys.stderr,
             )
-            x_.append(
-                CliDetectionResult(
-                    abspath(my_file.name),
-                    None,
-                    [],
-                    [],
-                    "Unknown",
-                    [],
-                    False,
-                    1.0,
-                    0.0,
-                    None,
-                    True,
-                )
-            )
         else:
-            x_.append(
-                CliDetectionResult(
-                    abspath(my_file.name),
-                    best_guess.encoding,
-                    best_guess.encoding_aliases,
-                    [
-                        cp
-                        for cp in best_guess.could_be_from_charset
-                        if cp != best_guess.encoding
-                    ],
-                    best_guess.language,
-                    best_guess.alphabets,
-                    best_guess.bom,
-                    best_guess.percent_chaos,
-                    best_guess.percent_coherence,
-                    None,
-                    True,
-                )
-            )
-
-            if len(matches) > 1 and args.alternatives:
-                for el in matches:
-                    if el != best_guess:
-                        x_.append(
-                            CliDetectionResult(
-                                abspath(my_file.name),
-                                el.encoding,
-                                el.encoding_aliases,
-                                [
-                                    cp
-                                    for cp in el.could_be_from_charset
-                                    if cp != el.encoding
-                                ],
-                                el.language,
-                                el.alphabets,
-                                el.bom,
-                                el.percent_chaos,
-                                el.percent_coherence,
-                                None,
-                                False,
-                            )
-                        )
-
             if args.normalize is True:
                 if best_guess.encoding.startswith("utf") is True:
                     print(
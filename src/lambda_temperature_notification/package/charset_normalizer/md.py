@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from functools import lru_cache
 from logging import getLogger
+from typing import Iterable
 
 from .constant import (
     COMMON_SAFE_ASCII_CHARACTERS,
     TRACE,
     UNICODE_SECONDARY_RANGE_KEYWORD,
+    UTF8_MAXIMAL_ALLOCATION,
 )
 from .utils import (
     is_accentuated,
@@ -574,6 +576,405 @@ def is_suspiciously_successive_range(
     return True
 
 
+# Character classes, as computed by character_flags().
+FLAG_PRINTABLE: int = 1 << 0
+FLAG_ALPHA: int = 1 << 1
+FLAG_SPACE: int = 1 << 2
+FLAG_DIGIT: int = 1 << 3
+FLAG_UPPER: int = 1 << 4
+FLAG_LOWER: int = 1 << 5
+FLAG_ASCII: int = 1 << 6
+FLAG_COMMON_SAFE: int = 1 << 7
+FLAG_PUNCTUATION: int = 1 << 8
+FLAG_SYMBOL: int = 1 << 9
+FLAG_EMOTICON: int = 1 << 10
+FLAG_SEPARATOR: int = 1 << 11
+FLAG_UNPRINTABLE: int = 1 << 12
+FLAG_ACCENTUATED: int = 1 << 13
+FLAG_LATIN: int = 1 << 14
+FLAG_CASE_VARIABLE: int = 1 << 15
+FLAG_GLYPH: int = 1 << 16  # CJK, Hangul, Hiragana, Katakana or Thai
+FLAG_CJK: int = 1 << 17
+FLAG_ARABIC: int = 1 << 18
+FLAG_ARABIC_ISOLATED_FORM: int = 1 << 19
+FLAG_CJK_INVALID_STOP: int = 1 << 20
+
+
+@lru_cache(maxsize=UTF8_MAXIMAL_ALLOCATION)
+def character_flags(character: str) -> int:
+    """
+    Classify a character once, for every MessDetectorPlugin at the same time.
+    The result is a combination of the FLAG_* constants.
+    """
+    flags: int = 0
+
+    if character.isprintable():
+        flags |= FLAG_PRINTABLE
+    if character.isalpha():
+        flags |= FLAG_ALPHA
+    if character.isspace():
+        flags |= FLAG_SPACE
+    if character.isdigit():
+        flags |= FLAG_DIGIT
+    if character.isupper():
+        flags |= FLAG_UPPER
+    if character.islower():
+        flags |= FLAG_LOWER
+    if character.isascii():
+        flags |= FLAG_ASCII
+    if character in COMMON_SAFE_ASCII_CHARACTERS:
+        flags |= FLAG_COMMON_SAFE
+    if is_punctuation(character):
+        flags |= FLAG_PUNCTUATION
+    if is_symbol(character):
+        flags |= FLAG_SYMBOL
+    if is_emoticon(character):
+        flags |= FLAG_EMOTICON
+    if is_separator(character):
+        flags |= FLAG_SEPARATOR
+    if is_unprintable(character):
+        flags |= FLAG_UNPRINTABLE
+    if is_accentuated(character):
+        flags |= FLAG_ACCENTUATED
+    if is_latin(character):
+        flags |= FLAG_LATIN
+    if is_case_variable(character):
+        flags |= FLAG_CASE_VARIABLE
+    if (
+        is_cjk(character)
+        or is_hangul(character)
+        or is_katakana(character)
+        or is_hiragana(character)
+        or is_thai(character)
+    ):
+        flags |= FLAG_GLYPH
+    if is_cjk(character):
+        flags |= FLAG_CJK
+    if is_arabic(character):
+        flags |= FLAG_ARABIC
+    if is_arabic_isolated_form(character):
+        flags |= FLAG_ARABIC_ISOLATED_FORM
+    if character in {"丅", "丄"}:
+        flags |= FLAG_CJK_INVALID_STOP
+
+    return flags
+
+
+BUILTIN_MESS_DETECTOR_PLUGINS: tuple[type[MessDetectorPlugin], ...] = (
+    TooManySymbolOrPunctuationPlugin,
+    TooManyAccentuatedPlugin,
+    UnprintablePlugin,
+    SuspiciousDuplicateAccentPlugin,
+    SuspiciousRange,
+    SuperWeirdWordPlugin,
+    CjkInvalidStopPlugin,
+    ArchaicUpperLowerPlugin,
+    ArabicIsolatedFormPlugin,
+)
+
+
+def batched_mess_ratio(
+    decoded_sequence: str, maximum_threshold: float = 0.2
+) -> tuple[float, int, list[float]]:
+    """
+    Compute what feeding decoded_sequence through every built-in MessDetectorPlugin would,
+    in a single pass. Each distinct character is classified once by character_flags(),
+    then all the plugin counters are updated together from those flags.
+    Return the mean mess ratio, the intermediary calculation step and each plugin ratio
+    (in BUILTIN_MESS_DETECTOR_PLUGINS order).
+    """
+    length: int = len(decoded_sequence) + 1
+
+    if length < 512:
+        intermediary_mean_mess_ratio_calc: int = 32
+    elif length <= 1024:
+        intermediary_mean_mess_ratio_calc = 64
+    else:
+        intermediary_mean_mess_ratio_calc = 128
+
+    sequence: str = decoded_sequence + "\n"
+    flags_of: dict[str, int] = {
+        character: character_flags(character) for character in set(sequence)
+    }
+
+    # TooManySymbolOrPunctuationPlugin
+    tsp_character_count: int = 0
+    tsp_punctuation_count: int = 0
+    tsp_symbol_count: int = 0
+    tsp_last_printable_char: str | None = None
+    # TooManyAccentuatedPlugin
+    tma_character_count: int = 0
+    tma_accentuated_count: int = 0
+    # UnprintablePlugin
+    unp_character_count: int = 0
+    unp_unprintable_count: int = 0
+    # SuspiciousDuplicateAccentPlugin
+    sda_character_count: int = 0
+    sda_successive_count: int = 0
+    sda_last_latin_character: str | None = None
+    sda_last_flags: int = 0
+    # SuspiciousRange
+    sr_character_count: int = 0
+    sr_suspicious_successive_range_count: int = 0
+    sr_last_printable_seen: bool = False
+    sr_last_range: str | None = None
+    # SuperWeirdWordPlugin
+    sww_word_count: int = 0
+    sww_bad_word_count: int = 0
+    sww_foreign_long_count: int = 0
+    sww_is_current_word_bad: bool = False
+    sww_foreign_long_watch: bool = False
+    sww_character_count: int = 0
+    sww_bad_character_count: int = 0
+    sww_buffer: list[str] = []
+    sww_buffer_accent_count: int = 0
+    sww_buffer_glyph_count: int = 0
+    # CjkInvalidStopPlugin
+    cis_wrong_stop_count: int = 0
+    cis_cjk_character_count: int = 0
+    # ArchaicUpperLowerPlugin
+    aul_buf: bool = False
+    aul_character_count_since_last_sep: int = 0
+    aul_successive_upper_lower_count: int = 0
+    aul_successive_upper_lower_count_final: int = 0
+    aul_character_count: int = 0
+    aul_last_alpha_flags: int | None = None
+    aul_current_ascii_only: bool = True
+    # ArabicIsolatedFormPlugin
+    aif_character_count: int = 0
+    aif_isolated_form_count: int = 0
+
+    ratios: list[float] = [0.0] * len(BUILTIN_MESS_DETECTOR_PLUGINS)
+    mean_mess_ratio: float = 0.0
+
+    for index, character in enumerate(sequence):
+        flags: int = flags_of[character]
+
+        if flags & FLAG_PRINTABLE:
+            # TooManySymbolOrPunctuationPlugin
+            tsp_character_count += 1
+            if character != tsp_last_printable_char and not flags & FLAG_COMMON_SAFE:
+                if flags & FLAG_PUNCTUATION:
+                    tsp_punctuation_count += 1
+                elif (
+                    flags & (FLAG_DIGIT | FLAG_SYMBOL | FLAG_EMOTICON) == FLAG_SYMBOL
+                ):
+                    tsp_symbol_count += 2
+            tsp_last_printable_char = character
+
+            # SuspiciousRange
+            sr_character_count += 1
+            if flags & (FLAG_SPACE | FLAG_PUNCTUATION | FLAG_COMMON_SAFE):
+                sr_last_printable_seen = False
+            else:
+                character_range = unicode_range(character)
+                # Two characters from the same range are never suspicious.
+                if (
+                    sr_last_printable_seen
+                    and (character_range is None or character_range != sr_last_range)
+                    and is_suspiciously_successive_range(
+                        sr_last_range, character_range
+                    )
+                ):
+                    sr_suspicious_successive_range_count += 1
+                sr_last_printable_seen = True
+                sr_last_range = character_range
+
+        # UnprintablePlugin
+        if flags & FLAG_UNPRINTABLE:
+            unp_unprintable_count += 1
+        unp_character_count += 1
+
+        # CjkInvalidStopPlugin
+        if flags & FLAG_CJK_INVALID_STOP:
+            cis_wrong_stop_count += 1
+        elif flags & FLAG_CJK:
+            cis_cjk_character_count += 1
+
+        # ArabicIsolatedFormPlugin
+        if flags & FLAG_ARABIC:
+            aif_character_count += 1
+            if flags & FLAG_ARABIC_ISOLATED_FORM:
+                aif_isolated_form_count += 1
+
+        if flags & FLAG_ALPHA:
+            # TooManyAccentuatedPlugin
+            tma_character_count += 1
+            if flags & FLAG_ACCENTUATED:
+                tma_accentuated_count += 1
+
+            # SuspiciousDuplicateAccentPlugin
+            if flags & FLAG_LATIN:
+                sda_character_count += 1
+                if (
+                    sda_last_latin_character is not None
+                    and flags & FLAG_ACCENTUATED
+                    and sda_last_flags & FLAG_ACCENTUATED
+                ):
+                    if flags & FLAG_UPPER and sda_last_flags & FLAG_UPPER:
+                        sda_successive_count += 1
+                    if remove_accent(character) == remove_accent(
+                        sda_last_latin_character
+                    ):
+                        sda_successive_count += 1
+                sda_last_latin_character = character
+                sda_last_flags = flags
+
+            # SuperWeirdWordPlugin
+            sww_buffer.append(character)
+            if flags & FLAG_ACCENTUATED:
+                sww_buffer_accent_count += 1
+            if (
+                sww_foreign_long_watch is False
+                and (not flags & FLAG_LATIN or flags & FLAG_ACCENTUATED)
+                and not flags & FLAG_GLYPH
+            ):
+                sww_foreign_long_watch = True
+            if flags & FLAG_GLYPH:
+                sww_buffer_glyph_count += 1
+        elif sww_buffer:
+            # SuperWeirdWordPlugin
+            if flags & (FLAG_SPACE | FLAG_PUNCTUATION | FLAG_SEPARATOR):
+                sww_word_count += 1
+                buffer_length: int = len(sww_buffer)
+
+                sww_character_count += buffer_length
+
+                if buffer_length >= 4:
+                    last_flags: int = flags_of[sww_buffer[-1]]
+                    if sww_buffer_accent_count / buffer_length >= 0.5:
+                        sww_is_current_word_bad = True
+                    elif (
+                        last_flags & FLAG_ACCENTUATED
+                        and last_flags & FLAG_UPPER
+                        and all(_.isupper() for _ in sww_buffer) is False
+                    ):
+                        sww_foreign_long_count += 1
+                        sww_is_current_word_bad = True
+                    elif sww_buffer_glyph_count == 1:
+                        sww_is_current_word_bad = True
+                        sww_foreign_long_count += 1
+                if buffer_length >= 24 and sww_foreign_long_watch:
+                    upper_count: int = sum(1 for _ in sww_buffer if _.isupper())
+
+                    if not (upper_count and upper_count / buffer_length <= 0.3):
+                        sww_foreign_long_count += 1
+                        sww_is_current_word_bad = True
+
+                if sww_is_current_word_bad:
+                    sww_bad_word_count += 1
+                    sww_bad_character_count += buffer_length
+                    sww_is_current_word_bad = False
+
+                sww_foreign_long_watch = False
+                sww_buffer = []
+                sww_buffer_accent_count = 0
+                sww_buffer_glyph_count = 0
+            elif (
+                character not in {"<", ">", "-", "=", "~", "|", "_"}
+                and flags & (FLAG_DIGIT | FLAG_SYMBOL) == FLAG_SYMBOL
+            ):
+                sww_is_current_word_bad = True
+                sww_buffer.append(character)
+
+        # ArchaicUpperLowerPlugin
+        if (
+            flags & (FLAG_ALPHA | FLAG_CASE_VARIABLE)
+            != FLAG_ALPHA | FLAG_CASE_VARIABLE
+            and aul_character_count_since_last_sep > 0
+        ):
+            if (
+                aul_character_count_since_last_sep <= 64
+                and not flags & FLAG_DIGIT
+                and aul_current_ascii_only is False
+            ):
+                aul_successive_upper_lower_count_final += (
+                    aul_successive_upper_lower_count
+                )
+
+            aul_successive_upper_lower_count = 0
+            aul_character_count_since_last_sep = 0
+            aul_last_alpha_flags = None
+            aul_buf = False
+            aul_character_count += 1
+            aul_current_ascii_only = True
+        else:
+            if aul_current_ascii_only is True and not flags & FLAG_ASCII:
+                aul_current_ascii_only = False
+
+            if aul_last_alpha_flags is not None:
+                if (flags & FLAG_UPPER and aul_last_alpha_flags & FLAG_LOWER) or (
+                    flags & FLAG_LOWER and aul_last_alpha_flags & FLAG_UPPER
+                ):
+                    if aul_buf is True:
+                        aul_successive_upper_lower_count += 2
+                        aul_buf = False
+                    else:
+                        aul_buf = True
+                else:
+                    aul_buf = False
+
+            aul_character_count += 1
+            aul_character_count_since_last_sep += 1
+            aul_last_alpha_flags = flags
+
+        if (
+            index > 0 and index % intermediary_mean_mess_ratio_calc == 0
+        ) or index == length - 1:
+            ratios = [
+                _too_many_symbol_or_punctuation_ratio(
+                    tsp_character_count, tsp_punctuation_count, tsp_symbol_count
+                ),
+                _too_many_accentuated_ratio(
+                    tma_character_count, tma_accentuated_count
+                ),
+                (unp_unprintable_count * 8) / unp_character_count,
+                (sda_successive_count * 2) / sda_character_count
+                if sda_character_count
+                else 0.0,
+                (sr_suspicious_successive_range_count * 2) / sr_character_count
+                if sr_character_count > 13
+                else 0.0,
+                0.0
+                if sww_word_count <= 10 and sww_foreign_long_count == 0
+                else sww_bad_character_count / sww_character_count,
+                cis_wrong_stop_count / cis_cjk_character_count
+                if cis_cjk_character_count >= 16
+                else 0.0,
+                aul_successive_upper_lower_count_final / aul_character_count
+                if aul_character_count
+                else 0.0,
+                aif_isolated_form_count / aif_character_count
+                if aif_character_count >= 8
+                else 0.0,
+            ]
+            mean_mess_ratio = sum(ratios)
+
+            if mean_mess_ratio >= maximum_threshold:
+                break
+
+    return mean_mess_ratio, intermediary_mean_mess_ratio_calc, ratios
+
+
+def _too_many_symbol_or_punctuation_ratio(
+    character_count: int, punctuation_count: int, symbol_count: int
+) -> float:
+    if character_count == 0:
+        return 0.0
+
+    ratio_of_punctuation: float = (punctuation_count + symbol_count) / character_count
+
+    return ratio_of_punctuation if ratio_of_punctuation >= 0.3 else 0.0
+
+
+def _too_many_accentuated_ratio(character_count: int, accentuated_count: int) -> float:
+    if character_count < 8:
+        return 0.0
+
+    ratio_of_accentuation: float = accentuated_count / character_count
+    return ratio_of_accentuation if ratio_of_accentuation >= 0.35 else 0.0
+
+
 @lru_cache(maxsize=2048)
 def mess_ratio(
     decoded_sequence: str, maximum_threshold: float = 0.2, debug: bool = False
@@ -582,16 +983,35 @@ def mess_ratio(
     Compute a mess ratio given a decoded bytes sequence. The maximum threshold does stop the computation earlier.
     """
 
+    if tuple(MessDetectorPlugin.__subclasses__()) == BUILTIN_MESS_DETECTOR_PLUGINS:
+        # Only the built-in plugins are in use, so they can be run in a single pass.
+        (
+            mean_mess_ratio,
+            intermediary_mean_mess_ratio_calc,
+            ratios,
+        ) = batched_mess_ratio(decoded_sequence, maximum_threshold)
+
+        if debug:
+            _log_mess_ratio(
+                decoded_sequence,
+                intermediary_mean_mess_ratio_calc,
+                mean_mess_ratio,
+                maximum_threshold,
+                zip(BUILTIN_MESS_DETECTOR_PLUGINS, ratios),
+            )
+
+        return round(mean_mess_ratio, 3)
+
     detectors: list[MessDetectorPlugin] = [
         md_class() for md_class in MessDetectorPlugin.__subclasses__()
     ]
 
     length: int = len(decoded_sequence) + 1
 
-    mean_mess_ratio: float = 0.0
+    mean_mess_ratio = 0.0
 
     if length < 512:
-        intermediary_mean_mess_ratio_calc: int = 32
+        intermediary_mean_mess_ratio_calc = 32
     elif length <= 1024:
         intermediary_mean_mess_ratio_calc = 64
     else:
@@ -611,20 +1031,36 @@ def mess_ratio(
                 break
 
     if debug:
-        logger = getLogger("charset_normalizer")
-
-        logger.log(
-            TRACE,
-            "Mess-detector extended-analysis start. "
-            f"intermediary_mean_mess_ratio_calc={intermediary_mean_mess_ratio_calc} mean_mess_ratio={mean_mess_ratio} "
-            f"maximum_threshold={maximum_threshold}",
+        _log_mess_ratio(
+            decoded_sequence,
+            intermediary_mean_mess_ratio_calc,
+            mean_mess_ratio,
+            maximum_threshold,
+            ((dt.__class__, dt.ratio) for dt in detectors),
         )
 
-        if len(decoded_sequence) > 16:
-            logger.log(TRACE, f"Starting with: {decoded_sequence[:16]}")
-            logger.log(TRACE, f"Ending with: {decoded_sequence[-16::]}")
+    return round(mean_mess_ratio, 3)
+
+
+def _log_mess_ratio(
+    decoded_sequence: str,
+    intermediary_mean_mess_ratio_calc: int,
+    mean_mess_ratio: float,
+    maximum_threshold: float,
+    ratios: Iterable[tuple[type[MessDetectorPlugin], float]],
+) -> None:
+    logger = getLogger("charset_normalizer")
+
+    logger.log(
+        TRACE,
+        "Mess-detector extended-analysis start. "
+        f"intermediary_mean_mess_ratio_calc={intermediary_mean_mess_ratio_calc} mean_mess_ratio={mean_mess_ratio} "
+        f"maximum_threshold={maximum_threshold}",
+    )
 
-        for dt in detectors:
-            logger.log(TRACE, f"{dt.__class__}: {dt.ratio}")
+    if len(decoded_sequence) > 16:
+        logger.log(TRACE, f"Starting with: {decoded_sequence[:16]}")
+        logger.log(TRACE, f"Ending with: {decoded_sequence[-16::]}")
 
-    return round(mean_mess_ratio, 3)
+    for md_class, ratio in ratios:
+        logger.log(TRACE, f"{md_class}: {ratio}")
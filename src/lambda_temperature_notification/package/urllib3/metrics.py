@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+import typing
+import weakref
+
+if typing.TYPE_CHECKING:
+    from .connectionpool import HTTPConnectionPool
+
+__all__ = ["PoolEvent", "PoolMetrics"]
+
+#: Upper bounds, in seconds, of the buckets every histogram counts into.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+_TYPE_LABEL = typing.Tuple[str, str, typing.Optional[int]]
+
+
+class PoolEvent(typing.NamedTuple):
+    """
+    What a connection pool tells the hooks of its :class:`PoolMetrics`.
+
+    ``value`` is 1 for counters and the observed duration in seconds for
+    histograms.
+    """
+
+    name: str
+    scheme: str
+    host: str
+    port: int | None
+    value: float
+
+
+class _Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": list(zip(self.buckets + (float("inf"),), self.counts)),
+        }
+
+
+class _HostMetrics:
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = dict.fromkeys(PoolMetrics.COUNTERS, 0)
+        self.histograms: dict[str, _Histogram] = {}
+
+
+class PoolMetrics:
+    """
+    Counters, histograms and event hooks for connection pools, labelled by
+    the scheme, host and port of each pool.
+
+    Give one to :class:`~urllib3.connectionpool.HTTPConnectionPool` or
+    :class:`~urllib3.PoolManager` with the ``metrics`` argument; pools
+    without one skip all of this.
+
+    Counters:
+
+    * ``requests``: requests sent.
+    * ``connections_new``: connections created for lack of an idle one.
+    * ``connections_reset``: idle connections found dropped, which
+      reconnect on their next request.
+    * ``connections_reused``: idle connections taken up again.
+    * ``connections_discarded``: connections closed because the pool was
+      full when they were returned. Raise ``maxsize`` if this keeps
+      growing.
+    * ``pool_empty``: times the pool had no connection left to hand out,
+      either waited for in blocking mode or made up for with a new one.
+
+    Histograms, in seconds:
+
+    * ``queue_wait``: time spent getting a connection out of the pool.
+    * ``connection_age``: age of a connection when it is reused.
+    * ``time_to_first_byte``: from sending a request, connecting first if
+      needed, until the response headers are in.
+
+    Hooks are called with a :class:`PoolEvent` for each of these, in the
+    thread that made the request.
+
+    Example:
+
+    .. code-block:: python
+
+        import urllib3
+
+        metrics = urllib3.PoolMetrics()
+        http = urllib3.PoolManager(metrics=metrics)
+        http.request("GET", "https://example.com/")
+
+        print(metrics.snapshot()["https://example.com:443"]["reuse_ratio"])
+    """
+
+    COUNTERS = (
+        "requests",
+        "connections_new",
+        "connections_reset",
+        "connections_reused",
+        "connections_discarded",
+        "pool_empty",
+    )
+    HISTOGRAMS = ("queue_wait", "connection_age", "time_to_first_byte")
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._hosts: dict[_TYPE_LABEL, _HostMetrics] = {}
+        self._hooks: list[typing.Callable[[PoolEvent], None]] = []
+        self._opened_at: weakref.WeakKeyDictionary[typing.Any, float] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(hosts={len(self._hosts)}, hooks={len(self._hooks)})"
+        )
+
+    def add_hook(self, hook: typing.Callable[[PoolEvent], None]) -> None:
+        """
+        Call ``hook`` with every :class:`PoolEvent` from now on.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: typing.Callable[[PoolEvent], None]) -> None:
+        self._hooks.remove(hook)
+
+    def increment(self, pool: HTTPConnectionPool, name: str) -> None:
+        """
+        Add one to the counter ``name`` of ``pool``'s host.
+        """
+        label = (pool.scheme, pool.host, pool.port)
+        with self._lock:
+            self._host(label).counters[name] += 1
+        if self._hooks:
+            self._emit(PoolEvent(name, *label, 1))
+
+    def observe(self, pool: HTTPConnectionPool, name: str, value: float) -> None:
+        """
+        Count ``value`` into the histogram ``name`` of ``pool``'s host.
+        """
+        label = (pool.scheme, pool.host, pool.port)
+        with self._lock:
+            histograms = self._host(label).histograms
+            if name not in histograms:
+                histograms[name] = _Histogram(self.buckets)
+            histograms[name].observe(value)
+        if self._hooks:
+            self._emit(PoolEvent(name, *label, value))
+
+    def connection_opened(
+        self, pool: HTTPConnectionPool, conn: typing.Any, reset: bool
+    ) -> None:
+        with self._lock:
+            self._opened_at[conn] = time.monotonic()
+        self.increment(pool, "connections_reset" if reset else "connections_new")
+
+    def connection_reused(self, pool: HTTPConnectionPool, conn: typing.Any) -> None:
+        self.increment(pool, "connections_reused")
+        with self._lock:
+            opened_at = self._opened_at.get(conn)
+        if opened_at is not None:
+            self.observe(pool, "connection_age", time.monotonic() - opened_at)
+
+    def counters(self, pool: HTTPConnectionPool) -> dict[str, int]:
+        """
+        Current counters of ``pool``'s host.
+        """
+        label = (pool.scheme, pool.host, pool.port)
+        with self._lock:
+            return dict(self._host(label).counters)
+
+    def histogram(
+        self, pool: HTTPConnectionPool, name: str
+    ) -> dict[str, typing.Any] | None:
+        """
+        Current histogram ``name`` of ``pool``'s host, as in
+        :meth:`snapshot`, or None if nothing was counted into it yet.
+        """
+        label = (pool.scheme, pool.host, pool.port)
+        with self._lock:
+            histogram = self._host(label).histograms.get(name)
+            return histogram.snapshot() if histogram is not None else None
+
+    def snapshot(self) -> dict[str, dict[str, typing.Any]]:
+        """
+        Everything recorded so far, by ``"scheme://host:port"``.
+
+        Each entry has the ``counters``, the ``histograms`` (``count``,
+        ``sum`` and ``(upper bound, count)`` ``buckets``) and the
+        ``reuse_ratio``: the share of requests that went out on a connection
+        that was already open.
+        """
+        with self._lock:
+            snapshot = {}
+            for (scheme, host, port), metrics in self._hosts.items():
+                counters = dict(metrics.counters)
+                checkouts = (
+                    counters["connections_new"]
+                    + counters["connections_reset"]
+                    + counters["connections_reused"]
+                )
+                snapshot[f"{scheme}://{host}:{port}"] = {
+                    "counters": counters,
+                    "histograms": {
+                        name: histogram.snapshot()
+                        for name, histogram in metrics.histograms.items()
+                    },
+                    "reuse_ratio": (
+                        counters["connections_reused"] / checkouts
+                        if checkouts
+                        else 0.0
+                    ),
+                }
+        return snapshot
+
+    def reset(self) -> None:
+        """
+        Forget everything recorded so far. Hooks are kept.
+        """
+        with self._lock:
+            self._hosts.clear()
+
+    def _host(self, label: _TYPE_LABEL) -> _HostMetrics:
+        metrics = self._hosts.get(label)
+        if metrics is None:
+            metrics = self._hosts[label] = _HostMetrics()
+        return metrics
+
+    def _emit(self, event: PoolEvent) -> None:
+        for hook in list(self._hooks):
+            hook(event)
@@ -17,6 +17,7 @@ from .exceptions import (
     ProxySchemeUnknown,
     URLSchemeUnknown,
 )
+from .metrics import PoolMetrics
 from .response import BaseHTTPResponse
 from .util.connection import _TYPE_SOCKET_OPTIONS
 from .util.proxy import connection_requires_http_tunnel
@@ -29,6 +30,8 @@ if typing.TYPE_CHECKING:
 
     from typing_extensions import Self
 
+    from .util.pool_sizing import PoolSizing
+
 __all__ = ["PoolManager", "ProxyManager", "proxy_from_url"]
 
 
@@ -172,6 +175,15 @@ class PoolManager(RequestMethods):
         Headers to include with all requests, unless other headers are given
         explicitly.
 
+    :param metrics:
+        A :class:`urllib3.metrics.PoolMetrics` that every pool records into.
+
+    :param pool_sizing:
+        A :class:`urllib3.util.PoolSizing` to grow and shrink each host's
+        pool as it gets used, instead of keeping them all at ``maxsize``.
+        Implies ``metrics``, a :class:`urllib3.metrics.PoolMetrics` is made
+        if none is given.
+
     :param \\**connection_pool_kw:
         Additional parameters are used to create fresh
         :class:`urllib3.connectionpool.ConnectionPool` instances.
@@ -200,10 +212,16 @@ class PoolManager(RequestMethods):
         self,
         num_pools: int = 10,
         headers: typing.Mapping[str, str] | None = None,
+        metrics: PoolMetrics | None = None,
+        pool_sizing: PoolSizing | None = None,
         **connection_pool_kw: typing.Any,
     ) -> None:
         super().__init__(headers)
         self.connection_pool_kw = connection_pool_kw
+        if pool_sizing is not None and metrics is None:
+            metrics = PoolMetrics()
+        self.metrics = metrics
+        self.pool_sizing = pool_sizing
 
         self.pools: RecentlyUsedContainer[PoolKey, HTTPConnectionPool]
         self.pools = RecentlyUsedContainer(num_pools)
@@ -262,6 +280,9 @@ class PoolManager(RequestMethods):
             for kw in SSL_KEYWORDS:
                 request_context.pop(kw, None)
 
+        if self.metrics is not None:
+            request_context["metrics"] = self.metrics
+
         return pool_cls(host, port, **request_context)
 
     def clear(self) -> None:
@@ -341,15 +362,20 @@ class PoolManager(RequestMethods):
             # If the scheme, host, or port doesn't match existing open
             # connections, open a new ConnectionPool.
             pool = self.pools.get(pool_key)
-            if pool:
-                return pool
-
-            # Make a fresh ConnectionPool of the desired type
-            scheme = request_context["scheme"]
-            host = request_context["host"]
-            port = request_context["port"]
-            pool = self._new_pool(scheme, host, port, request_context=request_context)
-            self.pools[pool_key] = pool
+            if not pool:
+                # Make a fresh ConnectionPool of the desired type
+                scheme = request_context["scheme"]
+                host = request_context["host"]
+                port = request_context["port"]
+                pool = self._new_pool(
+                    scheme, host, port, request_context=request_context
+                )
+                self.pools[pool_key] = pool
+                if self.pool_sizing is not None:
+                    self.pool_sizing.new_pool(self, pool)
+
+        if self.pool_sizing is not None:
+            self.pool_sizing.adjust(self)
 
         return pool
 